@@ -10,6 +10,8 @@ from argparse import Namespace
 from collections import Counter, deque, defaultdict
 from collections.abc import Collection, MutableSequence
 from enum import IntEnum, IntFlag
+from itertools import repeat
+from types import MemberDescriptorType
 from typing import (AbstractSet, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Literal, Mapping, NamedTuple,
                     Optional, Protocol, Set, Tuple, Union, TYPE_CHECKING, Literal, overload)
 import dataclasses
@@ -221,6 +223,17 @@ class MultiWorld():
             self.random.seed(self.seed)
         self.seed_name = name if name else str(self.seed)
 
+    def reseed(self, seed: Optional[int] = None, name: Optional[str] = None) -> None:
+        """
+        Seeds the random sources of a multiworld that already has its worlds, as set_seed and creating the worlds
+        would have with this seed. Only valid while nothing drew from them yet.
+        """
+        self.seed = get_seed(seed)
+        self.random.seed(self.seed)
+        self.seed_name = name if name else str(self.seed)
+        for player in sorted(self.worlds):
+            self.worlds[player].random.seed(self.random.getrandbits(64))
+
     def set_options(self, args: Namespace) -> None:
         from worlds import AutoWorld
 
@@ -812,15 +825,24 @@ class CollectionState():
             # sweep for indirect connections, mostly Entrance.can_reach(unrelated_Region)
             queue.extend(blocked_connections)
 
-    def copy(self) -> CollectionState:
+    def copy(self, players: Optional[AbstractSet[int]] = None) -> CollectionState:
+        """
+        :param players: Only copy the region reachability of these players, instead of all. The reachability of other
+         players is recalculated if it is needed, and the spoiler paths are not copied.
+        """
         ret = CollectionState(self.multiworld)
         ret.prog_items = {player: counter.copy() for player, counter in self.prog_items.items()}
-        ret.reachable_regions = {player: region_set.copy() for player, region_set in
-                                 self.reachable_regions.items()}
-        ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
-                                   self.blocked_connections.items()}
+        if players is None:
+            ret.reachable_regions = {player: region_set.copy() for player, region_set in
+                                     self.reachable_regions.items()}
+            ret.blocked_connections = {player: entrance_set.copy() for player, entrance_set in
+                                       self.blocked_connections.items()}
+            ret.path = self.path.copy()
+        else:
+            for player in players:
+                ret.reachable_regions[player] = self.reachable_regions[player].copy()
+                ret.blocked_connections[player] = self.blocked_connections[player].copy()
         ret.advancements = self.advancements.copy()
-        ret.path = self.path.copy()
         ret.locations_checked = self.locations_checked.copy()
         ret.allow_partial_entrances = self.allow_partial_entrances
         for function in self.additional_copy_functions:
@@ -1069,9 +1091,9 @@ class CollectionState():
     def has_group(self, item_name_group: str, player: int, count: int = 1) -> bool:
         """Returns True if the state contains at least `count` items present in a specified item group."""
         found: int = 0
-        player_prog_items = self.prog_items[player]
-        for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
-            found += player_prog_items[item_name]
+        get_count = self.prog_items[player].get
+        for item_name in self.multiworld.worlds[player].item_name_group_members[item_name_group]:
+            found += get_count(item_name, 0)
             if found >= count:
                 return True
         return False
@@ -1081,29 +1103,24 @@ class CollectionState():
         Ignores duplicates of the same item.
         """
         found: int = 0
-        player_prog_items = self.prog_items[player]
-        for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]:
-            found += player_prog_items[item_name] > 0
+        get_count = self.prog_items[player].get
+        for item_name in self.multiworld.worlds[player].item_name_group_members[item_name_group]:
+            found += get_count(item_name, 0) > 0
             if found >= count:
                 return True
         return False
 
     def count_group(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state."""
-        player_prog_items = self.prog_items[player]
-        return sum(
-            player_prog_items[item_name]
-            for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
-        )
+        return sum(map(self.prog_items[player].get,
+                       self.multiworld.worlds[player].item_name_group_members[item_name_group], repeat(0)))
 
     def count_group_unique(self, item_name_group: str, player: int) -> int:
         """Returns the cumulative count of items from an item group present in state.
         Ignores duplicates of the same item."""
-        player_prog_items = self.prog_items[player]
-        return sum(
-            player_prog_items[item_name] > 0
-            for item_name in self.multiworld.worlds[player].item_name_groups[item_name_group]
-        )
+        return sum(item_count > 0 for item_count in map(
+            self.prog_items[player].get,
+            self.multiworld.worlds[player].item_name_group_members[item_name_group], repeat(0)))
 
     # Item related
     def collect(self, item: Item, prevent_sweep: bool = False, location: Optional[Location] = None) -> bool:
@@ -1166,23 +1183,49 @@ class CollectionState():
             self.prog_items[player][item] = count
 
 
+class SlotDefaults:
+    """
+    Base of the slotted multiworld objects. Slots can't have class level defaults, so they are assigned in __init__.
+    A class attribute of a subclass, like a method overriding access_rule, still takes the place of the default.
+    Subclasses without __slots__ of their own keep a __dict__ for any other attributes, declaring them keeps the
+    instances compact.
+    """
+    __slots__ = ()
+    _slot_defaults: ClassVar[Tuple[Tuple[str, Any], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._slot_defaults = tuple((name, value) for name, value in cls._slot_defaults
+                                   if isinstance(getattr(cls, name, None), MemberDescriptorType))
+
+    def _set_slot_defaults(self) -> None:
+        for name, value in self._slot_defaults:
+            setattr(self, name, value)
+
+
 class EntranceType(IntEnum):
     ONE_WAY = 1
     TWO_WAY = 2
 
 
-class Entrance:
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
-    hide_path: bool = False
+class Entrance(SlotDefaults):
+    __slots__ = ("access_rule", "hide_path", "player", "name", "parent_region", "connected_region",
+                 "randomization_group", "randomization_type")
+    access_rule: Callable[[CollectionState], bool]
+    hide_path: bool
     player: int
     name: str
     parent_region: Optional[Region]
-    connected_region: Optional[Region] = None
+    connected_region: Optional[Region]
     randomization_group: int
     randomization_type: EntranceType
+    default_access_rule: ClassVar[Callable[[CollectionState], bool]] = staticmethod(lambda state: True)
+    """ the access_rule of entrances that didn't get one assigned """
+    _slot_defaults = (("access_rule", default_access_rule.__func__), ("hide_path", False), ("connected_region", None))
 
     def __init__(self, player: int, name: str = "", parent: Optional[Region] = None,
                  randomization_group: int = 0, randomization_type: EntranceType = EntranceType.ONE_WAY) -> None:
+        self._set_slot_defaults()
         self.name = name
         self.parent_region = parent
         self.player = player
@@ -1233,7 +1276,8 @@ class Entrance:
         return multiworld.get_name_string_for_object(self) if multiworld else f'{self.name} (Player {self.player})'
 
 
-class Region:
+class Region(SlotDefaults):
+    __slots__ = ("name", "_hint_text", "player", "multiworld", "entrances", "_exits", "_locations")
     name: str
     _hint_text: str
     player: int
@@ -1462,21 +1506,31 @@ class LocationProgressType(IntEnum):
     EXCLUDED = 3
 
 
-class Location:
+class Location(SlotDefaults):
     game: str = "Generic"
+    __slots__ = ("player", "name", "address", "parent_region", "locked", "show_in_spoiler", "progress_type",
+                 "always_allow", "access_rule", "item_rule", "item")
     player: int
     name: str
     address: Optional[int]
     parent_region: Optional[Region]
-    locked: bool = False
-    show_in_spoiler: bool = True
-    progress_type: LocationProgressType = LocationProgressType.DEFAULT
-    always_allow: Callable[[CollectionState, Item], bool] = staticmethod(lambda state, item: False)
-    access_rule: Callable[[CollectionState], bool] = staticmethod(lambda state: True)
-    item_rule: Callable[[Item], bool] = staticmethod(lambda item: True)
-    item: Optional[Item] = None
+    locked: bool
+    show_in_spoiler: bool
+    progress_type: LocationProgressType
+    always_allow: Callable[[CollectionState, Item], bool]
+    access_rule: Callable[[CollectionState], bool]
+    item_rule: Callable[[Item], bool]
+    item: Optional[Item]
+    default_always_allow: ClassVar[Callable[[CollectionState, Item], bool]] = staticmethod(lambda state, item: False)
+    default_access_rule: ClassVar[Callable[[CollectionState], bool]] = staticmethod(lambda state: True)
+    default_item_rule: ClassVar[Callable[[Item], bool]] = staticmethod(lambda item: True)
+    """ the rules of locations that didn't get them assigned """
+    _slot_defaults = (("locked", False), ("show_in_spoiler", True), ("progress_type", LocationProgressType.DEFAULT),
+                      ("always_allow", default_always_allow.__func__), ("access_rule", default_access_rule.__func__),
+                      ("item_rule", default_item_rule.__func__), ("item", None))
 
     def __init__(self, player: int, name: str = '', address: Optional[int] = None, parent: Optional[Region] = None):
+        self._set_slot_defaults()
         self.player = player
         self.name = name
         self.address = address
@@ -23,7 +23,8 @@ if __name__ == "__main__":
 
 from MultiServer import CommandProcessor, mark_raw
 from NetUtils import (Endpoint, decode, NetworkItem, encode, JSONtoTextParser, ClientStatus, Permission, NetworkSlot,
-                      RawJSONtoTextParser, add_json_text, add_json_location, add_json_item, JSONTypes, HintStatus, SlotType)
+                      RawJSONtoTextParser, add_json_text, add_json_location, add_json_item, JSONTypes, HintStatus, SlotType,
+                      decode_ranges)
 from Utils import Version, stream_input, async_start
 from worlds import network_data_package, AutoWorldRegister
 import os
@@ -246,7 +247,7 @@ class ClientCommandProcessor(CommandProcessor):
 
 class CommonContext:
     # The following attributes are used to Connect and should be adjusted as needed in subclasses
-    tags: typing.Set[str] = {"AP"}
+    tags: typing.Set[str] = {"AP", "DeltaSync"}
     game: typing.Optional[str] = None
     items_handling: typing.Optional[int] = None
     want_slot_data: bool = True  # should slot_data be retrieved via Connect
@@ -300,9 +301,13 @@ class CommonContext:
 
         def update_game(self, game: str, name_to_id_lookup_table: typing.Dict[str, int]) -> None:
             """Overrides existing lookup tables for a particular game."""
-            id_to_name_lookup_table = Utils.KeyedDefaultDict(self._unknown_item)
-            id_to_name_lookup_table.update({code: name for name, code in name_to_id_lookup_table.items()})
-            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table)
+            self.update_game_names(game, {code: name for name, code in name_to_id_lookup_table.items()})
+
+        def update_game_names(self, game: str, id_to_name_lookup_table: typing.Mapping[int, str]) -> None:
+            """Overrides existing lookup tables for a particular game with an id -> name mapping, which is used as is,
+            so it can be a memory-mapped Utils.DataPackageNames."""
+            self._game_store[game] = collections.ChainMap(self._archipelago_lookup, id_to_name_lookup_table,
+                                                          Utils.KeyedDefaultDict(self._unknown_item))
             if game == "Archipelago":
                 # Keep track of the Archipelago data package separately so if it gets updated in a custom datapackage,
                 # it updates in all chain maps automatically.
@@ -357,6 +362,8 @@ class CommonContext:
     """Name used in Connect packet"""
     seed_name: str | None
     """Seed name that will be validated on opening a socket if present"""
+    server_seed_name: str | None
+    """Seed name of the room the server reported in RoomInfo"""
 
     # locations
     locations_checked: set[int]
@@ -394,6 +401,8 @@ class CommonContext:
     """Current message box through kvui"""
     _messagebox_connection_loss: typing.Optional["kvui.MessageBox"] = None
     """Message box reporting a loss of connection"""
+    _resumable_items: tuple[str | None, str, int | None, list[NetworkItem]] | None = None
+    """Seed name, slot name, items_handling and items_received of the last connection, to resume from with DeltaSync"""
 
     def __init__(self, server_address: typing.Optional[str] = None, password: typing.Optional[str] = None) -> None:
         # server state
@@ -415,6 +424,7 @@ class CommonContext:
         self.slot = None
         self.auth = None
         self.seed_name = None
+        self.server_seed_name = None
 
         self.locations_checked = set()  # local state
         self.locations_scouted = set()
@@ -470,6 +480,8 @@ class CommonContext:
         self.reset_server_state()
 
     def reset_server_state(self):
+        if self.items_received and self.auth:
+            self._resumable_items = (self.server_seed_name, self.auth, self.items_handling, self.items_received)
         self.auth = None
         self.slot = None
         self.team = None
@@ -538,6 +550,13 @@ class CommonContext:
             'tags': self.tags, 'items_handling': self.items_handling,
             'uuid': Utils.get_unique_identifier(), 'game': self.game, "slot_data": self.want_slot_data,
         }
+        if "DeltaSync" in self.tags and self._resumable_items:
+            seed_name, name, items_handling, items = self._resumable_items
+            if (seed_name, name, items_handling) == (self.server_seed_name, self.auth, self.items_handling):
+                # the server only sends what was missed, if the last item matches
+                payload["received_items_index"] = len(items)
+                payload["last_received_item"] = list(items[-1])
+                self.items_received = items
         if kwargs:
             payload.update(kwargs)
         await self.send_msgs([payload])
@@ -677,6 +696,12 @@ class CommonContext:
                 if remote_checksum == local_checksum:
                     self.update_game(network_data_package["games"][game], game)
                 else:
+                    cached_names = Utils.load_data_package_names(game, remote_checksum)
+                    if cached_names:
+                        self.item_names.update_game_names(game, cached_names.item_names)
+                        self.location_names.update_game_names(game, cached_names.location_names)
+                        self.checksums[game] = remote_checksum
+                        continue
                     cached_game = Utils.load_data_package_for_checksum(game, remote_checksum)
                     cache_checksum: typing.Optional[str] = cached_game.get("checksum")
                     # download remote version if cache is not new enough
@@ -684,6 +709,7 @@ class CommonContext:
                         needed_updates.add(game)
                     else:
                         self.update_game(cached_game, game)
+                        Utils.store_data_package_names(game, cached_game)  # cached before names were stored
         if needed_updates:
             await self.send_msgs([{"cmd": "GetDataPackage", "games": [game_name]} for game_name in needed_updates])
 
@@ -944,6 +970,7 @@ async def process_server_cmd(ctx: CommonContext, args: dict):
             logger.info('--------------------------------')
             version = args["version"]
             ctx.server_version = Version(*version)
+            ctx.server_seed_name = args["seed_name"]
 
             if "generator_version" in args:
                 ctx.generator_version = Version(*args["generator_version"])
@@ -1011,6 +1038,9 @@ async def process_server_cmd(ctx: CommonContext, args: dict):
             raise Exception('Connection refused by the multiworld host, no reason provided')
 
     elif cmd == 'Connected':
+        if "missing_location_ranges" in args:  # DeltaSync, unpacked so on_package sees the usual arguments
+            args["missing_locations"] = decode_ranges(args.pop("missing_location_ranges"))
+            args["checked_locations"] = decode_ranges(args.pop("checked_location_ranges"))
         ctx.username = ctx.auth
         ctx.team = args["team"]
         ctx.slot = args["slot"]
@@ -1056,6 +1086,7 @@ async def process_server_cmd(ctx: CommonContext, args: dict):
 
     elif cmd == 'ReceivedItems':
         start_index = args["index"]
+        args["items"] = [NetworkItem(*item) for item in args["items"]]  # DeltaSync packs items into plain arrays
 
         if start_index == 0:
             ctx.items_received = []
@@ -1066,8 +1097,7 @@ async def process_server_cmd(ctx: CommonContext, args: dict):
                                  "locations": list(ctx.locations_checked)})
             await ctx.send_msgs(sync_msg)
         if start_index == len(ctx.items_received):
-            for item in args['items']:
-                ctx.items_received.append(NetworkItem(*item))
+            ctx.items_received.extend(args['items'])
         ctx.watcher_event.set()
 
     elif cmd == 'LocationInfo':
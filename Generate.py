@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import argparse
 import copy
+import hashlib
+import json
 import logging
 import os
+import pickle
 import random
 import string
 import sys
+import time
 import urllib.parse
 import urllib.request
 from collections import Counter
-from itertools import chain
-from typing import Any
+from itertools import chain, repeat
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 import ModuleUpdate
 
@@ -20,7 +24,7 @@ ModuleUpdate.update()
 import Utils
 import Options
 from BaseClasses import seeddigits, get_seed, PlandoOptions
-from Utils import parse_yamls, version_tuple, __version__, tuplize_version
+from Utils import parse_yamls, version_tuple, __version__, tuplize_version, restricted_dumps, restricted_loads
 
 
 def mystery_argparse():
@@ -36,6 +40,13 @@ def mystery_argparse():
     parser.add_argument('--player_files_path', default=defaults.player_files_path,
                         help="Input directory for player files.")
     parser.add_argument('--seed', help='Define seed number to generate.', type=int)
+    parser.add_argument('--seeds', type=parse_seeds,
+                        help='Generate each of these seeds, like "1-10,15", forked from one process. See sweep.')
+    parser.add_argument('--sweep_processes', default=1, type=lambda value: max(int(value), 1),
+                        help='Number of seeds to generate at the same time with --seeds.')
+    parser.add_argument('--seed_output_dir',
+                        help='With --seeds, write the console output of each seed to <seed>.txt in this folder, '
+                             'and the exit code and time of every seed to sweep_results.json.')
     parser.add_argument('--multi', default=defaults.players, type=lambda value: max(int(value), 1))
     parser.add_argument('--spoiler', type=int, default=defaults.spoiler)
     parser.add_argument('--outputpath', default=settings.general_options.output_path,
@@ -49,6 +60,9 @@ def mystery_argparse():
                         help="Output rolled player options to csv (made for async multiworld).")
     parser.add_argument("--plando", default=defaults.plando_options,
                         help="List of options that can be set manually. Can be combined, for example \"bosses, items\"")
+    parser.add_argument("--roll_processes", default=defaults.roll_processes, type=int,
+                        help="Number of processes to read player files and roll options in. "
+                             "0 picks automatically, 1 disables the process pool.")
     parser.add_argument("--skip_prog_balancing", action="store_true",
                         help="Skip progression balancing step during generation.")
     parser.add_argument("--skip_output", action="store_true",
@@ -77,9 +91,12 @@ def get_seed_name(random_source) -> str:
     return f"{random_source.randint(0, pow(10, seeddigits) - 1)}".zfill(seeddigits)
 
 
-def main(args=None) -> tuple[argparse.Namespace, int]:
+def main(args=None, warm: bool = False) -> tuple[argparse.Namespace, int]:
+    """
+    :param warm: logging is already set up and worlds may be imported, as in sweep
+    """
     # __name__ == "__main__" check so unittests that already imported worlds don't trip this.
-    if __name__ == "__main__" and "worlds" in sys.modules:
+    if __name__ == "__main__" and "worlds" in sys.modules and not warm:
         raise Exception("Worlds system should not be loaded before logging init.")
 
     if not args:
@@ -87,7 +104,8 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
 
     seed = get_seed(args.seed)
 
-    Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level, add_timestamp=args.log_time)
+    if not warm:
+        Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level, add_timestamp=args.log_time)
     random.seed(seed)
     seed_name = get_seed_name(random)
 
@@ -122,22 +140,17 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
 
     player_id = 1
     player_files = {}
+    player_paths: dict[str, str] = {}
     for file in os.scandir(args.player_files_path):
         fname = file.name
         if file.is_file() and not fname.startswith(".") and not fname.lower().endswith(".ini") and \
                 os.path.join(args.player_files_path, fname) not in {args.meta_file_path, args.weights_file_path}:
-            path = os.path.join(args.player_files_path, fname)
-            try:
-                weights_for_file = []
-                for doc_idx, yaml in enumerate(read_weights_yamls(path)):
-                    if yaml is None:
-                        logging.warning(f"Ignoring empty yaml document #{doc_idx + 1} in {fname}")
-                    else:
-                        weights_for_file.append(yaml)
-                weights_cache[fname] = tuple(weights_for_file)
-                        
-            except Exception as e:
-                raise ValueError(f"File {fname} is invalid. Please fix your yaml.") from e
+            player_paths[fname] = os.path.join(args.player_files_path, fname)
+
+    start = time.perf_counter()
+    weights_cache.update(read_player_files(player_paths, args.roll_processes))
+    logging.info(f"Read {len(player_paths)} player files in {time.perf_counter() - start:.2f} seconds.")
+    clean_yaml_cache()
 
     # sort dict for consistent results across platforms:
     weights_cache = {key: value for key, value in sorted(weights_cache.items(), key=lambda k: k[0].casefold())}
@@ -180,10 +193,6 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     erargs.name = {}
     erargs.csv_output = args.csv_output
 
-    settings_cache: dict[str, tuple[argparse.Namespace, ...]] = \
-        {fname: (tuple(roll_settings(yaml, args.plando) for yaml in yamls) if args.sameoptions else None)
-         for fname, yamls in weights_cache.items()}
-
     if meta_weights:
         for category_name, category_dict in meta_weights.items():
             for key in category_dict:
@@ -201,44 +210,68 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
                             else:
                                 yaml[category_name][key] = option
 
-    player_path_cache = {}
-    for player in range(1, args.multi + 1):
-        player_path_cache[player] = player_files.get(player, args.weights_file_path)
+    roll_paths: list[str] = []
+    slot_rolls: list[int] = []  # index into roll_paths for each group of players, in player order
+    player = 1
+    while player <= args.multi:
+        path = player_files.get(player, args.weights_file_path)
+        if not path or not weights_cache.get(path):
+            raise RuntimeError(f'No weights specified for player {player}')
+        if args.sameoptions and path in roll_paths:
+            slot_rolls.append(roll_paths.index(path))
+        else:
+            slot_rolls.append(len(roll_paths))
+            roll_paths.append(path)
+        player += len(weights_cache[path])
+
+    start = time.perf_counter()
+    roll_processes = get_roll_process_count(args.roll_processes, len(roll_paths))
+    if roll_processes > 1:
+        # every roll gets its own random state, so the results don't depend on how rolls are spread over processes
+        rolled_settings = roll_player_settings(roll_paths, [weights_cache[path] for path in roll_paths],
+                                               [random.getrandbits(64) for _ in roll_paths], args.plando,
+                                               roll_processes)
+    elif args.sameoptions:
+        # roll every file in order from the seed's random state, so existing seeds keep their options
+        rolled_files = dict(zip(weights_cache, roll_player_settings(list(weights_cache), list(weights_cache.values()),
+                                                                    None, args.plando)))
+        rolled_settings = [rolled_files[path] for path in roll_paths]
+    else:
+        rolled_settings = roll_player_settings(roll_paths, [weights_cache[path] for path in roll_paths], None,
+                                               args.plando)
+    logging.info(f"Rolled options for {args.multi} player{'s' if args.multi > 1 else ''} "
+                 f"in {time.perf_counter() - start:.2f} seconds.")
+
     name_counter = Counter()
     erargs.player_options = {}
 
     player = 1
-    while player <= args.multi:
-        path = player_path_cache[player]
-        if path:
-            try:
-                settings: tuple[argparse.Namespace, ...] = settings_cache[path] if settings_cache[path] else \
-                    tuple(roll_settings(yaml, args.plando) for yaml in weights_cache[path])
-                for settingsObject in settings:
-                    for k, v in vars(settingsObject).items():
-                        if v is not None:
-                            try:
-                                getattr(erargs, k)[player] = v
-                            except AttributeError:
-                                setattr(erargs, k, {player: v})
-                            except Exception as e:
-                                raise Exception(f"Error setting {k} to {v} for player {player}") from e
-
-                    # name was not specified
-                    if player not in erargs.name:
-                        if path == args.weights_file_path:
-                            # weights file, so we need to make the name unique
-                            erargs.name[player] = f"Player{player}"
-                        else:
-                            # use the filename
-                            erargs.name[player] = os.path.splitext(os.path.split(path)[-1])[0]
-                    erargs.name[player] = handle_name(erargs.name[player], player, name_counter)
-
-                    player += 1
-            except Exception as e:
-                raise ValueError(f"File {path} is invalid. Please fix your yaml.") from e
-        else:
-            raise RuntimeError(f'No weights specified for player {player}')
+    for roll in slot_rolls:
+        path = roll_paths[roll]
+        try:
+            for settingsObject in rolled_settings[roll]:
+                for k, v in vars(settingsObject).items():
+                    if v is not None:
+                        try:
+                            getattr(erargs, k)[player] = v
+                        except AttributeError:
+                            setattr(erargs, k, {player: v})
+                        except Exception as e:
+                            raise Exception(f"Error setting {k} to {v} for player {player}") from e
+
+                # name was not specified
+                if player not in erargs.name:
+                    if path == args.weights_file_path:
+                        # weights file, so we need to make the name unique
+                        erargs.name[player] = f"Player{player}"
+                    else:
+                        # use the filename
+                        erargs.name[player] = os.path.splitext(os.path.split(path)[-1])[0]
+                erargs.name[player] = handle_name(erargs.name[player], player, name_counter)
+
+                player += 1
+        except Exception as e:
+            raise ValueError(f"File {path} is invalid. Please fix your yaml.") from e
 
     if len(set(name.lower() for name in erargs.name.values())) != len(erargs.name):
         raise Exception(f"Names have to be unique. Names: {Counter(name.lower() for name in erargs.name.values())}")
@@ -246,7 +279,368 @@ def main(args=None) -> tuple[argparse.Namespace, int]:
     return erargs, seed
 
 
-def read_weights_yamls(path) -> tuple[Any, ...]:
+def parse_seeds(text: str) -> list[int]:
+    """Parses a list of seeds and seed ranges, like "1-10,15"."""
+    seeds: list[int] = []
+    for part in text.split(","):
+        start, _, end = part.strip().partition("-")
+        seeds.extend(range(int(start), int(end or start) + 1))
+    return seeds
+
+
+class _SeedProcesses:
+    """Forks one process per seed, keeping at most `processes` of them running."""
+
+    def __init__(self, processes: int) -> None:
+        self.processes = processes
+        self.running: dict[int, tuple[int, float]] = {}
+        """ pid -> seed and start time """
+        self.results: dict[int, tuple[int, float]] = {}
+        """ seed -> exit code and seconds """
+
+    def fork(self, seed: int) -> bool:
+        """Returns True in the forked process."""
+        while len(self.running) >= self.processes:
+            self.wait()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if not pid:
+            return True
+        self.running[pid] = seed, time.perf_counter()
+        return False
+
+    def wait(self) -> None:
+        pid, status = os.wait()
+        seed, start = self.running.pop(pid)
+        self.results[seed] = os.waitstatus_to_exitcode(status), round(time.perf_counter() - start, 2)
+
+    def wait_all(self) -> None:
+        while self.running:
+            self.wait()
+
+
+def _options_key(erargs: argparse.Namespace) -> dict[str, Any]:
+    """The rolled options of erargs without the seed, seeds with equal keys can share a multiworld skeleton."""
+    return {key: {player: getattr(value, "value", value) for player, value in per_player.items()}
+            if isinstance(per_player, dict) else per_player
+            for key, per_player in vars(erargs).items() if key not in {"seed", "outputname"}}
+
+
+def _random_states(multiworld: Any) -> list[Any]:
+    return [multiworld.random.getstate(), random.getstate(),
+            *(multiworld.worlds[player].random.getstate() for player in sorted(multiworld.worlds))]
+
+
+def _seeded_random_states(seed: int, players: int, random_state: Any) -> list[Any]:
+    """The random states _random_states returns for a multiworld seeded with seed, that didn't use them yet."""
+    multiworld_random = random.Random(seed)
+    world_states = [random.Random(multiworld_random.getrandbits(64)).getstate() for _ in range(players)]
+    return [multiworld_random.getstate(), random_state, *world_states]
+
+
+def _start_seed(seed: int, random_state: Any, args: argparse.Namespace) -> None:
+    """Sets up a process forked for seed to generate it."""
+    if args.seed_output_dir:
+        output = os.open(os.path.join(args.seed_output_dir, f"{seed}.txt"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.dup2(output, 1)
+        os.dup2(output, 2)
+        os.close(output)
+    Utils.init_logging(f"Generate_{seed}", loglevel=args.log_level, add_timestamp=args.log_time)
+    random.setstate(random_state)
+
+
+def _exit(code: int) -> None:
+    """Ends a forked process, without running the cleanup of the process it was forked from."""
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def _exit_seed(generate: Callable[[], Any]) -> None:
+    """Runs the rest of the generation of a forked seed and ends its process."""
+    try:
+        generate()
+    except BaseException as e:
+        logging.exception(e)
+        _exit(1)
+    _exit(0)
+
+
+def _run_skeleton(rolls: list[tuple[int, argparse.Namespace, Any]], step: str, args: argparse.Namespace,
+                  results: int) -> None:
+    """
+    Generates the first seed of rolls up to step, then forks the generation of every seed of rolls from there.
+    Writes the results of the seeds as json to the file descriptor results, nothing if it couldn't fork.
+    """
+    from Main import main as ERmain
+
+    seed, erargs, random_state = rolls[0]
+    seeds = _SeedProcesses(args.sweep_processes)
+    forked = False
+
+    def fork_seeds(multiworld: Any, step_name: str) -> None:
+        nonlocal forked
+        if step_name != step:
+            return
+        if _random_states(multiworld) != _seeded_random_states(seed, len(multiworld.worlds), random_state):
+            raise RuntimeError(f"A random source was used before {step} finished, which the worlds declared seed "
+                               f"independent. Generating the seeds from the start instead.")
+        for new_seed, new_erargs, new_random_state in rolls:
+            if seeds.fork(new_seed):
+                forked = True
+                _start_seed(new_seed, new_random_state, args)
+                vars(erargs).update(vars(new_erargs))  # Main keeps using erargs
+                multiworld.reseed(new_seed, new_erargs.outputname)
+                logging.info(f"Generating seed {new_seed} forked after {step} of seed {seed}.")
+                return
+        seeds.wait_all()
+        with os.fdopen(results, "w") as file:
+            json.dump(seeds.results, file)
+        _exit(0)
+
+    random.setstate(random_state)
+    try:
+        ERmain(erargs, seed, step_callback=fork_seeds)
+    except BaseException as e:
+        if forked:
+            logging.exception(e)
+        else:
+            logging.warning(f"Could not build a multiworld skeleton from seed {seed}: {e}")
+        _exit(1)
+    _exit(0)
+
+
+def sweep(args: argparse.Namespace, seeds: Sequence[int]) -> dict[int, tuple[int, float]]:
+    """
+    Generates each of seeds with the same arguments, importing the worlds only once, then forking a process per seed.
+    Seeds that rolled equal options share a multiworld skeleton: if all of their worlds declare some of their first
+    steps in World.seed_independent_steps, the first seed is generated up to those steps once and every seed of them
+    is forked from there. The result is the same as generating each seed on its own.
+    Without os.fork the seeds are generated one after another in this process.
+
+    :return: the exit code and time in seconds of each seed
+    """
+    from worlds.AutoWorld import AutoWorldRegister, forkable_steps
+
+    Utils.init_logging("Generate_sweep", loglevel=args.log_level, add_timestamp=args.log_time)
+    if args.seed_output_dir:
+        os.makedirs(args.seed_output_dir, exist_ok=True)
+    rolls: list[tuple[int, argparse.Namespace, Any]] = []
+    for seed in seeds:
+        args.seed = seed
+        erargs, seed = main(args, warm=True)
+        rolls.append((seed, erargs, random.getstate()))
+
+    from Main import main as ERmain
+
+    if not hasattr(os, "fork"):
+        results: dict[int, tuple[int, float]] = {}
+        for seed, erargs, random_state in rolls:
+            start = time.perf_counter()
+            random.setstate(random_state)
+            try:
+                ERmain(erargs, seed)
+            except Exception as e:
+                logging.exception(e)
+                results[seed] = 1, round(time.perf_counter() - start, 2)
+            else:
+                results[seed] = 0, round(time.perf_counter() - start, 2)
+        return results
+
+    groups: list[tuple[dict[str, Any], list[tuple[int, argparse.Namespace, Any]]]] = []
+    for roll in rolls:
+        key = _options_key(roll[1])
+        for group_key, group in groups:
+            if group_key == key:
+                group.append(roll)
+                break
+        else:
+            groups.append((key, [roll]))
+
+    seed_processes = _SeedProcesses(args.sweep_processes)
+    for _, group in groups:
+        world_types = {AutoWorldRegister.world_types[game] for game in group[0][1].game.values()}
+        steps = 0
+        while steps < len(forkable_steps) and \
+                all(forkable_steps[steps] in world_type.seed_independent_steps for world_type in world_types):
+            steps += 1
+        if steps and len(group) > 1 and not args.race:
+            read, write = os.pipe()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if not pid:
+                os.close(read)
+                _run_skeleton(group, forkable_steps[steps - 1], args, write)
+            os.close(write)
+            with os.fdopen(read) as file:
+                text = file.read()
+            os.waitpid(pid, 0)
+            if text:
+                seed_processes.results.update({int(seed): tuple(result) for seed, result in json.loads(text).items()})
+                continue
+        for seed, erargs, random_state in group:
+            if seed_processes.fork(seed):
+                _start_seed(seed, random_state, args)
+                _exit_seed(lambda: ERmain(erargs, seed))
+        seed_processes.wait_all()
+
+    results = {seed: seed_processes.results[seed] for seed, _, _ in rolls}
+    for seed, (code, seconds) in results.items():
+        logging.info(f"Seed {seed}: {'done' if code == 0 else f'failed with exit code {code}'} in {seconds} seconds.")
+    return results
+
+
+rolls_per_process = 16
+"""Minimum number of player files or rolls per process when the number of roll processes is picked automatically."""
+
+
+def get_roll_process_count(processes: int, jobs: int) -> int:
+    """Returns how many processes to use for jobs player files or rolls, 1 meaning no process pool."""
+    if processes > 0:
+        return max(1, min(processes, jobs))
+    return max(1, min(os.cpu_count() or 1, jobs // rolls_per_process))
+
+
+def _call_with_log_capture(function: Callable[..., Any], *args: Any) -> tuple[Any, list[logging.LogRecord]]:
+    """Calls function in a roll process and returns its result with the log records it emitted,
+    so that the generator process can log them in order."""
+    records: list[logging.LogRecord] = []
+
+    class CaptureHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            record.msg = record.getMessage()
+            record.args = None
+            record.exc_info = record.exc_text = None  # exceptions are raised to the generator process instead
+            records.append(record)
+
+    root_logger = logging.getLogger()
+    handler = CaptureHandler()
+    handlers, root_logger.handlers = root_logger.handlers, [handler]
+    level = root_logger.level
+    root_logger.setLevel(logging.DEBUG)
+    try:
+        return function(*args), records
+    finally:
+        root_logger.handlers = handlers
+        root_logger.setLevel(level)
+
+
+def _map(function: Callable[..., Any], processes: int, *iterables: Iterable[Any]) -> Iterator[Any]:
+    """map, in a process pool if processes is more than 1. Log records of the calls are emitted with each result."""
+    if processes <= 1:
+        yield from map(function, *iterables)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(processes) as pool:
+        for result, records in pool.map(_call_with_log_capture, repeat(function), *iterables):
+            for record in records:
+                logger = logging.getLogger(record.name)
+                if logger.isEnabledFor(record.levelno):
+                    logger.handle(record)
+            yield result
+
+
+def read_player_files(paths: dict[str, str], processes: int = 1) -> dict[str, tuple[Any, ...]]:
+    """Reads the yaml documents of player files, by file name, in processes processes. 0 picks automatically."""
+    weights: dict[str, tuple[Any, ...]] = {}
+    results = _map(_read_yaml_documents, get_roll_process_count(processes, len(paths)), paths.values())
+    for fname in paths:
+        try:
+            documents = next(results)
+        except Exception as e:
+            raise ValueError(f"File {fname} is invalid. Please fix your yaml.") from e
+        weights_for_file = []
+        for doc_idx, yaml in enumerate(documents):
+            if yaml is None:
+                logging.warning(f"Ignoring empty yaml document #{doc_idx + 1} in {fname}")
+            else:
+                weights_for_file.append(yaml)
+        weights[fname] = tuple(weights_for_file)
+    return weights
+
+
+def _read_yaml_documents(path: str) -> tuple[Any, ...]:
+    return read_weights_yamls(path, cache=True)
+
+
+def roll_player_settings(paths: Sequence[str], weights: Sequence[tuple[Any, ...]], seeds: Sequence[int] | None,
+                         plando_options: PlandoOptions, processes: int = 1) -> list[tuple[argparse.Namespace, ...]]:
+    """
+    Rolls the options of each weights tuple, using a random state seeded with the matching seed,
+    so the results are the same with any number of processes. 0 processes picks automatically.
+    Without seeds, the weights are rolled one after another in this process, from the global random state.
+    paths are only used for error messages.
+    """
+    if seeds is None:
+        rolled: list[tuple[argparse.Namespace, ...]] = []
+        for path, yamls in zip(paths, weights):
+            try:
+                rolled.append(tuple(roll_settings(yaml, plando_options) for yaml in yamls))
+            except Exception as e:
+                raise ValueError(f"File {path} is invalid. Please fix your yaml.") from e
+        return rolled
+
+    processes = get_roll_process_count(processes, len(weights))
+    if processes > 1:
+        # options of rolled results are unpickled here, which needs their worlds loaded
+        from worlds import AutoWorldRegister
+        for yamls in weights:
+            for yaml in yamls:
+                games = yaml.get("game")
+                for game in games if isinstance(games, dict) else (games,):
+                    if isinstance(game, str):
+                        AutoWorldRegister.world_types.get(game)  # loads the world, if it exists
+
+    random_state = random.getstate()
+    try:
+        rolled: list[tuple[argparse.Namespace, ...]] = []
+        results = _map(_roll_seeded_settings, processes, weights, seeds, repeat(plando_options))
+        for path in paths:
+            try:
+                rolled.append(next(results))
+            except Exception as e:
+                raise ValueError(f"File {path} is invalid. Please fix your yaml.") from e
+        return rolled
+    finally:
+        random.setstate(random_state)
+
+
+def _roll_seeded_settings(weights: tuple[Any, ...], seed: int,
+                          plando_options: PlandoOptions) -> tuple[argparse.Namespace, ...]:
+    random.seed(seed)
+    return tuple(roll_settings(yaml, plando_options) for yaml in weights)
+
+
+yaml_cache_days = 7
+"""Parsed yaml files that were not used for this many days are removed from the cache."""
+
+
+def _get_yaml_cache_path(text: str) -> str:
+    digest = hashlib.sha256(f"{__version__}\n{text}".encode("utf-8")).hexdigest()
+    return Utils.cache_path("yaml", f"{digest}.pickle")
+
+
+def clean_yaml_cache() -> None:
+    """Removes parsed yaml files that were not used recently from the cache."""
+    folder = Utils.cache_path("yaml")
+    if not os.path.isdir(folder):
+        return
+    oldest = time.time() - yaml_cache_days * 24 * 60 * 60
+    for entry in os.scandir(folder):
+        try:
+            if entry.stat().st_mtime < oldest:
+                os.unlink(entry.path)
+        except OSError:
+            pass  # in use or already removed by another generator
+
+
+def read_weights_yamls(path, cache: bool = False) -> tuple[Any, ...]:
+    """Reads all yaml documents from a file or url.
+    With cache, parsed documents are stored in and loaded from the cache directory by content hash."""
     try:
         if urllib.parse.urlparse(path).scheme in ('https', 'file'):
             yaml = str(urllib.request.urlopen(path).read(), "utf-8-sig")
@@ -256,6 +650,37 @@ def read_weights_yamls(path) -> tuple[Any, ...]:
     except Exception as e:
         raise Exception(f"Failed to read weights ({path})") from e
 
+    if cache:
+        cache_file = _get_yaml_cache_path(yaml)
+        try:
+            with open(cache_file, "rb") as f:
+                documents = restricted_loads(f.read())
+            os.utime(cache_file)  # keep it in the cache for another yaml_cache_days
+            return documents
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.debug(f"Could not load cached yaml for {path}: {e}")
+
+    documents = _parse_weights_yamls(yaml)
+    if cache:
+        try:
+            data = restricted_dumps(documents)
+        except pickle.PicklingError:
+            pass  # yaml contains types that can't be loaded safely, such as timestamps
+        else:
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                temp_file = f"{cache_file}.{os.getpid()}.tmp"
+                with open(temp_file, "wb") as f:
+                    f.write(data)
+                os.replace(temp_file, cache_file)
+            except OSError as e:
+                logging.debug(f"Could not cache yaml for {path}: {e}")
+    return documents
+
+
+def _parse_weights_yamls(yaml: str) -> tuple[Any, ...]:
     from yaml.error import MarkedYAMLError
     try:
         return tuple(parse_yamls(yaml))
@@ -583,7 +1008,16 @@ def roll_alttp_settings(ret: argparse.Namespace, weights):
 if __name__ == '__main__':
     import atexit
     confirmation = atexit.register(input, "Press enter to close.")
-    erargs, seed = main()
+    args = mystery_argparse()
+    if args.seeds:
+        sweep_results = sweep(args, args.seeds)
+        if args.seed_output_dir:
+            with open(os.path.join(args.seed_output_dir, "sweep_results.json"), "w") as results_file:
+                json.dump({seed: {"return_code": code, "processing_time_seconds": seconds}
+                           for seed, (code, seconds) in sweep_results.items()}, results_file)
+        atexit.unregister(confirmation)
+        sys.exit(any(code for code, _ in sweep_results.values()))
+    erargs, seed = main(args)
     from Main import main as ERmain
     multiworld = ERmain(erargs, seed)
     if __debug__:
@@ -5,7 +5,7 @@ import logging
 import os
 import tempfile
 import time
-from typing import Any
+from typing import Any, Callable
 import zipfile
 import zlib
 
@@ -24,7 +24,12 @@ from exporter import export_game_rules
 __all__ = ["main"]
 
 
-def main(args, seed=None, baked_server_options: dict[str, object] | None = None):
+def main(args, seed=None, baked_server_options: dict[str, object] | None = None,
+         step_callback: Callable[[MultiWorld, str], None] | None = None):
+    """
+    :param step_callback: called with the multiworld and the step name after each step in AutoWorld.forkable_steps,
+        Generate.sweep uses this to fork the generation of other seeds from there
+    """
     if not baked_server_options:
         baked_server_options = get_settings().server_options.as_dict()
     assert isinstance(baked_server_options, dict)
@@ -55,13 +60,16 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
     multiworld.state = CollectionState(multiworld)
     logger.info('Archipelago Version %s  -  Seed: %s\n', __version__, multiworld.seed)
 
-    logger.info(f"Found {len(AutoWorld.AutoWorldRegister.world_types)} World Types:")
-    longest_name = max(len(text) for text in AutoWorld.AutoWorldRegister.world_types)
+    # only the worlds in this multiworld, listing all would import all of them
+    world_types = {game: AutoWorld.AutoWorldRegister.world_types[game]
+                   for game in sorted(set(multiworld.game.values()))}
+    logger.info(f"Generating with {len(world_types)} World Types:")
+    longest_name = max(len(text) for text in world_types)
 
-    item_count = len(str(max(len(cls.item_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
-    location_count = len(str(max(len(cls.location_names) for cls in AutoWorld.AutoWorldRegister.world_types.values())))
+    item_count = len(str(max(len(cls.item_names) for cls in world_types.values())))
+    location_count = len(str(max(len(cls.location_names) for cls in world_types.values())))
 
-    for name, cls in AutoWorld.AutoWorldRegister.world_types.items():
+    for name, cls in world_types.items():
         if not cls.hidden and len(cls.item_names) > 0:
             logger.info(f" {name:{longest_name}}: Items: {len(cls.item_names):{item_count}} | "
                         f"Locations: {len(cls.location_names):{location_count}}")
@@ -73,6 +81,8 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
         AutoWorld.call_stage(multiworld, "assert_generate")
 
     AutoWorld.call_all(multiworld, "generate_early")
+    if step_callback:
+        step_callback(multiworld, "generate_early")
 
     logger.info('')
 
@@ -109,12 +119,18 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
 
     logger.info('Creating MultiWorld.')
     AutoWorld.call_all(multiworld, "create_regions")
+    if step_callback:
+        step_callback(multiworld, "create_regions")
 
     logger.info('Creating Items.')
     AutoWorld.call_all(multiworld, "create_items")
+    if step_callback:
+        step_callback(multiworld, "create_items")
 
     logger.info('Calculating Access Rules.')
     AutoWorld.call_all(multiworld, "set_rules")
+    if step_callback:
+        step_callback(multiworld, "set_rules")
 
     for player in multiworld.player_ids:
         exclusion_rules(multiworld, player, multiworld.worlds[player].options.exclude_locations.value)
@@ -399,6 +415,7 @@ def main(args, seed=None, baked_server_options: dict[str, object] | None = None)
         # New: export the rules data to a json file
         settings = get_settings()
         if settings.general_options.save_rules_json:
+            logger.info("Exporting game rules.")
             export_game_rules(multiworld, temp_dir, outfilebase, settings.general_options.update_frontend_presets, settings.general_options.skip_preset_copy_if_rules_identical)
 
         zipfilename = output_path(f"AP_{multiworld.seed_name}.zip")
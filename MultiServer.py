@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import bisect
 import collections
 import contextlib
 import copy
@@ -43,7 +44,7 @@ import NetUtils
 import Utils
 from Utils import version_tuple, restricted_loads, Version, async_start, get_intended_text
 from NetUtils import Endpoint, ClientStatus, NetworkItem, decode, encode, NetworkPlayer, Permission, NetworkSlot, \
-    SlotType, LocationStore, MultiData, Hint, HintStatus
+    SlotType, LocationStore, MultiData, Hint, HintStatus, encode_ranges
 from BaseClasses import ItemClassification
 
 
@@ -118,12 +119,167 @@ modify_functions = {
 }
 
 
+# data storage values that no operation can modify in place
+immutable_data_types = frozenset({int, float, str, bool, type(None)})
+
+
 def get_saving_second(seed_name: str, interval: int = 60) -> int:
     # save at expected times so other systems using savegame can expect it
     # represents the target second of the auto_save_interval at which to save
     return int(hashlib.sha256(seed_name.encode()).hexdigest(), 16) % interval
 
 
+# metrics
+
+time_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+""" upper bounds in seconds for histograms of durations """
+fan_out_buckets = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+""" upper bounds for histograms of clients a broadcast is sent to """
+client_commands = frozenset({"Connect", "ConnectUpdate", "Sync", "LocationChecks", "LocationScouts", "CreateHints",
+                             "UpdateHint", "StatusUpdate", "Say", "GetDataPackage", "Bounce", "Get", "Set",
+                             "SetNotify"})
+""" commands with their own label in metrics, anything else a client sends is counted as "other" """
+
+
+def _format_labels(labels: typing.Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+               for value in labels.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+class Histogram:
+    """Counts observed values per bucket like a Prometheus histogram, plus the largest value for a quick summary."""
+    __slots__ = ("bounds", "buckets", "count", "total", "max")
+
+    bounds: typing.Tuple[float, ...]
+    buckets: typing.List[int]
+    """ observations per bucket, not cumulative, the last bucket being +Inf """
+
+    def __init__(self, bounds: typing.Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def render(self, name: str, labels: typing.Dict[str, str]) -> typing.List[str]:
+        lines = []
+        cumulative = 0
+        for bound, amount in zip(self.bounds + (math.inf,), self.buckets):
+            cumulative += amount
+            le = "+Inf" if bound == math.inf else f"{bound:g}"
+            lines.append(f"{name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}")
+        label_text = _format_labels(labels)
+        lines.append(f"{name}_sum{label_text} {self.total!r}")
+        lines.append(f"{name}_count{label_text} {self.count}")
+        return lines
+
+
+class ServerMetrics:
+    """Runtime measurements of a Context. Recording is a few additions per package, so it is always on."""
+    commands: typing.Dict[str, Histogram]
+    """ command -> seconds spent handling each package of that command """
+    broadcast_time: Histogram
+    """ seconds spent handing a broadcast to the sockets """
+    broadcast_clients: Histogram
+    """ number of clients each broadcast was sent to """
+    save_time: Histogram
+
+    def __init__(self):
+        self.commands = {}
+        self.broadcast_time = Histogram(time_buckets)
+        self.broadcast_clients = Histogram(fan_out_buckets)
+        self.save_time = Histogram(time_buckets)
+
+    def observe_command(self, cmd: typing.Any, seconds: float) -> None:
+        if type(cmd) is not str or cmd not in client_commands:
+            cmd = "other"  # don't let clients create arbitrary labels
+        histogram = self.commands.get(cmd)
+        if histogram is None:
+            histogram = self.commands[cmd] = Histogram(time_buckets)
+        histogram.observe(seconds)
+
+
+loop_lag = Histogram(time_buckets)
+""" seconds the event loop of this process woke up late, as other work was blocking it """
+
+
+async def sample_loop_lag(interval: float = 1.0) -> None:
+    """Records into loop_lag how late a sleeping task gets woken up, until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        loop_lag.observe(max(0.0, time.perf_counter() - start - interval))
+
+
+def render_metrics(contexts: typing.Mapping[typing.Optional[str], Context]) -> str:
+    """Prometheus text format of this process and the metrics of contexts, which are labelled with their room key,
+    unless the key is None."""
+    lines = ["# HELP archipelago_event_loop_lag_seconds How late the event loop woke up a sleeping task.",
+             "# TYPE archipelago_event_loop_lag_seconds histogram"]
+    lines += loop_lag.render("archipelago_event_loop_lag_seconds", {})
+    memory = Utils.get_process_memory()
+    if memory:
+        lines += ["# TYPE process_resident_memory_bytes gauge", f"process_resident_memory_bytes {memory}"]
+    labelled = [({} if room is None else {"room": str(room)}, ctx) for room, ctx in contexts.items()]
+
+    lines += ["# HELP archipelago_clients Connected clients.", "# TYPE archipelago_clients gauge"]
+    lines += [f"archipelago_clients{_format_labels(labels)} {len(ctx.endpoints)}" for labels, ctx in labelled]
+    lines += ["# HELP archipelago_processing_seconds_total Time spent handling client packages.",
+              "# TYPE archipelago_processing_seconds_total counter"]
+    lines += [f"archipelago_processing_seconds_total{_format_labels(labels)} {ctx.processing_time!r}"
+              for labels, ctx in labelled]
+    lines += ["# HELP archipelago_command_seconds Time spent handling a client package, by command.",
+              "# TYPE archipelago_command_seconds histogram"]
+    for labels, ctx in labelled:
+        for cmd, histogram in sorted(ctx.metrics.commands.items()):
+            lines += histogram.render("archipelago_command_seconds", {**labels, "command": cmd})
+    for name, attribute, description in (
+            ("archipelago_broadcast_seconds", "broadcast_time", "Time spent handing a broadcast to the sockets."),
+            ("archipelago_broadcast_clients", "broadcast_clients", "Clients a broadcast was sent to."),
+            ("archipelago_save_seconds", "save_time", "Time spent writing a save.")):
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for labels, ctx in labelled:
+            lines += getattr(ctx.metrics, attribute).render(name, labels)
+    return "\n".join(lines) + "\n"
+
+
+async def serve_metrics(host: str, port: int, render: typing.Callable[[], str]) -> asyncio.AbstractServer:
+    """Serves render() at /metrics over plain HTTP, for Prometheus to scrape. Meant to be bound to a local address."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+            method, path, *_ = request.split(b" ", 2)
+            if method == b"GET" and path.split(b"?", 1)[0] == b"/metrics":
+                status, body = b"200 OK", render().encode("utf-8")
+            else:
+                status, body = b"404 Not Found", b"Not Found\n"
+            writer.write(b"HTTP/1.1 %s\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                         b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (status, len(body), body))
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError,
+                ConnectionError):
+            pass  # not a request we can answer
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
 class Client(Endpoint):
     version = Version(0, 0, 0)
     tags: typing.List[str]
@@ -192,12 +348,14 @@ class Context:
     stored_data: typing.Dict[str, object]
     read_data: typing.Dict[str, object]
     stored_data_notification_clients: typing.Dict[str, typing.Set[Client]]
+    queued_set_replies: typing.Dict[Client, typing.Dict[typing.Union[str, int], str]]
+    """ client -> coalescing key -> encoded SetReply, flushed once per event loop tick """
     slot_info: typing.Dict[int, NetworkSlot]
     generator_version = Version(0, 0, 0)
     checksums: typing.Dict[str, str]
-    item_names: typing.Dict[str, typing.Dict[int, str]]
+    item_names: typing.Dict[str, typing.MutableMapping[int, str]]
     item_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
-    location_names: typing.Dict[str, typing.Dict[int, str]]
+    location_names: typing.Dict[str, typing.MutableMapping[int, str]]
     location_name_groups: typing.Dict[str, typing.Dict[str, typing.Set[str]]]
     all_item_and_group_names: typing.Dict[str, typing.Set[str]]
     all_location_and_group_names: typing.Dict[str, typing.Set[str]]
@@ -266,8 +424,12 @@ class Context:
         self.random = random.Random()
         self.stored_data = {}
         self.stored_data_notification_clients = collections.defaultdict(weakref.WeakSet)
+        self.queued_set_replies = {}
+        self._set_reply_counter = itertools.count()
         self.read_data = {}
         self.spheres = []
+        self.processing_time = 0.0  # seconds spent handling client packages, used to balance hosted rooms
+        self.metrics = ServerMetrics()
 
         # init empty to satisfy linter, I suppose
         self.gamespackage = {}
@@ -287,28 +449,44 @@ class Context:
     # Data package retrieval
     def _load_game_data(self):
         import worlds
-        self.gamespackage = worlds.network_data_package["games"]
-
-        self.item_name_groups = {world_name: world.item_name_groups for world_name, world in
-                                 worlds.AutoWorldRegister.world_types.items()}
-        self.location_name_groups = {world_name: world.location_name_groups for world_name, world in
-                                     worlds.AutoWorldRegister.world_types.items()}
-        for world_name, world in worlds.AutoWorldRegister.world_types.items():
-            self.non_hintable_names[world_name] = world.hint_blacklist
+        # remove groups from data sent to clients, copying so that multiple contexts can share one process
+        self.gamespackage = {
+            game_name: {key: value for key, value in game_package.items()
+                        if key not in {"item_name_groups", "location_name_groups"}}
+            for game_name, game_package in worlds.network_data_package["games"].items()
+        }
 
-        for game_package in self.gamespackage.values():
-            # remove groups from data sent to clients
-            del game_package["item_name_groups"]
-            del game_package["location_name_groups"]
+        # from the world manifest, so that hosting does not need to import any world
+        self.item_name_groups = {
+            game_name: {group: frozenset(names) for group, names in game_package["item_name_groups"].items()}
+            for game_name, game_package in worlds.network_data_package["games"].items()}
+        self.location_name_groups = {
+            game_name: {group: frozenset(names) for group, names in game_package["location_name_groups"].items()}
+            for game_name, game_package in worlds.network_data_package["games"].items()}
+        for game_name, manifest in worlds.game_manifests.items():
+            self.non_hintable_names[game_name] = manifest.hint_blacklist
 
     def _init_game_data(self):
         for game_name, game_package in self.gamespackage.items():
             if "checksum" in game_package:
                 self.checksums[game_name] = game_package["checksum"]
-            for item_name, item_id in game_package["item_name_to_id"].items():
-                self.item_names[game_name][item_id] = item_name
-            for location_name, location_id in game_package["location_name_to_id"].items():
-                self.location_names[game_name][location_id] = location_name
+                # memory-mapped from the cache, so each room does not need its own dicts
+                name_tables = Utils.load_data_package_names(game_name, game_package["checksum"])
+                if name_tables is None:
+                    Utils.store_data_package_names(game_name, game_package)
+                    name_tables = Utils.load_data_package_names(game_name, game_package["checksum"])
+            else:
+                name_tables = None
+            if name_tables:
+                self.item_names[game_name] = collections.ChainMap({}, name_tables.item_names,
+                                                                  self.item_names[game_name])
+                self.location_names[game_name] = collections.ChainMap({}, name_tables.location_names,
+                                                                      self.location_names[game_name])
+            else:
+                for item_name, item_id in game_package["item_name_to_id"].items():
+                    self.item_names[game_name][item_id] = item_name
+                for location_name, location_id in game_package["location_name_to_id"].items():
+                    self.location_names[game_name][location_id] = location_name
             self.all_item_and_group_names[game_name] = \
                 set(game_package["item_name_to_id"]) | set(self.item_name_groups[game_name])
             self.all_location_and_group_names[game_name] = \
@@ -331,6 +509,8 @@ class Context:
     async def send_msgs(self, endpoint: Endpoint, msgs: typing.Iterable[dict]) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
             return False
+        if self.queued_set_replies:
+            self.flush_set_replies((endpoint,))
         msg = self.dumper(msgs)
         try:
             await endpoint.socket.send(msg)
@@ -346,6 +526,8 @@ class Context:
     async def send_encoded_msgs(self, endpoint: Endpoint, msg: str) -> bool:
         if not endpoint.socket or not endpoint.socket.open:
             return False
+        if self.queued_set_replies:
+            self.flush_set_replies((endpoint,))
         try:
             await endpoint.socket.send(msg)
         except websockets.ConnectionClosed:
@@ -358,10 +540,18 @@ class Context:
             return True
 
     async def broadcast_send_encoded_msgs(self, endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
+        if self.queued_set_replies:
+            endpoints = list(endpoints)
+            self.flush_set_replies(endpoints)
+        return self.send_encoded_broadcast(endpoints, msg)
+
+    def send_encoded_broadcast(self, endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
+        """Broadcasts msg right away, without sending queued SetReplies first."""
         sockets = []
         for endpoint in endpoints:
             if endpoint.socket and endpoint.socket.open:
                 sockets.append(endpoint.socket)
+        start = time.perf_counter()
         try:
             websockets.broadcast(sockets, msg)
         except RuntimeError:
@@ -370,6 +560,8 @@ class Context:
         else:
             if self.log_network:
                 self.logger.info(f"Outgoing broadcast: {msg}")
+            self.metrics.broadcast_time.observe(time.perf_counter() - start)
+            self.metrics.broadcast_clients.observe(len(sockets))
             return True
 
     def broadcast_all(self, msgs: typing.List[dict]):
@@ -400,6 +592,38 @@ class Context:
         msgs = self.dumper(msgs)
         async_start(self.broadcast_send_encoded_msgs(endpoints, msgs))
 
+    def queue_set_reply(self, endpoints: typing.Iterable[Client], msg: typing.Dict[str, typing.Any],
+                        coalesce: bool = False):
+        """Queue a SetReply, all SetReplies queued within one event loop tick are sent as one message per client.
+        The package is encoded immediately, as data storage operations may mutate the value in place afterwards.
+        If coalesce is set, an earlier queued SetReply for the same key is replaced instead of sent as well,
+        which is only correct for packages that carry the full current value and nothing else, like _read_ keys."""
+        encoded = self.dumper(msg)
+        queue_key = msg["key"] if coalesce else next(self._set_reply_counter)
+        first = not self.queued_set_replies
+        for endpoint in endpoints:
+            packages = self.queued_set_replies.setdefault(endpoint, {})
+            packages.pop(queue_key, None)  # a coalesced package moves to the position of its latest update
+            packages[queue_key] = encoded
+        if first and self.queued_set_replies:
+            try:
+                asyncio.get_running_loop().call_soon(self.flush_set_replies)
+            except RuntimeError:  # no running loop, so there is no tick to wait for
+                self.flush_set_replies()
+
+    def flush_set_replies(self, endpoints: typing.Optional[typing.Iterable[Endpoint]] = None):
+        """Send all queued SetReplies now. If endpoints is given, only if one of them has SetReplies queued,
+        which is done before sending anything else to them, so replies keep the order they were made in."""
+        if endpoints is not None and not any(endpoint in self.queued_set_replies for endpoint in endpoints):
+            return
+        queued, self.queued_set_replies = self.queued_set_replies, {}
+        # clients watching the same keys receive the same message, so group them to encode and broadcast only once
+        receivers: typing.Dict[typing.Tuple[str, ...], typing.List[Client]] = collections.defaultdict(list)
+        for endpoint, packages in queued.items():
+            receivers[tuple(packages.values())].append(endpoint)
+        for packages, receiving in receivers.items():
+            self.send_encoded_broadcast(receiving, f"[{','.join(packages)}]")
+
     async def disconnect(self, endpoint: Client):
         if endpoint in self.endpoints:
             self.endpoints.remove(endpoint)
@@ -530,6 +754,7 @@ class Context:
 
         # sorted access spheres
         self.spheres = decoded_obj.get("spheres", [])
+        self.locations.set_spheres(self.spheres)
 
     # saving
 
@@ -537,7 +762,10 @@ class Context:
         if self.saving:
             if now:
                 self.save_dirty = False
-                return self._save()
+                start = time.perf_counter()
+                saved = self._save()
+                self.metrics.save_time.observe(time.perf_counter() - start)
+                return saved
 
             self.save_dirty = True
             return True
@@ -589,7 +817,9 @@ class Context:
                         time.sleep(max(1.0, next_wakeup))
                         if self.save_dirty:
                             self.logger.debug("Saving via thread.")
+                            start = time.perf_counter()
                             self._save()
+                            self.metrics.save_time.observe(time.perf_counter() - start)
                     except OperationalError as e:
                         self.logger.exception(e)
                         self.logger.info(f"Saving failed. Retry in {self.auto_save_interval} seconds.")
@@ -712,11 +942,11 @@ class Context:
     def get_sphere(self, player: int, location_id: int) -> int:
         """Get sphere of a location, -1 if spheres are not available."""
         if self.spheres:
-            for i, sphere in enumerate(self.spheres):
-                if location_id in sphere.get(player, set()):
-                    return i
-            raise KeyError(f"No Sphere found for location ID {location_id} belonging to player {player}. "
-                           f"Location or player may not exist.")
+            try:
+                return self.locations.get_sphere(player, location_id)
+            except KeyError:
+                raise KeyError(f"No Sphere found for location ID {location_id} belonging to player {player}. "
+                               f"Location or player may not exist.") from None
         return -1
 
     def get_players_package(self):
@@ -826,13 +1056,15 @@ class Context:
         key: str = f"_read_hints_{team}_{slot}"
         targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
         if targets:
-            self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.hints[team, slot]}])
+            self.queue_set_reply(targets, {"cmd": "SetReply", "key": key, "value": self.hints[team, slot]},
+                                 coalesce=True)
 
     def on_client_status_change(self, team: int, slot: int):
         key: str = f"_read_client_status_{team}_{slot}"
         targets: typing.Set[Client] = set(self.stored_data_notification_clients[key])
         if targets:
-            self.broadcast(targets, [{"cmd": "SetReply", "key": key, "value": self.client_game_state[team, slot]}])
+            self.queue_set_reply(targets, {"cmd": "SetReply", "key": key,
+                                           "value": self.client_game_state[team, slot]}, coalesce=True)
 
 
 def update_aliases(ctx: Context, team: int):
@@ -857,8 +1089,13 @@ async def server(websocket: "ServerConnection", path: str = "/", ctx: Context =
         async for data in websocket:
             if ctx.log_network:
                 ctx.logger.info(f"Incoming message: {data}")
+            start = time.perf_counter()
             for msg in decode(data):
+                msg_start = time.perf_counter()
+                cmd = msg.get("cmd")  # handlers may reuse msg as their reply, so read it first
                 await process_client_cmd(ctx, client, msg)
+                ctx.metrics.observe_command(cmd, time.perf_counter() - msg_start)
+            ctx.processing_time += time.perf_counter() - start
     except Exception as e:
         if not isinstance(e, websockets.WebSocketException):
             ctx.logger.exception(e)
@@ -1023,6 +1260,25 @@ def get_start_inventory(ctx: Context, player: int, remote_start_inventory: bool)
     return ctx.start_inventory.setdefault(player, []) if remote_start_inventory else []
 
 
+def get_received_items_packet(client: Client, index: int, items: typing.List[NetworkItem]) -> dict:
+    """ReceivedItems for items starting at index, packed into plain arrays for clients with the DeltaSync tag."""
+    if "DeltaSync" in client.tags:
+        return {"cmd": "ReceivedItems", "index": index, "items": [tuple(item) for item in items]}
+    return {"cmd": "ReceivedItems", "index": index, "items": items}
+
+
+def get_resume_index(items: typing.List[NetworkItem], args: dict) -> int:
+    """Index a reconnecting DeltaSync client can resume ReceivedItems from, if the last item it claims to have received
+    matches, otherwise 0."""
+    index = args.get("received_items_index", 0)
+    if type(index) is not int or not 0 < index <= len(items):
+        return 0
+    last_item = args.get("last_received_item", None)
+    if not isinstance(last_item, (list, tuple)) or tuple(last_item) != tuple(items[index - 1]):
+        return 0
+    return index
+
+
 def send_new_items(ctx: Context):
     for team, clients in ctx.clients.items():
         for slot, clients in clients.items():
@@ -1033,10 +1289,8 @@ def send_new_items(ctx: Context):
                 items = get_received_items(ctx, team, slot, client.remote_items)
                 if len(start_inventory) + len(items) > client.send_index:
                     first_new_item = max(0, client.send_index - len(start_inventory))
-                    async_start(ctx.send_msgs(client, [{
-                        "cmd": "ReceivedItems",
-                        "index": client.send_index,
-                        "items": start_inventory[client.send_index:] + items[first_new_item:]}]))
+                    async_start(ctx.send_msgs(client, [get_received_items_packet(
+                        client, client.send_index, start_inventory[client.send_index:] + items[first_new_item:])]))
                     client.send_index = len(start_inventory) + len(items)
 
 
@@ -1839,17 +2093,25 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 "cmd": "Connected",
                 "team": client.team, "slot": client.slot,
                 "players": ctx.get_players_package(),
-                "missing_locations": get_missing_checks(ctx, team, slot),
-                "checked_locations": get_checked_checks(ctx, team, slot),
                 "slot_info": ctx.slot_info,
                 "hint_points": get_slot_points(ctx, team, slot),
             }
+            delta_sync = "DeltaSync" in client.tags
+            if delta_sync:
+                connected_packet["missing_location_ranges"] = encode_ranges(get_missing_checks(ctx, team, slot))
+                connected_packet["checked_location_ranges"] = encode_ranges(get_checked_checks(ctx, team, slot))
+            else:
+                connected_packet["missing_locations"] = get_missing_checks(ctx, team, slot)
+                connected_packet["checked_locations"] = get_checked_checks(ctx, team, slot)
             reply = [connected_packet]
             start_inventory = get_start_inventory(ctx, slot, client.remote_start_inventory)
             items = get_received_items(ctx, client.team, client.slot, client.remote_items)
             if (start_inventory or items) and not client.no_items:
-                reply.append({"cmd": 'ReceivedItems', "index": 0, "items": start_inventory + items})
-                client.send_index = len(start_inventory) + len(items)
+                all_items = start_inventory + items
+                # a reconnecting client only needs the items it missed
+                index = get_resume_index(all_items, args) if delta_sync else 0
+                reply.append(get_received_items_packet(client, index, all_items[index:]))
+                client.send_index = len(all_items)
             if not client.auth:  # if this was a Re-Connect, don't print to console
                 client.auth = True
                 await on_client_joined(ctx, client)
@@ -1892,8 +2154,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                     items = get_received_items(ctx, client.team, client.slot, client.remote_items)
                     if (items or start_inventory) and not client.no_items:
                         client.send_index = len(start_inventory) + len(items)
-                        await ctx.send_msgs(client, [{"cmd": "ReceivedItems", "index": 0,
-                                                      "items": start_inventory + items}])
+                        await ctx.send_msgs(client, [get_received_items_packet(client, 0, start_inventory + items)])
                     else:
                         client.send_index = 0
                 except (ValueError, TypeError) as err:
@@ -1920,8 +2181,7 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
             items = get_received_items(ctx, client.team, client.slot, client.remote_items)
             if (start_inventory or items) and not client.no_items:
                 client.send_index = len(start_inventory) + len(items)
-                await ctx.send_msgs(client, [{"cmd": "ReceivedItems", "index": 0,
-                                              "items": start_inventory + items}])
+                await ctx.send_msgs(client, [get_received_items_packet(client, 0, start_inventory + items)])
 
         elif cmd == 'LocationChecks':
             if client.no_locations:
@@ -2090,17 +2350,19 @@ async def process_client_cmd(ctx: Context, client: Client, args: dict):
                 return
             args["cmd"] = "SetReply"
             value = ctx.stored_data.get(args["key"], args.get("default", 0))
-            args["original_value"] = copy.copy(value)
-            args["slot"] = client.slot
+            targets = set(ctx.stored_data_notification_clients[args["key"]])
+            if args.get("want_reply", False):
+                targets.add(client)
+            if targets:
+                # operations may modify containers in place, so only pay for a copy if someone gets to see it
+                args["original_value"] = value if type(value) in immutable_data_types else copy.copy(value)
+                args["slot"] = client.slot
             for operation in args["operations"]:
                 func = modify_functions[operation["operation"]]
                 value = func(value, operation["value"])
             ctx.stored_data[args["key"]] = args["value"] = value
-            targets = set(ctx.stored_data_notification_clients[args["key"]])
-            if args.get("want_reply", False):
-                targets.add(client)
             if targets:
-                ctx.broadcast(targets, [args])
+                ctx.queue_set_reply(targets, args)
             ctx.save()
 
         elif cmd == "SetNotify":
@@ -2438,6 +2700,23 @@ class ServerCommandProcessor(CommonCommandProcessor):
             self.ctx.broadcast_all([{"cmd": "RoomUpdate", option_name: getattr(self.ctx, option_name)}])
         return True
 
+    def _cmd_metrics(self) -> bool:
+        """Show how long the server took to handle client packages, broadcasts and saves since it started."""
+        metrics = self.ctx.metrics
+        texts = [f"{len(self.ctx.endpoints)} clients connected, "
+                 f"{self.ctx.processing_time:.2f} seconds spent handling client packages"]
+        for cmd, histogram in sorted(metrics.commands.items(), key=lambda item: -item[1].total):
+            texts.append(f"{cmd}: {histogram.count} handled, {histogram.mean * 1000:.2f}ms average, "
+                         f"{histogram.max * 1000:.2f}ms max")
+        texts.append(f"Broadcasts: {metrics.broadcast_time.count} sent, "
+                     f"{metrics.broadcast_clients.mean:.1f} clients and {metrics.broadcast_time.mean * 1000:.2f}ms "
+                     f"average")
+        texts.append(f"Saves: {metrics.save_time.count} written, {metrics.save_time.mean * 1000:.2f}ms average, "
+                     f"{metrics.save_time.max * 1000:.2f}ms max")
+        texts.append(f"Event loop lag: {loop_lag.mean * 1000:.2f}ms average, {loop_lag.max * 1000:.2f}ms max")
+        self.output("\n".join(texts))
+        return True
+
     def _cmd_datastore(self):
         """Debug Tool: list writable datastorage keys and approximate the size of their values with pickle."""
         total: int = 0
@@ -2530,6 +2809,8 @@ def parse_args() -> argparse.Namespace:
     #0 -> recommended for tournaments to force a level playing field, only allow an exact version match
     """)
     parser.add_argument('--log_network', default=defaults["log_network"], action="store_true")
+    parser.add_argument('--metrics_port', default=defaults["metrics_port"], type=int,
+                        help="serve Prometheus metrics at http://localhost:<port>/metrics, 0 to disable")
     args = parser.parse_args()
     return args
 
@@ -2616,11 +2897,16 @@ async def main(args: argparse.Namespace):
                                                  'No password' if not ctx.password else 'Password: %s' % ctx.password))
 
     await ctx.server
+    lag_task = asyncio.create_task(sample_loop_lag())
+    if args.metrics_port:
+        await serve_metrics("127.0.0.1", args.metrics_port, lambda: render_metrics({None: ctx}))
+        logging.info(f"Serving metrics at http://127.0.0.1:{args.metrics_port}/metrics")
     console_task = asyncio.create_task(console(ctx))
     if ctx.auto_shutdown:
         ctx.shutdown_task = asyncio.create_task(auto_shutdown(ctx, [console_task]))
     await ctx.exit_event.wait()
     console_task.cancel()
+    lag_task.cancel()
     if ctx.shutdown_task:
         await ctx.shutdown_task
 
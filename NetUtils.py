@@ -139,6 +139,28 @@ def encode(obj: typing.Any) -> str:
     return _encode(_scan_for_TypedTuples(obj))
 
 
+def encode_ranges(values: typing.Iterable[int]) -> typing.List[typing.Tuple[int, int]]:
+    """Packs integers, such as location ids, into sorted and inclusive (first, last) ranges,
+    as sent to clients with the DeltaSync tag."""
+    ranges: typing.List[typing.Tuple[int, int]] = []
+    first = last = None
+    for value in sorted(values):
+        if last is not None and value == last + 1:
+            last = value
+            continue
+        if last is not None:
+            ranges.append((first, last))
+        first = last = value
+    if last is not None:
+        ranges.append((first, last))
+    return ranges
+
+
+def decode_ranges(ranges: typing.Iterable[typing.Sequence[int]]) -> typing.List[int]:
+    """Unpacks ranges from encode_ranges."""
+    return [value for first, last in ranges for value in range(first, last + 1)]
+
+
 def get_any_version(data: dict) -> Version:
     data = {key.lower(): value for key, value in data.items()}  # .NET version classes have capitalized keys
     return Version(int(data["major"]), int(data["minor"]), int(data["build"]))
@@ -425,6 +447,21 @@ class _LocationStore(dict, typing.MutableMapping[int, typing.Dict[int, typing.Tu
         if len(self.get(0, {})):
             raise ValueError("Invalid player id 0 for location")
 
+        self._spheres: typing.Dict[typing.Tuple[int, int], int] = {}
+
+    def set_spheres(self, spheres: typing.Iterable[typing.Dict[int, typing.Set[int]]]) -> None:
+        self._spheres = {
+            (player, location_id): sphere_index
+            for sphere_index, sphere in enumerate(spheres)
+            for player, locations in sphere.items() if player in self
+            for location_id in locations if location_id in self[player]
+        }
+
+    def get_sphere(self, slot: int, location: int) -> int:
+        if slot not in self:
+            raise KeyError(slot)
+        return self._spheres[slot, location]
+
     def find_item(self, slots: typing.Set[int], seeked_item_id: int
                   ) -> typing.Generator[typing.Tuple[int, int, int, int, int], None, None]:
         for finding_player, check_data in self.items():
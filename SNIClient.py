@@ -9,6 +9,7 @@ import subprocess
 import base64
 import logging
 import asyncio
+import bisect
 import enum
 import typing
 
@@ -516,6 +517,14 @@ async def snes_recv_loop(ctx: SNIContext) -> None:
 
 
 async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional[bytes]:
+    data = await snes_read_ranges(ctx, [(address, size)])
+    return data[0] if data is not None else None
+
+
+async def snes_read_ranges(ctx: SNIContext,
+                           ranges: typing.Sequence[typing.Tuple[int, int]]) -> typing.Optional[typing.List[bytes]]:
+    """Read several (address, size) ranges with a single multi-operand GetAddress request.
+    Returns the data of each range in order, or None if the read failed."""
     try:
         await ctx.snes_request_lock.acquire()
 
@@ -530,22 +539,25 @@ async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional
         GetAddress_Request: SNESRequest = {
             "Opcode": "GetAddress",
             "Space": "SNES",
-            "Operands": [hex(address)[2:], hex(size)[2:]]
+            "Operands": [operand for address, size in ranges for operand in (hex(address)[2:], hex(size)[2:])]
         }
         try:
             await ctx.snes_socket.send(dumps(GetAddress_Request))
         except ConnectionClosed:
             return None
 
+        # SNI answers with the data of all ranges concatenated, possibly split over several messages
+        total_size = sum(size for _, size in ranges)
         data: bytes = bytes()
-        while len(data) < size:
+        while len(data) < total_size:
             try:
                 data += await asyncio.wait_for(ctx.snes_recv_queue.get(), 5)
             except asyncio.TimeoutError:
                 break
 
-        if len(data) != size:
-            snes_logger.error('Error reading %s, requested %d bytes, received %d' % (hex(address), size, len(data)))
+        if len(data) != total_size:
+            addresses = ", ".join(hex(address) for address, _ in ranges)
+            snes_logger.error('Error reading %s, requested %d bytes, received %d' % (addresses, total_size, len(data)))
             if len(data):
                 snes_logger.error(str(data))
                 snes_logger.warning('Communication Failure with SNI')
@@ -553,11 +565,69 @@ async def snes_read(ctx: SNIContext, address: int, size: int) -> typing.Optional
                 await ctx.snes_socket.close()
             return None
 
-        return data
+        result: typing.List[bytes] = []
+        position = 0
+        for _, size in ranges:
+            result.append(data[position:position + size])
+            position += size
+        return result
     finally:
         ctx.snes_request_lock.release()
 
 
+class SNESReadPlan:
+    """Collects the reads a game_watcher tick needs, merges adjacent and overlapping ranges
+    and fetches all of them with a single request to SNI, instead of paying a round trip per read.
+    The data is a snapshot from the time of the read. Values that guard a write, like a receive counter,
+    should be read again right before writing if the tick awaited anything else in between.
+
+    Usage::
+
+        plan = SNESReadPlan()
+        plan.add(WRAM_START + 0x10, 2)
+        plan.add(WRAM_START + 0x12, 4)
+        if await plan.read(ctx):
+            game_mode = plan.get(WRAM_START + 0x10, 2)
+    """
+
+    def __init__(self) -> None:
+        self.ranges: typing.List[typing.Tuple[int, int]] = []
+        self._starts: typing.List[int] = []
+        self._data: typing.List[bytes] = []
+
+    def add(self, address: int, size: int) -> None:
+        self.ranges.append((address, size))
+
+    def merged_ranges(self) -> typing.List[typing.Tuple[int, int]]:
+        """The planned ranges, sorted by address, with adjacent and overlapping ones combined."""
+        merged: typing.List[typing.Tuple[int, int]] = []
+        for address, size in sorted(self.ranges):
+            if merged and address <= merged[-1][0] + merged[-1][1]:
+                start, merged_size = merged[-1]
+                merged[-1] = (start, max(merged_size, address + size - start))
+            else:
+                merged.append((address, size))
+        return merged
+
+    async def read(self, ctx: SNIContext) -> bool:
+        """Read all planned ranges. Returns False if the read failed, in which case get must not be used."""
+        ranges = self.merged_ranges()
+        data = await snes_read_ranges(ctx, ranges) if ranges else []
+        if data is None:
+            return False
+        self._starts = [address for address, _ in ranges]
+        self._data = data
+        return True
+
+    def get(self, address: int, size: int) -> bytes:
+        """Data of a range that was added before the read."""
+        index = bisect.bisect_right(self._starts, address) - 1
+        if index < 0 or address + size > self._starts[index] + len(self._data[index]):
+            raise KeyError(f"{hex(address)} with size {size} was not read")
+        offset = address - self._starts[index]
+        return self._data[index][offset:offset + size]
+
+
 async def snes_write(ctx: SNIContext, write_list: typing.List[typing.Tuple[int, bytes]]) -> bool:
     try:
         await ctx.snes_request_lock.acquire()
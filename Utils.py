@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import array
 import asyncio
+import bisect
 import json
 import typing
 import builtins
@@ -12,8 +14,12 @@ import pickle
 import functools
 import io
 import collections
+import copyreg
 import importlib
 import logging
+import mmap
+import struct
+import types
 import warnings
 
 from argparse import Namespace
@@ -30,6 +36,7 @@ except ImportError:
 if typing.TYPE_CHECKING:
     import tkinter
     import pathlib
+    import sqlite3
     from BaseClasses import Region
     import multiprocessing
 
@@ -322,30 +329,96 @@ def get_options() -> Settings:
     return get_settings()
 
 
-def persistent_store(category: str, key: str, value: typing.Any):
-    path = user_path("_persistent_storage.yaml")
-    storage = persistent_load()
-    category_dict = storage.setdefault(category, {})
-    category_dict[key] = value
-    with open(path, "wt") as f:
-        f.write(dump(storage, Dumper=Dumper))
-
-
-def persistent_load() -> Dict[str, Dict[str, Any]]:
-    storage: Union[Dict[str, Dict[str, Any]], None] = getattr(persistent_load, "storage", None)
-    if storage:
-        return storage
-    path = user_path("_persistent_storage.yaml")
-    storage = {}
-    if os.path.exists(path):
+class PersistentStorage(typing.Mapping[str, Dict[str, Any]]):
+    """Backend of persistent_store and persistent_load, category -> key -> value.
+    Kept in SQLite, so every key is written on its own and atomically, and a category is only read on first access.
+    The first time the database is created, it is filled from the YAML file used by older versions."""
+
+    def __init__(self, path: str, legacy_path: typing.Optional[str] = None):
+        import threading
+        self.path = path
+        self.legacy_path = legacy_path
+        self._categories: Dict[str, Dict[str, Any]] = {}
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            import sqlite3
+            new = not os.path.exists(self.path)
+            # autocommit, transactions are explicit
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+            connection.execute("CREATE TABLE IF NOT EXISTS storage "
+                               "(category TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                               "PRIMARY KEY (category, key))")
+            if new and self.legacy_path and os.path.exists(self.legacy_path):
+                self._migrate(connection)
+            self._connection = connection
+        return self._connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
         try:
-            with open(path, "r") as f:
+            with open(self.legacy_path, "r") as f:
                 storage = unsafe_parse_yaml(f.read())
         except Exception as e:
             logging.debug(f"Could not read store: {e}")
+            return
+        if not isinstance(storage, dict):
+            return
+        connection.execute("BEGIN")
+        connection.executemany("INSERT OR REPLACE INTO storage VALUES (?, ?, ?)",
+                               ((category, key, pickle.dumps(value))
+                                for category, values in storage.items() if isinstance(values, dict)
+                                for key, value in values.items()))
+        connection.execute("COMMIT")
+
+    def __getitem__(self, category: str) -> Dict[str, Any]:
+        values = self._categories.get(category, None)
+        if values is None:
+            try:
+                with self._lock:
+                    rows = self._connect().execute("SELECT key, value FROM storage WHERE category = ?",
+                                                   (category,)).fetchall()
+            except Exception as e:
+                logging.debug(f"Could not read store: {e}")
+                rows = []
+            if not rows:
+                raise KeyError(category)
+            values = {}
+            for key, value in rows:
+                try:
+                    values[key] = pickle.loads(value)
+                except Exception as e:  # e.g. stored by a newer version
+                    logging.debug(f"Could not read store value {category}/{key}: {e}")
+            values = self._categories.setdefault(category, values)
+        return values
+
+    def __iter__(self) -> typing.Iterator[str]:
+        with self._lock:
+            rows = self._connect().execute("SELECT DISTINCT category FROM storage").fetchall()
+        return iter([category for category, in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(DISTINCT category) FROM storage").fetchone()[0]
+
+    def store(self, category: str, key: str, value: typing.Any) -> None:
+        data = pickle.dumps(value)
+        with self._lock:
+            self._connect().execute("INSERT OR REPLACE INTO storage VALUES (?, ?, ?)", (category, key, data))
+        if category in self._categories:
+            self._categories[category][key] = value
+
+
+def persistent_store(category: str, key: str, value: typing.Any):
+    persistent_load().store(category, key, value)
+
+
+def persistent_load() -> PersistentStorage:
+    storage: Optional[PersistentStorage] = getattr(persistent_load, "storage", None)
     if storage is None:
-        storage = {}
-    setattr(persistent_load, "storage", storage)
+        storage = PersistentStorage(user_path("_persistent_storage.sqlite3"), user_path("_persistent_storage.yaml"))
+        setattr(persistent_load, "storage", storage)
     return storage
 
 
@@ -386,6 +459,126 @@ def store_data_package_for_checksum(game: str, data: typing.Dict[str, Any]) -> N
                 json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
         except Exception as e:
             logging.debug(f"Could not store data package: {e}")
+        store_data_package_names(game, data)
+
+
+class DataPackageNames(typing.Mapping[int, str]):
+    """Read-only id -> name table of a data package, backed by a memory-mapped cache file.
+    Names are only decoded when looked up, so no dict has to be built and all processes reading the same file share
+    its memory."""
+
+    def __init__(self, ids: memoryview, offsets: memoryview, names: memoryview):
+        self._ids = ids  # sorted
+        self._offsets = offsets  # names[offsets[i]:offsets[i + 1]] belongs to ids[i]
+        self._names = names
+
+    def __getitem__(self, code: int) -> str:
+        if type(code) is not int:
+            raise KeyError(code)
+        index = bisect.bisect_left(self._ids, code)
+        if index == len(self._ids) or self._ids[index] != code:
+            raise KeyError(code)
+        return str(self._names[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._ids)
+
+
+class DataPackageNameTables(typing.NamedTuple):
+    item_names: DataPackageNames
+    location_names: DataPackageNames
+
+
+# magic, format version, byte order mark, item count, location count
+# followed by item ids (int64), location ids (int64), item name offsets (uint32), location name offsets (uint32)
+# and finally all names as utf-8. Uses native byte order, as the cache is not shared between machines.
+_data_package_names_header = struct.Struct("=4sHHII")
+_data_package_names_magic = b"APDN"
+_data_package_names_version = 1
+_data_package_names_bom = 0x0102
+_data_package_names: Dict[str, DataPackageNameTables] = {}
+""" path -> tables, mapped files stay open for the lifetime of the process """
+
+
+def _get_data_package_names_path(game: str, checksum: str) -> str:
+    if checksum != get_file_safe_name(checksum):
+        raise ValueError(f"Bad symbols in checksum: {checksum}")
+    return cache_path("datapackage", get_file_safe_name(game), f"{checksum}.names")
+
+
+def load_data_package_names(game: str, checksum: typing.Optional[str]) -> Optional[DataPackageNameTables]:
+    """Memory-map the id -> name tables of a game's data package from the binary cache.
+    Returns None if they were not cached for this checksum yet."""
+    if not checksum or not game:
+        return None
+    path = _get_data_package_names_path(game, checksum)
+    tables = _data_package_names.get(path, None)
+    if tables is None:
+        try:
+            with open(path, "rb") as f:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            magic, version, bom, item_count, location_count = _data_package_names_header.unpack_from(view)
+            if (magic, version, bom) != (_data_package_names_magic, _data_package_names_version,
+                                         _data_package_names_bom):
+                raise ValueError("Unsupported data package names file")
+            position = _data_package_names_header.size
+            sections: typing.List[memoryview] = []
+            for count, item_format in ((item_count, "q"), (location_count, "q"),
+                                       (item_count + 1, "I"), (location_count + 1, "I")):
+                size = count * struct.calcsize(item_format)
+                if position + size > len(view):
+                    raise ValueError("Truncated data package names file")
+                sections.append(view[position:position + size].cast(item_format))
+                position += size
+        except (OSError, ValueError, struct.error) as e:  # missing, empty, truncated or from a different version
+            if os.path.exists(path):
+                logging.debug(f"Could not load data package names: {e}")
+            return None
+        item_ids, location_ids, item_offsets, location_offsets = sections
+        names = view[position:]
+        tables = _data_package_names[path] = DataPackageNameTables(DataPackageNames(item_ids, item_offsets, names),
+                                                                   DataPackageNames(location_ids, location_offsets,
+                                                                                    names))
+    return tables
+
+
+def store_data_package_names(game: str, data: typing.Dict[str, Any]) -> None:
+    """Write the id -> name tables of a game's data package to the binary cache read by load_data_package_names."""
+    checksum = data.get("checksum")
+    if not checksum or not game:
+        return
+    path = _get_data_package_names_path(game, checksum)
+    ids: typing.List[bytes] = []
+    offsets: typing.List[bytes] = []
+    names: typing.List[bytes] = []
+    position = 0
+    for key in ("item_name_to_id", "location_name_to_id"):
+        table = sorted((code, name.encode("utf-8")) for name, code in data[key].items())
+        ids.append(array.array("q", (code for code, _ in table)).tobytes())
+        table_offsets = array.array("I", (position,))
+        for _, name in table:
+            names.append(name)
+            position += len(name)
+            table_offsets.append(position)
+        offsets.append(table_offsets.tobytes())
+    header = _data_package_names_header.pack(_data_package_names_magic, _data_package_names_version,
+                                             _data_package_names_bom, len(data["item_name_to_id"]),
+                                             len(data["location_name_to_id"]))
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(b"".join((header, *ids, *offsets, *names)))
+        os.replace(temp_path, path)  # processes that already mapped the old file keep reading that
+    except OSError as e:
+        logging.debug(f"Could not store data package names: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 
 def get_default_adjuster_settings(game_name: str) -> Namespace:
@@ -483,16 +676,51 @@ def restricted_loads(s: bytes) -> Any:
     return RestrictedUnpickler(io.BytesIO(s)).load()
 
 
-def restricted_dumps(obj: Any) -> bytes:
-    """Helper function analogous to pickle.dumps()."""
-    s = pickle.dumps(obj)
-    # Assert that the string can be successfully loaded by restricted_loads
-    try:
-        restricted_loads(s)
-    except pickle.UnpicklingError as e:
-        raise pickle.PicklingError(e) from e
+class RestrictedPickler(pickle.Pickler):
+    """Pickler that refuses to write any global RestrictedUnpickler would refuse to read,
+    so the result can be loaded by restricted_loads without having to test that by loading it."""
+    # NoneType, NotImplementedType and EllipsisType are written as a call to type
+    _pickled_by_type = frozenset((type(None), type(NotImplemented), type(...)))
 
-    return s
+    def __init__(self, file: typing.BinaryIO, protocol: Optional[int] = None, *args: Any, **kwargs: Any) -> None:
+        super(RestrictedPickler, self).__init__(file, protocol, *args, **kwargs)
+        if protocol is None:
+            protocol = pickle.DEFAULT_PROTOCOL
+        self.protocol = pickle.HIGHEST_PROTOCOL if protocol < 0 else protocol
+        self.unpickler = RestrictedUnpickler(io.BytesIO())
+
+    def check_global(self, obj: Any, module: str, name: str) -> None:
+        try:
+            allowed = self.unpickler.find_class(module, name) is obj
+        except Exception as e:
+            raise pickle.PicklingError(e) from e
+        if not allowed:
+            raise pickle.PicklingError(f"global '{module}.{name}' is forbidden")
+
+    def reducer_override(self, obj: Any) -> Any:
+        # globals are written for classes and functions, including the callables of __reduce__ results
+        if isinstance(obj, (type, types.FunctionType, types.BuiltinFunctionType)):
+            if obj in self._pickled_by_type:
+                obj = type
+            name = getattr(obj, "__qualname__", obj.__name__)
+            self.check_global(obj, pickle.whichmodule(obj, name), name)
+            return NotImplemented
+        # and for other objects whose reduction is a name, so reduce here the same way the pickler would
+        reduce = copyreg.dispatch_table.get(type(obj))
+        reduced = reduce(obj) if reduce else obj.__reduce_ex__(self.protocol)
+        if isinstance(reduced, str):
+            module = getattr(obj, "__module__", None)
+            if module is None:
+                module = pickle.whichmodule(obj, reduced)
+            self.check_global(obj, module, reduced)
+        return reduced
+
+
+def restricted_dumps(obj: Any) -> bytes:
+    """Helper function analogous to pickle.dumps(). Raises PicklingError if restricted_loads would not load it."""
+    s = io.BytesIO()
+    RestrictedPickler(s).dump(obj)
+    return s.getvalue()
 
 
 class ByValue:
@@ -667,6 +895,15 @@ def format_SI_prefix(value, power=1000, power_labels=("", "k", "M", "G", "T", "P
     return f"{value.quantize(decimal.Decimal('1.00'))} {chaining_prefix(n, power_labels)}"
 
 
+def get_process_memory() -> int:
+    """Resident memory of the current process in bytes, 0 if psutil is not available."""
+    try:
+        import psutil
+    except ImportError:
+        return 0
+    return psutil.Process().memory_info().rss
+
+
 def get_fuzzy_results(input_word: str, word_list: typing.Collection[str], limit: typing.Optional[int] = None) \
         -> typing.List[typing.Tuple[str, int]]:
     import jellyfish
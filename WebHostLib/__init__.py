@@ -41,6 +41,18 @@ app.config["JOB_THRESHOLD"] = 1
 app.config["JOB_TIME"] = 600
 # memory limit for generator processes in bytes
 app.config["GENERATOR_MEMORY_LIMIT"] = 4294967296
+# memory use in bytes after which a generator process gets replaced after its current job, 0 to never replace
+app.config["GENERATOR_RECYCLE_MEMORY"] = 2147483648
+# local port on which autogen listens for newly queued generations and autohost, on the 2 ports after it, for rooms to
+# start and for new room commands. Needed if the web frontend runs in other processes than them. None to only notify
+# within the same process.
+app.config["AUTOLAUNCHER_NOTIFY_PORT"] = None
+# seconds between checks for queued generations and rooms to start if no notification arrives. None for 1 if
+# listening on AUTOLAUNCHER_NOTIFY_PORT, otherwise 0.1
+app.config["AUTOLAUNCHER_POLL_INTERVAL"] = None
+# local port on which the first room hosting process serves Prometheus metrics at /metrics, the next one on the port
+# after it and so on. None to not serve metrics.
+app.config["HOSTER_METRICS_PORT"] = None
 app.config['SESSION_PERMANENT'] = True
 
 # waitress uses one thread for I/O, these are for processing of views that then get sent
@@ -92,6 +104,7 @@ def register():
     from werkzeug.utils import find_modules
     # has automatic patch integration
     import worlds.Files
+    worlds.load_all_worlds()  # pages list all worlds and patch types
     app.jinja_env.filters['is_applayercontainer'] = worlds.Files.is_ap_player_container
 
     from WebHostLib.customserver import run_server_process
@@ -1,20 +1,98 @@
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import multiprocessing
+import os
+import socket
 import typing
 from datetime import timedelta, datetime
+from multiprocessing.connection import Connection
+from multiprocessing.pool import ExceptionWithTraceback
 from threading import Event, Thread
 from typing import Any
 from uuid import UUID
 
 from pony.orm import db_session, select, commit, PrimaryKey
 
-from Utils import restricted_loads
+from Utils import restricted_loads, get_process_memory
+from . import app
 from .locker import Locker, AlreadyRunningException
 
+
+class Wakeup:
+    """Lets the web frontend wake up autogen or autohost right away, so they only need to poll the database slowly.
+    Works within a process through an Event and, if AUTOLAUNCHER_NOTIFY_PORT is set, across processes on the same
+    machine through a datagram to that port plus port_offset."""
+    _socket: socket.socket | None = None
+
+    def __init__(self, port_offset: int):
+        self.port_offset = port_offset
+        self.event = Event()
+
+    def listen(self, config: dict[str, Any]) -> None:
+        """Start receiving notifications from other processes, if configured. Only the first call binds the port."""
+        if self._socket or config["AUTOLAUNCHER_NOTIFY_PORT"] is None:
+            return
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self._socket.bind(("127.0.0.1", config["AUTOLAUNCHER_NOTIFY_PORT"] + self.port_offset))
+        except OSError as e:
+            logging.warning(f"Could not listen for notifications, falling back to polling: {e}")
+            self._socket.close()
+            self._socket = None
+            return
+        Thread(target=self._receive, name="AP_AutolauncherWakeup", daemon=True).start()
+
+    def _receive(self) -> None:
+        while True:
+            self.received(self._socket.recv(16))
+
+    def received(self, message: bytes) -> None:
+        """Handles a notification from another process."""
+        self.event.set()
+
+    def notify(self, message: bytes = b"\x00") -> None:
+        """Wakes up this process and, if configured, the listening process. message is at most 16 bytes."""
+        self.event.set()
+        if app.config["AUTOLAUNCHER_NOTIFY_PORT"] is not None:
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                    s.sendto(message, ("127.0.0.1", app.config["AUTOLAUNCHER_NOTIFY_PORT"] + self.port_offset))
+            except OSError as e:  # the fallback poll will still pick it up
+                logging.warning(f"Could not notify autolauncher: {e}")
+
+    def poll_interval(self, config: dict[str, Any]) -> float:
+        """AUTOLAUNCHER_POLL_INTERVAL, by default 1 second while listening for notifications from other processes.
+        Otherwise only notifications from within this process arrive, so it stays at a fast 0.1 seconds."""
+        if config["AUTOLAUNCHER_POLL_INTERVAL"] is not None:
+            return config["AUTOLAUNCHER_POLL_INTERVAL"]
+        return 0.1 if self._socket is None else 1
+
+    def wait(self, timeout: float) -> None:
+        self.event.wait(timeout)
+        self.event.clear()
+
+
+class RoomCommandWakeup(Wakeup):
+    """Carries the id of a room with a new Command from another process to the autohost of this one."""
+
+    def received(self, message: bytes) -> None:
+        try:
+            room_id = UUID(bytes=message)
+        except ValueError:
+            logging.warning(f"Ignoring invalid room command notification {message!r}")
+            return
+        _deliver_room_command(room_id)
+
+
 _stop_event = Event()
+_generation_wakeup = Wakeup(0)
+_room_wakeup = Wakeup(1)
+_room_command_wakeup = RoomCommandWakeup(2)
+_hosters: list[MultiworldInstance] = []
+""" hosters of the autohost running in this process, if any """
 
 
 def stop():
@@ -23,6 +101,18 @@ def stop():
     stop_event = _stop_event
     _stop_event = Event()  # new event for new threads
     stop_event.set()
+    _generation_wakeup.event.set()
+    _room_wakeup.event.set()
+
+
+def notify_generation_queued() -> None:
+    """Wake up autogen to start a newly queued Generation."""
+    _generation_wakeup.notify()
+
+
+def notify_room_activity() -> None:
+    """Wake up autohost to start a Room that became active again."""
+    _room_wakeup.notify()
 
 
 def handle_generation_success(seed_id):
@@ -36,16 +126,130 @@ def handle_generation_failure(result: BaseException):
         logging.exception(e)
 
 
+_recycle_generator = False
+""" set if this generator process should be replaced after its current job """
+
+
 def _mp_gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None, sid=None) -> PrimaryKey | None:
+    global _recycle_generator
     from setproctitle import setproctitle
 
     setproctitle(f"Generator ({sid})")
     res = gen_game(gen_options, meta=meta, owner=owner, sid=sid)
+    if res is None:  # timed out, the generation keeps running in its thread until the process ends
+        _recycle_generator = True
     setproctitle(f"Generator (idle)")
     return res
 
 
-def launch_generator(pool: multiprocessing.pool.Pool, generation: Generation):
+generator_preload = ["worlds", "WebHostLib.autolauncher"]
+""" modules imported once by the process generators get forked from """
+
+
+def _generator_worker(jobs: multiprocessing.Queue, results: Connection, results_lock: typing.ContextManager[Any],
+                      initializer: typing.Callable[..., None], initargs: tuple, recycle_memory: int) -> None:
+    initializer(*initargs)
+    while not _recycle_generator:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, func, args, kwargs = job
+        try:
+            result = job_id, True, func(*args, **kwargs)
+        except BaseException as e:
+            result = job_id, False, ExceptionWithTraceback(e, e.__traceback__)
+        del job, func, args, kwargs
+        with results_lock:
+            results.send(result)
+        del result
+        if recycle_memory and get_process_memory() > recycle_memory:
+            break
+    if _recycle_generator:
+        # a timed out generation is still running in a non-daemon thread, which a regular exit would wait for
+        os._exit(0)
+
+
+class GeneratorPool:
+    """Process pool for generation jobs, that behaves like multiprocessing.Pool for what autogen uses.
+    Where available, workers are forked from a forkserver that already imported the core modules and the world
+    manifest, so new workers start generating right away and only import the worlds their jobs use.
+    Workers are replaced when a job leaves them using more than recycle_memory bytes, or when a job timed out,
+    instead of after a fixed number of jobs."""
+
+    def __init__(self, processes: int, initializer: typing.Callable[..., None], initargs: tuple,
+                 recycle_memory: int = 0):
+        try:
+            self._context = multiprocessing.get_context("forkserver")
+        except ValueError:  # forkserver is unix only, workers have to import worlds themselves
+            self._context = multiprocessing.get_context()
+        else:
+            self._context.set_forkserver_preload(generator_preload)
+        self._worker_args = (initializer, initargs, recycle_memory)
+        self._jobs = self._context.Queue()
+        self._results, self._results_writer = self._context.Pipe(duplex=False)
+        self._results_lock = self._context.Lock()
+        self._job_ids = itertools.count()
+        self._callbacks: dict[int, tuple[typing.Callable[[Any], Any] | None,
+                                         typing.Callable[[BaseException], Any] | None]] = {}
+        self._stop_event = Event()
+        self._workers = [self._start_worker() for _ in range(processes)]
+        Thread(target=self._handle_results, name="GeneratorPoolResults", daemon=True).start()
+        Thread(target=self._handle_workers, name="GeneratorPoolWorkers", daemon=True).start()
+
+    def _start_worker(self) -> multiprocessing.Process:
+        worker = self._context.Process(target=_generator_worker, name="Generator",
+                                       args=(self._jobs, self._results_writer, self._results_lock,
+                                             *self._worker_args), daemon=True)
+        worker.start()
+        return worker
+
+    def _handle_workers(self) -> None:
+        while not self._stop_event.wait(0.1):
+            for i, worker in enumerate(self._workers):
+                if worker.exitcode is not None and not self._stop_event.is_set():
+                    worker.join()
+                    self._workers[i] = self._start_worker()
+
+    def _handle_results(self) -> None:
+        while True:
+            result = self._results.recv()
+            if result is None:
+                return
+            job_id, success, value = result
+            callback, error_callback = self._callbacks.pop(job_id)
+            try:
+                if success and callback:
+                    callback(value)
+                elif not success and error_callback:
+                    error_callback(value)
+            except Exception as e:
+                logging.exception(e)
+
+    def apply_async(self, func: typing.Callable[..., Any], args: typing.Iterable[Any] = (),
+                    kwds: dict[str, Any] | None = None, callback: typing.Callable[[Any], Any] | None = None,
+                    error_callback: typing.Callable[[BaseException], Any] | None = None) -> None:
+        job_id = next(self._job_ids)
+        self._callbacks[job_id] = callback, error_callback
+        self._jobs.put((job_id, func, tuple(args), kwds or {}))
+
+    def terminate(self) -> None:
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.terminate()
+        for worker in self._workers:
+            worker.join()
+        self._jobs.cancel_join_thread()
+        # a terminated worker may have died holding the lock, but with all workers gone nothing else writes here
+        self._results_writer.send(None)
+
+    def __enter__(self) -> GeneratorPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.terminate()
+
+
+def launch_generator(pool: GeneratorPool, generation: Generation):
     try:
         meta = json.loads(generation.meta)
         options = restricted_loads(generation.options)
@@ -105,13 +309,18 @@ def autohost(config: dict):
         try:
             with Locker("autohost"):
                 cleanup()
-                hosters = []
+                _room_wakeup.listen(config)
+                _room_command_wakeup.listen(config)
+                hosters = _hosters
+                hosters.clear()
                 for x in range(config["HOSTERS"]):
                     hoster = MultiworldInstance(config, x)
                     hosters.append(hoster)
                     hoster.start()
 
-                while not stop_event.wait(0.1):
+                while not stop_event.is_set():
+                    for hoster in hosters:
+                        hoster.update()
                     with db_session:
                         rooms = select(
                             room for room in Room if
@@ -119,7 +328,9 @@ def autohost(config: dict):
                         for room in rooms:
                             # we have to filter twice, as the per-room timeout can't currently be PonyORM transpiled.
                             if room.last_activity >= datetime.utcnow() - timedelta(seconds=room.timeout + 5):
-                                hosters[room.id.int % len(hosters)].start_room(room.id)
+                                if not any(room.id in hoster.room_ids for hoster in hosters):
+                                    min(hosters, key=MultiworldInstance.placement_key).start_room(room.id)
+                    _room_wakeup.wait(_room_wakeup.poll_interval(config))
 
         except AlreadyRunningException:
             logging.info("Autohost reports as already running, not starting another.")
@@ -127,14 +338,31 @@ def autohost(config: dict):
     Thread(target=keep_running, name="AP_Autohost").start()
 
 
+def notify_room_command(room_id: UUID) -> None:
+    """Wake up the hoster of a room to deliver its new Command right away. Without an autohost in this process, that
+    takes AUTOLAUNCHER_NOTIFY_PORT, otherwise hosters pick it up through their fallback poll."""
+    if not _deliver_room_command(room_id):
+        _room_command_wakeup.notify(room_id.bytes)
+
+
+def _deliver_room_command(room_id: UUID) -> bool:
+    """Hand room_id to the hoster of this process that runs the room. Returns False if there is none."""
+    for hoster in _hosters:
+        if room_id in hoster.room_ids:
+            hoster.room_commands.put(room_id)
+            return True
+    return False
+
+
 def autogen(config: dict):
     def keep_running():
         stop_event = _stop_event
         try:
             with Locker("autogen"):
+                _generation_wakeup.listen(config)
 
-                with multiprocessing.Pool(config["GENERATORS"], initializer=init_generator,
-                                          initargs=(config,), maxtasksperchild=10) as generator_pool:
+                with GeneratorPool(config["GENERATORS"], initializer=init_generator, initargs=(config,),
+                                   recycle_memory=config["GENERATOR_RECYCLE_MEMORY"]) as generator_pool:
                     with db_session:
                         to_start = select(generation for generation in Generation if generation.state == STATE_STARTED)
 
@@ -150,7 +378,7 @@ def autogen(config: dict):
                             commit()
                         select(generation for generation in Generation if generation.state == STATE_ERROR).delete()
 
-                    while not stop_event.wait(0.1):
+                    while not stop_event.is_set():
                         with db_session:
                             # for update locks the database row(s) during transaction, preventing writes from elsewhere
                             to_start = select(
@@ -158,6 +386,7 @@ def autogen(config: dict):
                                 if generation.state == STATE_QUEUED).for_update()
                             for generation in to_start:
                                 launch_generator(generator_pool, generation)
+                        _generation_wakeup.wait(_generation_wakeup.poll_interval(config))
         except AlreadyRunningException:
             logging.info("Autogen reports as already running, not starting another.")
 
@@ -165,6 +394,9 @@ def autogen(config: dict):
 
 
 class MultiworldInstance():
+    metrics: dict[Any, RoomMetrics]
+    """ latest metrics reported by the hosting process, room_id -> metrics """
+
     def __init__(self, config: dict, id: int):
         self.room_ids = set()
         self.process: typing.Optional[multiprocessing.Process] = None
@@ -172,8 +404,12 @@ class MultiworldInstance():
         self.cert = config["SELFLAUNCHCERT"]
         self.key = config["SELFLAUNCHKEY"]
         self.host = config["HOST_ADDRESS"]
+        self.metrics_port = None if config["HOSTER_METRICS_PORT"] is None else config["HOSTER_METRICS_PORT"] + id
         self.rooms_to_start = multiprocessing.Queue()
         self.rooms_shutting_down = multiprocessing.Queue()
+        self.room_metrics = multiprocessing.Queue()
+        self.room_commands = multiprocessing.Queue()
+        self.metrics = {}
         self.name = f"MultiHoster{id}"
 
     def start(self):
@@ -183,14 +419,30 @@ class MultiworldInstance():
         process = multiprocessing.Process(group=None, target=run_server_process,
                                           args=(self.name, self.ponyconfig, get_static_server_data(),
                                                 self.cert, self.key, self.host,
-                                                self.rooms_to_start, self.rooms_shutting_down),
+                                                self.rooms_to_start, self.rooms_shutting_down, self.room_metrics,
+                                                self.room_commands, self.metrics_port),
                                           name=self.name)
         process.start()
         self.process = process
 
-    def start_room(self, room_id):
+    def update(self):
+        """Collect rooms that have shut down and the latest metrics from the hosting process."""
         while not self.rooms_shutting_down.empty():
             self.room_ids.remove(self.rooms_shutting_down.get(block=True, timeout=None))
+        while not self.room_metrics.empty():
+            self.metrics = self.room_metrics.get(block=True, timeout=None)
+
+    @property
+    def load(self) -> float:
+        """Share of time the hosting process spent handling client packages of its rooms recently."""
+        return sum(metrics.load for room_id, metrics in self.metrics.items() if room_id in self.room_ids)
+
+    def placement_key(self) -> tuple[float, int]:
+        # rooms with similar load are balanced by room count, which also spreads rooms started at the same time
+        return round(self.load, 2), len(self.room_ids)
+
+    def start_room(self, room_id):
+        self.update()
         if room_id in self.room_ids:
             pass  # should already be hosted currently.
         else:
@@ -211,5 +463,5 @@ class MultiworldInstance():
 
 
 from .models import Room, Generation, STATE_QUEUED, STATE_STARTED, STATE_ERROR, db, Seed, Slot
-from .customserver import run_server_process, get_static_server_data
+from .customserver import run_server_process, get_static_server_data, RoomMetrics
 from .generate import gen_game
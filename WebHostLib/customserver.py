@@ -7,20 +7,23 @@ import functools
 import logging
 import multiprocessing
 import pickle
+import queue
 import random
 import socket
 import threading
 import time
 import typing
 import sys
+import weakref
 
 import websockets
 from pony.orm import commit, db_session, select
 
 import Utils
 
-from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, load_server_cert
-from Utils import restricted_loads, cache_argsless
+from MultiServer import Context, server, auto_shutdown, ServerCommandProcessor, ClientMessageProcessor, \
+    load_server_cert, render_metrics, sample_loop_lag, serve_metrics
+from Utils import restricted_loads, cache_argsless, get_process_memory
 from .locker import Locker
 from .models import Command, GameDataPackage, Room, db
 
@@ -57,6 +60,86 @@ class DBCommandProcessor(ServerCommandProcessor):
         self.ctx.logger.info(text)
 
 
+command_poll_interval = 5  # seconds between checks for Commands if no notification arrives
+
+
+class DBCommandListener(threading.Thread):
+    """Delivers Commands from the database to all rooms of a hosting process, using a single query per check.
+    Checks right away when a room id is put into room_commands and every command_poll_interval as a fallback,
+    for Commands created by a web frontend that can't reach the autohost, as AUTOLAUNCHER_NOTIFY_PORT is not set."""
+
+    def __init__(self, contexts: typing.Dict[typing.Any, WebHostContext],
+                 room_commands: typing.Optional[multiprocessing.Queue] = None):
+        super().__init__(daemon=True)
+        self.contexts = contexts
+        self.room_commands = room_commands
+
+    def wait(self):
+        if not self.room_commands:
+            time.sleep(command_poll_interval)
+            return
+        try:
+            self.room_commands.get(block=True, timeout=command_poll_interval)
+        except queue.Empty:
+            return
+        # a single check covers all notifications that arrived in the meantime
+        while not self.room_commands.empty():
+            self.room_commands.get(block=True, timeout=None)
+
+    @db_session
+    def deliver(self, room_ids: typing.List[typing.Any]):
+        commands = select(command for command in Command if command.room.id in room_ids)
+        if commands:
+            for command in commands:
+                ctx = self.contexts.get(command.room.id, None)
+                if ctx is not None:
+                    ctx.main_loop.call_soon_threadsafe(DBCommandProcessor(ctx), command.commandtext)
+                command.delete()
+            commit()
+
+    def run(self):
+        while 1:
+            self.wait()
+            room_ids = list(self.contexts)
+            if room_ids:
+                try:
+                    self.deliver(room_ids)
+                except Exception as e:  # keep listening for all other rooms of this process
+                    logging.exception(e)
+
+
+class SharedGamesPackage(dict):
+    """GamesPackage loaded from the database, shared by all rooms of a hosting process that use its checksum.
+    Has to be treated as read-only, Context._load gets a shallow copy."""
+
+
+_game_data_packages: weakref.WeakValueDictionary[str, SharedGamesPackage] = weakref.WeakValueDictionary()
+""" checksum -> package, kept alive by the rooms using it """
+
+
+def get_game_data_package(checksum: str) -> typing.Optional[SharedGamesPackage]:
+    """Get a custom data package by checksum, only loading it from the database if no running room uses it yet.
+    Requires a db_session."""
+    package = _game_data_packages.get(checksum, None)
+    if package is None:
+        row = GameDataPackage.get(checksum=checksum)
+        if not row:
+            return None
+        package = _game_data_packages[checksum] = SharedGamesPackage(restricted_loads(row.data))
+    return package
+
+
+class RoomMetrics(typing.NamedTuple):
+    """Reported by room hosting processes to the autohost, which uses load to decide where to start new rooms."""
+    load: float
+    """ share of the last report interval spent handling client packages """
+    processing_time: float
+    """ total seconds spent handling client packages since the room started """
+    memory: int
+    """ growth of the hosting process' memory while loading the room, in bytes """
+    clients: int
+
+
 class WebHostContext(Context):
     room_id: int
 
@@ -71,6 +154,8 @@ class WebHostContext(Context):
         self.main_loop = asyncio.get_running_loop()
         self.video = {}
         self.tags = ["AP", "WebHost"]
+        self.shared_game_data_packages: typing.List[SharedGamesPackage] = []
+        self.memory = 0
 
     def __del__(self):
         try:
@@ -86,19 +171,6 @@ class WebHostContext(Context):
             setattr(self, key, value)
         self.non_hintable_names = collections.defaultdict(frozenset, self.non_hintable_names)
 
-    def listen_to_db_commands(self):
-        cmdprocessor = DBCommandProcessor(self)
-
-        while not self.exit_event.is_set():
-            with db_session:
-                commands = select(command for command in Command if command.room.id == self.room_id)
-                if commands:
-                    for command in commands:
-                        self.main_loop.call_soon_threadsafe(cmdprocessor, command.commandtext)
-                        command.delete()
-                    commit()
-            time.sleep(5)
-
     @db_session
     def load(self, room_id: int):
         self.room_id = room_id
@@ -127,9 +199,11 @@ class WebHostContext(Context):
                     # games package could be dropped from static data once all rooms embed data package
                     del multidata["datapackage"][game]
                 else:
-                    row = GameDataPackage.get(checksum=game_data["checksum"])
-                    if row:  # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
-                        game_data_packages[game] = restricted_loads(row.data)
+                    package = get_game_data_package(game_data["checksum"])
+                    # None if rolled on >= 0.3.9 but uploaded to <= 0.3.8. multidata should be complete
+                    if package is not None:
+                        self.shared_game_data_packages.append(package)  # keep it cached while this room runs
+                        game_data_packages[game] = dict(package)  # _load removes the groups from what it gets
                         continue
                     else:
                         self.logger.warning(f"Did not find game_data_package for {game}: {game_data['checksum']}")
@@ -154,7 +228,6 @@ class WebHostContext(Context):
             if savegame_data:
                 self.set_save(restricted_loads(Room.get(id=self.room_id).multisave))
             self._start_async_saving(atexit_save=False)
-        threading.Thread(target=self.listen_to_db_commands, daemon=True).start()
 
     @db_session
     def _save(self, exit_save: bool = False) -> bool:
@@ -181,8 +254,8 @@ def get_static_server_data() -> dict:
     import worlds
     data = {
         "non_hintable_names": {
-            world_name: world.hint_blacklist
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            game_name: manifest.hint_blacklist
+            for game_name, manifest in worlds.game_manifests.items()
         },
         "gamespackage": {
             world_name: {
@@ -193,12 +266,12 @@ def get_static_server_data() -> dict:
             for world_name, game_package in worlds.network_data_package["games"].items()
         },
         "item_name_groups": {
-            world_name: world.item_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: {group: frozenset(names) for group, names in game_package["item_name_groups"].items()}
+            for world_name, game_package in worlds.network_data_package["games"].items()
         },
         "location_name_groups": {
-            world_name: world.location_name_groups
-            for world_name, world in worlds.AutoWorldRegister.world_types.items()
+            world_name: {group: frozenset(names) for group, names in game_package["location_name_groups"].items()}
+            for world_name, game_package in worlds.network_data_package["games"].items()
         },
     }
 
@@ -225,9 +298,15 @@ def set_up_logging(room_id) -> logging.Logger:
     return logger
 
 
+metrics_interval = 10  # seconds between RoomMetrics reports
+
+
 def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                        cert_file: typing.Optional[str], cert_key_file: typing.Optional[str],
-                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue):
+                       host: str, rooms_to_run: multiprocessing.Queue, rooms_shutting_down: multiprocessing.Queue,
+                       room_metrics: typing.Optional[multiprocessing.Queue] = None,
+                       room_commands: typing.Optional[multiprocessing.Queue] = None,
+                       metrics_port: typing.Optional[int] = None):
     from setproctitle import setproctitle
 
     setproctitle(name)
@@ -271,14 +350,38 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
     gc.collect()  # free intermediate objects used during setup
 
     loop = asyncio.get_event_loop()
+    contexts: typing.Dict[typing.Any, WebHostContext] = {}
+
+    async def report_metrics():
+        last_processing_times: typing.Dict[typing.Any, float] = {}
+        while 1:
+            await asyncio.sleep(metrics_interval)
+            metrics = {}
+            for room_id, ctx in contexts.items():
+                last_processing_time = last_processing_times.get(room_id, ctx.processing_time)
+                metrics[room_id] = RoomMetrics((ctx.processing_time - last_processing_time) / metrics_interval,
+                                               ctx.processing_time, ctx.memory, len(ctx.endpoints))
+            last_processing_times = {room_id: room.processing_time for room_id, room in metrics.items()}
+            room_metrics.put(metrics)
+
+    def render_room_metrics() -> str:
+        rooms = dict(contexts)
+        lines = [render_metrics(rooms),
+                 "# HELP archipelago_room_load_memory_bytes Growth of the process' memory while loading the room.",
+                 "# TYPE archipelago_room_load_memory_bytes gauge"]
+        for room_id, ctx in rooms.items():
+            lines.append(f'archipelago_room_load_memory_bytes{{room="{room_id}"}} {ctx.memory}')
+        return "\n".join(lines) + "\n"
 
     async def start_room(room_id):
         with Locker(f"RoomLocker {room_id}"):
             try:
                 logger = set_up_logging(room_id)
                 ctx = WebHostContext(static_server_data, logger)
+                memory_before = get_process_memory()
                 ctx.load(room_id)
                 ctx.init_save()
+                ctx.memory = max(0, get_process_memory() - memory_before)
                 assert ctx.server is None
                 try:
                     ctx.server = websockets.serve(
@@ -306,6 +409,7 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                         room.last_port = port
                 else:
                     ctx.logger.exception("Could not determine port. Likely hosting failure.")
+                contexts[room_id] = ctx  # only receives commands once its server is up
                 with db_session:
                     ctx.auto_shutdown = Room.get(id=room_id).timeout
                 if ctx.saving:
@@ -330,6 +434,9 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
                     setattr(asyncio.current_task(), "save", None)
             finally:
                 try:
+                    if contexts.pop(room_id, None) is not None:
+                        ctx.logger.info(f"Room spent {ctx.processing_time:.2f} seconds handling client packages "
+                                        f"and took {Utils.format_SI_prefix(ctx.memory, 1024)}iB to load.")
                     ctx.save_dirty = False  # make sure the saving thread does not write to DB after final wakeup
                     ctx.exit_event.set()  # make sure the saving thread stops at some point
                     # NOTE: async saving should probably be an async task and could be merged with shutdown_task
@@ -367,6 +474,13 @@ def run_server_process(name: str, ponyconfig: dict, static_server_data: dict,
     starter = Starter()
     starter.daemon = True
     starter.start()
+    DBCommandListener(contexts, room_commands).start()
+    if room_metrics:
+        loop.create_task(report_metrics())
+    loop.create_task(sample_loop_lag())
+    if metrics_port is not None:
+        loop.run_until_complete(serve_metrics("127.0.0.1", metrics_port, render_room_metrics))
+        logging.info(f"Serving metrics of {name} at http://127.0.0.1:{metrics_port}/metrics")
     try:
         loop.run_forever()
     finally:
@@ -3,6 +3,7 @@ import json
 import os
 import random
 import tempfile
+import time
 import zipfile
 from collections import Counter
 from pickle import PicklingError
@@ -14,7 +15,7 @@ from pony.orm import commit, db_session
 from BaseClasses import get_seed, seeddigits
 from Generate import PlandoOptions, handle_name
 from Main import main as ERmain
-from Utils import __version__, restricted_dumps
+from Utils import __version__, restricted_dumps, get_process_memory
 from WebHostLib import app
 from settings import ServerOptions, GeneratorOptions
 from worlds.alttp.EntranceRandomizer import parse_arguments
@@ -96,6 +97,8 @@ def start_generation(options: dict[str, dict | str], meta: dict[str, Any]):
             return render_template("seedError.html", seed_error=("PicklingError: " + str(e)))
 
         commit()
+        from .autolauncher import notify_generation_queued
+        notify_generation_queued()
 
         return redirect(url_for("wait_seed", seed=gen.id))
     else:
@@ -116,6 +119,12 @@ def gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None,
 
     meta.setdefault("server_options", {}).setdefault("hint_cost", 10)
     race = meta.setdefault("generator_options", {}).setdefault("race", False)
+    start_time = time.perf_counter()
+
+    def get_job_stats() -> dict[str, float | int]:
+        """Wall time of this job and memory of the generating process, added to Generation and Seed meta."""
+        return {"generation_time": round(time.perf_counter() - start_time, 3),
+                "generation_memory": get_process_memory()}
 
     def task():
         target = tempfile.TemporaryDirectory()
@@ -160,7 +169,7 @@ def gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None,
             raise Exception(f"Names have to be unique. Names: {Counter(erargs.name.values())}")
         ERmain(erargs, seed, baked_server_options=meta["server_options"])
 
-        return upload_to_db(target.name, sid, owner, race)
+        return upload_to_db(target.name, sid, owner, race, get_job_stats())
     thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     thread = thread_pool.submit(task)
 
@@ -176,6 +185,7 @@ def gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None,
                     meta["error"] = (
                             "Allowed time for Generation exceeded, please consider generating locally instead. " +
                             e.__class__.__name__ + ": " + str(e))
+                    meta.update(get_job_stats())
                     gen.meta = json.dumps(meta)
                     commit()
     except BaseException as e:
@@ -186,6 +196,7 @@ def gen_game(gen_options: dict, meta: dict[str, Any] | None = None, owner=None,
                     gen.state = STATE_ERROR
                     meta = json.loads(gen.meta)
                     meta["error"] = (e.__class__.__name__ + ": " + str(e))
+                    meta.update(get_job_stats())
                     gen.meta = json.dumps(meta)
                     commit()
         raise
@@ -206,13 +217,13 @@ def wait_seed(seed: UUID):
     return render_template("waitSeed.html", seed_id=seed_id)
 
 
-def upload_to_db(folder, sid, owner, race):
+def upload_to_db(folder, sid, owner, race, job_stats: dict[str, float | int] | None = None):
     for file in os.listdir(folder):
         file = os.path.join(folder, file)
         if file.endswith(".zip"):
             with db_session:
                 with zipfile.ZipFile(file) as zfile:
-                    res = upload_zip_to_db(zfile, owner, {"race": race}, sid)
+                    res = upload_zip_to_db(zfile, owner, {"race": race, **(job_stats or {})}, sid)
                 if type(res) == "str":
                     raise Exception(res)
                 elif res:
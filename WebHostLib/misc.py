@@ -9,6 +9,7 @@ from werkzeug.utils import secure_filename
 
 from worlds.AutoWorld import AutoWorldRegister, World
 from . import app, cache
+from .autolauncher import notify_room_activity, notify_room_command
 from .models import Seed, Room, Command, UUID, uuid4
 from Utils import title_sorted
 
@@ -247,6 +248,7 @@ def host_room_command(room: UUID):
         if cmd:
             Command(room=room, commandtext=cmd)
             commit()
+            notify_room_command(room.id)
     return redirect(url_for("host_room", room=room.id))
 
 
@@ -262,6 +264,8 @@ def host_room(room: UUID):
                       or room.last_activity < now - datetime.timedelta(seconds=room.timeout))
     with db_session:
         room.last_activity = now  # will trigger a spinup, if it's not already running
+    if should_refresh:
+        notify_room_activity()
 
     browser_tokens = "Mozilla", "Chrome", "Safari"
     automated = ("update" in request.args
@@ -1,5 +1,7 @@
 import datetime
 import collections
+import functools
+import hashlib
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, NamedTuple, Counter
 from uuid import UUID
@@ -12,12 +14,13 @@ from MultiServer import Context, get_saving_second
 from NetUtils import ClientStatus, Hint, NetworkItem, NetworkSlot, SlotType
 from Utils import restricted_loads, KeyedDefaultDict
 from . import app, cache
-from .models import GameDataPackage, Room
+from .models import GameDataPackage, Room, Seed
 
 # Multisave is currently updated, at most, every minute.
 TRACKER_CACHE_TIMEOUT_IN_SECONDS = 60
+# Number of decoded multidata, multisave and data package name maps kept in memory per web process.
+TRACKER_DATA_CACHE_SIZE = 64
 
-_multidata_cache = {}
 _multiworld_trackers: Dict[str, Callable] = {}
 _player_trackers: Dict[str, Callable] = {}
 
@@ -41,6 +44,47 @@ def _cache_results(func: Callable) -> Callable:
     return method_wrapper
 
 
+class GameNameMaps(NamedTuple):
+    item_id_to_name: Dict[int, str]
+    location_id_to_name: Dict[int, str]
+    item_name_to_id: Dict[str, int]
+    location_name_to_id: Dict[str, int]
+
+
+# The following are shared by all TrackerData of this process, so their results have to be treated as read-only.
+@functools.lru_cache(maxsize=TRACKER_DATA_CACHE_SIZE)
+def _get_multidata(seed_id: UUID) -> Dict[str, Any]:
+    """Decoded multidata of a seed, which never changes. Requires a db_session."""
+    return Context.decompress(Seed[seed_id].multidata)
+
+
+def _get_multisave(room: Room) -> Dict[str, Any]:
+    """Decoded multisave of a room. Requires a db_session."""
+    # saves on shutdown don't update last_activity, so only the data itself tells if it changed
+    return _decode_multisave(room.id, hashlib.sha1(room.multisave or b"").digest())
+
+
+@functools.lru_cache(maxsize=TRACKER_DATA_CACHE_SIZE)
+def _decode_multisave(room_id: UUID, digest: bytes) -> Dict[str, Any]:
+    """Decoded multisave of a room, keyed by the digest of the multisave that was just read. Requires a db_session."""
+    multisave = Room[room_id].multisave
+    return restricted_loads(multisave) if multisave else {}
+
+
+@functools.lru_cache(maxsize=TRACKER_DATA_CACHE_SIZE)
+def _get_game_name_maps(checksum: str) -> GameNameMaps:
+    """Lookup tables of a game's data package. Requires a db_session."""
+    game_package = restricted_loads(GameDataPackage.get(checksum=checksum).data)
+    return GameNameMaps(
+        KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
+            id: name for name, id in game_package["item_name_to_id"].items()}),
+        KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
+            id: name for name, id in game_package["location_name_to_id"].items()}),
+        game_package["item_name_to_id"],
+        game_package["location_name_to_id"],
+    )
+
+
 @dataclass
 class TrackerData:
     """A helper dataclass that is instantiated each time an HTTP request comes in for tracker data.
@@ -56,8 +100,8 @@ class TrackerData:
     def __init__(self, room: Room):
         """Initialize a new RoomMultidata object for the current room."""
         self.room = room
-        self._multidata = Context.decompress(room.seed.multidata)
-        self._multisave = restricted_loads(room.multisave) if room.multisave else {}
+        self._multidata = _get_multidata(room.seed.id)
+        self._multisave = _get_multisave(room)
         self._tracker_cache = {}
 
         self.item_name_to_id: Dict[str, Dict[str, int]] = {}
@@ -71,15 +115,13 @@ class TrackerData:
             game_name: KeyedDefaultDict(lambda code: f"Unknown Game {game_name} - Location (ID: {code})")
         })
         for game, game_package in self._multidata["datapackage"].items():
-            game_package = restricted_loads(GameDataPackage.get(checksum=game_package["checksum"]).data)
-            self.item_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Item (ID: {code})", {
-                id: name for name, id in game_package["item_name_to_id"].items()})
-            self.location_id_to_name[game] = KeyedDefaultDict(lambda code: f"Unknown Location (ID: {code})", {
-                id: name for name, id in game_package["location_name_to_id"].items()})
+            name_maps = _get_game_name_maps(game_package["checksum"])
+            self.item_id_to_name[game] = name_maps.item_id_to_name
+            self.location_id_to_name[game] = name_maps.location_id_to_name
 
             # Normal lookup tables as well.
-            self.item_name_to_id[game] = game_package["item_name_to_id"]
-            self.location_name_to_id[game] = game_package["location_name_to_id"]
+            self.item_name_to_id[game] = name_maps.item_name_to_id
+            self.location_name_to_id[game] = name_maps.location_name_to_id
 
     def get_seed_name(self) -> str:
         """Retrieves the seed name."""
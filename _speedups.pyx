@@ -26,10 +26,12 @@ cdef extern from *:
 
 ctypedef uint32_t ap_player_t  # on AMD64 this is faster (and smaller) than 64bit ints
 ctypedef uint32_t ap_flags_t
+ctypedef uint32_t ap_sphere_t
 ctypedef int64_t ap_id_t
 
 cdef ap_player_t MAX_PLAYER_ID = 1000000  # limit the size of indexing array
 cdef size_t INVALID_SIZE = <size_t>(-1)  # this is all 0xff... adding 1 results in 0, but it's not negative
+cdef ap_sphere_t NO_SPHERE = <ap_sphere_t>(-1)  # location is not part of any sphere
 
 # configure INTSET for player
 cdef extern from *:
@@ -62,6 +64,7 @@ cdef struct LocationEntry:
     ap_player_t receiver
     ap_id_t item
     ap_flags_t flags
+    ap_sphere_t sphere  # fills the padding after flags
 
 
 cdef struct IndexEntry:
@@ -168,6 +171,7 @@ cdef class LocationStore:
                 self.entries[i].receiver = data[1]
                 if len(data) > 2:
                     self.entries[i].flags = data[2]  # initialized to 0 during alloc
+                self.entries[i].sphere = NO_SPHERE
                 # Ignoring extra data. warn?
                 self.sender_index[sender].count += 1
                 i += 1
@@ -258,6 +262,33 @@ cdef class LocationStore:
                         all_locations[sender].add(entry.location)
         return all_locations
 
+    def set_spheres(self, spheres: Iterable[Dict[int, Set[int]]]) -> None:
+        """Store the sphere index of each location, spheres being {player: {location_id, ...}} in order.
+        Locations not in the store are ignored."""
+        cdef LocationEntry* entry
+        cdef ap_sphere_t sphere_index = 0
+        for sphere in spheres:
+            for player, locations in sphere.items():
+                if player < 1 or player >= self.sender_index_size:
+                    continue
+                proxy = <PlayerLocationProxy>self._raw_proxies[player]
+                for location in locations:
+                    entry = proxy._get(location)
+                    if entry:
+                        entry.sphere = sphere_index
+            sphere_index += 1
+
+    def get_sphere(self, slot: int, location: int) -> int:
+        """Get the sphere index of a location, raises KeyError if the location has no sphere."""
+        cdef LocationEntry* entry
+        cdef size_t sender = slot
+        if sender < 1 or sender >= self.sender_index_size:
+            raise KeyError(slot)
+        entry = (<PlayerLocationProxy>self._raw_proxies[sender])._get(location)
+        if not entry or entry.sphere == NO_SPHERE:
+            raise KeyError(location)
+        return entry.sphere
+
     def get_checked(self, state: State, team: int, slot: int) -> List[int]:
         cdef ap_player_t sender = slot
         if sender < 0 or sender >= self.sender_index_size:
@@ -180,14 +180,19 @@ class ERPlacementState:
     """A lookup table of all unconnected ER targets"""
     coupled: bool
     """Whether entrance randomization is operating in coupled mode"""
+    sweep_players: set[int]
+    """The players whose locations are swept for advancements, the randomizing player and its declared dependencies"""
 
-    def __init__(self, world: World, entrance_lookup: EntranceLookup, coupled: bool):
+    def __init__(self, world: World, entrance_lookup: EntranceLookup, coupled: bool,
+                 dependent_players: Iterable[int] = ()):
         self.placements = []
         self.pairings = []
         self.world = world
         self.coupled = coupled
-        self.collection_state = world.multiworld.get_all_state(False, True)
+        self.sweep_players = {world.player, *dependent_players}
+        self.collection_state = world.multiworld.get_all_state(allow_partial_entrances=True, perform_sweep=False)
         self.entrance_lookup = entrance_lookup
+        self.sweep()
 
     @property
     def placed_regions(self) -> set[Region]:
@@ -206,27 +211,59 @@ class ERPlacementState:
         self.world.random.shuffle(placeable_randomized_exits)
         return placeable_randomized_exits
 
+    def sweep(self, state: CollectionState | None = None) -> None:
+        """
+        Sweeps for advancements in the locations of the sweep players only, as the randomization doesn't change the
+        region graph of any other player.
+
+        :param state: The state to sweep, defaults to the ER state's collection_state
+        """
+        if state is None:
+            state = self.collection_state
+        location_cache = self.world.multiworld.regions.location_cache
+        state.sweep_for_advancements(itertools.chain.from_iterable(
+            location_cache[player].values() for player in sorted(self.sweep_players)))
+
+    def _update_reachable_regions(self, state: CollectionState, new_connections: Iterable[Entrance]) -> None:
+        """
+        Searches the region graph for regions made reachable by newly connected (or simulated) connections.
+        When the state was up-to-date before the connections were made, the search starts from them instead of every
+        blocked connection of the player.
+        """
+        player = self.world.player
+        if state.stale[player]:
+            state.update_reachable_regions(player)
+        else:
+            blocked_connections = state.blocked_connections[player]
+            state._update_reachable_regions_explicit_indirect_conditions(
+                player, deque(connection for connection in new_connections if connection in blocked_connections))
+
     def _connect_one_way(self, source_exit: Entrance, target_entrance: Entrance) -> None:
         target_region = target_entrance.connected_region
 
         target_region.entrances.remove(target_entrance)
         source_exit.connect(target_region)
 
-        self.collection_state.stale[self.world.player] = True
+        # no items changed, so an up-to-date state only needs to search from the new connection
+        self._update_reachable_regions(self.collection_state, (source_exit,))
         self.placements.append(source_exit)
         self.pairings.append((source_exit.name, target_entrance.name))
         self.entrance_lookup.remove(target_entrance)
 
     def test_speculative_connection(self, source_exit: Entrance, target_entrance: Entrance,
                                     usable_exits: set[Entrance]) -> bool:
-        copied_state = self.collection_state.copy()
+        player = self.world.player
+        target_region = target_entrance.connected_region
+        copied_state = self.collection_state.copy(self.sweep_players)
+        copied_state.stale[player] = self.collection_state.stale[player]
         # simulated connection. A real connection is unsafe because the region graph is shallow-copied and would
         # propagate back to the real multiworld.
-        copied_state.reachable_regions[self.world.player].add(target_entrance.connected_region)
-        copied_state.blocked_connections[self.world.player].remove(source_exit)
-        copied_state.blocked_connections[self.world.player].update(target_entrance.connected_region.exits)
-        copied_state.update_reachable_regions(self.world.player)
-        copied_state.sweep_for_advancements()
+        copied_state.reachable_regions[player].add(target_region)
+        copied_state.blocked_connections[player].remove(source_exit)
+        copied_state.blocked_connections[player].update(target_region.exits)
+        self._update_reachable_regions(copied_state, itertools.chain(
+            target_region.exits, self.world.multiworld.indirect_connections.get(target_region, ())))
+        self.sweep(copied_state)
         # test that at there are newly reachable randomized exits that are ACTUALLY reachable
         available_randomized_exits = copied_state.blocked_connections[self.world.player]
         for _exit in available_randomized_exits:
@@ -345,7 +382,8 @@ def randomize_entrances(
         preserve_group_order: bool = False,
         er_targets: list[Entrance] | None = None,
         exits: list[Entrance] | None = None,
-        on_connect: Callable[[ERPlacementState, list[Entrance], list[Entrance]], bool | None] | None = None
+        on_connect: Callable[[ERPlacementState, list[Entrance], list[Entrance]], bool | None] | None = None,
+        dependent_players: Iterable[int] = ()
 ) -> ERPlacementState:
     """
     Randomizes Entrances for a single world in the multiworld.
@@ -368,6 +406,9 @@ def randomize_entrances(
                        3. The entrances they were connected to.
                        If you use on_connect to make additional placements, you are expected to return True to inform
                        GER that an additional sweep is needed.
+    :param dependent_players: Other players whose locations can hold advancements required by your world's logic
+                              during randomization, e.g. items pre-placed into other worlds. Only your world and these
+                              players are swept for advancements.
     """
     if not world.explicit_indirect_conditions:
         raise EntranceRandomizationError("Entrance randomization requires explicit indirect conditions in order "
@@ -393,21 +434,21 @@ def randomize_entrances(
     er_state = ERPlacementState(
         world,
         EntranceLookup(world.random, coupled, exits_set, er_targets),
-        coupled
+        coupled,
+        dependent_players
     )
     # place the menu region and connected start region(s)
     er_state.collection_state.update_reachable_regions(world.player)
 
     def do_placement(source_exit: Entrance, target_entrance: Entrance) -> None:
+        # connect propagates the new connections
         placed_exits, paired_entrances = er_state.connect(source_exit, target_entrance)
-        # propagate new connections
-        er_state.collection_state.update_reachable_regions(world.player)
-        er_state.collection_state.sweep_for_advancements()
+        er_state.sweep()
         if on_connect:
             change = on_connect(er_state, placed_exits, paired_entrances)
             if change:
                 er_state.collection_state.update_reachable_regions(world.player)
-                er_state.collection_state.sweep_for_advancements()
+                er_state.sweep()
 
     def needs_speculative_sweep(dead_end: bool, require_new_exits: bool, placeable_exits: list[Entrance]) -> bool:
         # speculative sweep is expensive. We currently only do it as a last resort, if we might cap off the graph
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Set, Optional, Tuple
 from collections import defaultdict
 
 import Utils
+from worlds.generic.Rules import Rule
 from .analyzer import analyze_rule
 from .games import get_game_export_handler
 
@@ -790,6 +791,10 @@ def process_regions(multiworld, player: int, game_handler=None, location_name_to
             if not rule_func:
                 return None
 
+            # Declarative rule objects serialize themselves, no source analysis needed
+            if isinstance(rule_func, Rule):
+                return rule_func.to_dict()
+
             # Create cache key from function identity and context
             cache_key = (
                 id(rule_func),
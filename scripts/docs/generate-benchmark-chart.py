@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Script to generate charts from the generation benchmark history written by
+test/benchmark/generation.py, showing per-stage times and peak memory of the
+latest run, the change against the saved baseline and the trend over recent runs.
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """Load a benchmark history or baseline JSON file."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Error loading {path}: {e}")
+        return {}
+
+
+def format_change(new: float, old: Optional[float]) -> str:
+    """Relative change against the baseline, marked when it is a notable slowdown or speedup."""
+    if not old:
+        return "-"
+    change = (new - old) / old * 100
+    if change > 20:
+        return f"🔴 +{change:.0f}%"
+    if change < -20:
+        return f"🟢 {change:.0f}%"
+    return f"{change:+.0f}%"
+
+
+def get_stages(runs: List[Dict[str, Any]]) -> List[str]:
+    """All stage names of the runs, in generation order as far as the cases with the most stages tell."""
+    stages: Dict[str, None] = {}
+    cases = [case for run in runs for case in run.get('cases', {}).values()]
+    for case in sorted(cases, key=lambda case: -len(case.get('stages', {}))):
+        stages.update(dict.fromkeys(case.get('stages', {})))
+    return list(stages)
+
+
+def generate_benchmark_markdown(history: Dict[str, Any], baseline: Dict[str, Any], trend_runs: int = 10) -> str:
+    """Generate markdown tables for the latest run of the benchmark history."""
+    runs = history.get('runs', [])
+    md_content = "# Archipelago Generation Benchmark Chart\n\n"
+    md_content += "[← Back to Test Results Summary](./test-results-summary.md)\n\n"
+    if not runs:
+        return md_content + "No benchmark runs available.\n"
+
+    latest = runs[-1]
+    baseline_cases = baseline.get('cases', {})
+    md_content += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    md_content += f"**Latest Run:** {latest.get('timestamp', 'Unknown')} " \
+                  f"(version {latest.get('version', 'Unknown')}, seed {latest.get('seed', 'Unknown')})\n\n"
+    md_content += f"**Baseline:** {baseline.get('timestamp', 'None')}\n\n"
+
+    md_content += "## Latest Run\n\n"
+    md_content += "| Case | Players | Result | Total Time | vs Baseline | Peak Memory | vs Baseline |\n"
+    md_content += "|------|---------|--------|------------|-------------|-------------|-------------|\n"
+    for name, case in latest.get('cases', {}).items():
+        old_case = baseline_cases.get(name, {})
+        if old_case.get('templates') != case.get('templates') or old_case.get('error'):
+            old_case = {}
+        result = f"❌ {case['error']}" if case.get('error') else "✅"
+        md_content += f"| {name} | {len(case.get('templates', []))} | {result} | {case.get('time', 0):.2f}s | " \
+                      f"{format_change(case.get('time', 0), old_case.get('time'))} | " \
+                      f"{case.get('peak_memory', 0) / 1e6:.1f}MB | " \
+                      f"{format_change(case.get('peak_memory', 0), old_case.get('peak_memory'))} |\n"
+
+    stages = get_stages([latest])
+    md_content += "\n## Stage Times (seconds)\n\n"
+    md_content += "| Case | " + " | ".join(stages) + " |\n"
+    md_content += "|------|" + "|".join("-" * (len(stage) + 2) for stage in stages) + "|\n"
+    for name, case in latest.get('cases', {}).items():
+        if case.get('error'):
+            continue
+        times = [case['stages'].get(stage, {}).get('time') for stage in stages]
+        md_content += f"| {name} | " + " | ".join("-" if time is None else f"{time:.3f}" for time in times) + " |\n"
+
+    md_content += "\n## Stage Peak Memory (MB)\n\n"
+    md_content += "| Case | " + " | ".join(stages) + " |\n"
+    md_content += "|------|" + "|".join("-" * (len(stage) + 2) for stage in stages) + "|\n"
+    for name, case in latest.get('cases', {}).items():
+        if case.get('error'):
+            continue
+        peaks = [case['stages'].get(stage, {}).get('peak_memory') for stage in stages]
+        md_content += f"| {name} | " + " | ".join("-" if peak is None else f"{peak / 1e6:.1f}"
+                                                  for peak in peaks) + " |\n"
+
+    recent = runs[-trend_runs:]
+    md_content += f"\n## Trend (total seconds, last {len(recent)} runs)\n\n"
+    md_content += "| Case | " + " | ".join(run.get('timestamp', '?') for run in recent) + " |\n"
+    md_content += "|------|" + "|".join("---" for _ in recent) + "|\n"
+    for name in latest.get('cases', {}):
+        cells = []
+        for run in recent:
+            case = run.get('cases', {}).get(name)
+            cells.append("-" if not case or case.get('error') else f"{case.get('time', 0):.2f}")
+        md_content += f"| {name} | " + " | ".join(cells) + " |\n"
+
+    md_content += "\n## Notes\n\n"
+    md_content += "- **vs Baseline:** 🔴 more than 20% slower or bigger, 🟢 more than 20% faster or smaller\n"
+    md_content += "- Mixes whose templates differ from the baseline's are not compared\n"
+    md_content += "- Times include the overhead of tracing memory allocations\n"
+    return md_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate charts from the generation benchmark history')
+    parser.add_argument('--history', type=str, default='benchmarks/generation_history.json',
+                        help='Benchmark history JSON file path')
+    parser.add_argument('--baseline', type=str, default='benchmarks/generation_baseline.json',
+                        help='Benchmark baseline JSON file path')
+    parser.add_argument('--output-file', type=str,
+                        default='docs/json/developer/test-results/benchmark-generation.md',
+                        help='Output markdown file path')
+    parser.add_argument('--trend-runs', type=int, default=10, help='Number of runs shown in the trend table')
+    args = parser.parse_args()
+
+    # Script is at scripts/docs/generate-benchmark-chart.py, go up 3 levels to reach project root
+    project_root = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+    history = load_json(os.path.join(project_root, args.history))
+    if not history:
+        return 1
+    baseline_path = os.path.join(project_root, args.baseline)
+    baseline = load_json(baseline_path) if os.path.exists(baseline_path) else {}
+
+    md_content = generate_benchmark_markdown(history, baseline, args.trend_runs)
+    output_path = os.path.join(project_root, args.output_file)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w') as f:
+        f.write(md_content)
+    print(f"Chart saved to: {output_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
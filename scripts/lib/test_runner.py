@@ -14,9 +14,10 @@ This module contains the main test execution logic for:
 import json
 import os
 import shutil
+import tempfile
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from .seed_utils import get_seed_id as compute_seed_id
 
 try:
@@ -52,8 +53,11 @@ def log_memory_usage(template_name: str, stage: str):
         print(f"  [Memory] Warning: Could not get memory info: {e}")
 
 
-def test_template_single_seed(template_file: str, templates_dir: str, project_root: str, world_mapping: Dict[str, Dict], seed: str = "1", export_only: bool = False, test_only: bool = False, multiplayer: bool = False, single_client: bool = False, headed: bool = False, include_error_details: bool = False, dry_run: bool = False) -> Dict:
-    """Test a single template file and return results."""
+def test_template_single_seed(template_file: str, templates_dir: str, project_root: str, world_mapping: Dict[str, Dict], seed: str = "1", export_only: bool = False, test_only: bool = False, multiplayer: bool = False, single_client: bool = False, headed: bool = False, include_error_details: bool = False, dry_run: bool = False, generation_output: Optional[Tuple[int, str, float]] = None) -> Dict:
+    """Test a single template file and return results.
+
+    If generation_output (return code, output, seconds) is given, it is used instead of running Generate.py.
+    """
     template_name = os.path.basename(template_file)
     game_name = normalize_game_name(template_name)
 
@@ -158,26 +162,32 @@ def test_template_single_seed(template_file: str, templates_dir: str, project_ro
             result['dry_run'] = True
             return result
 
-        print(f"Running Generate.py for {template_name}...")
-        # Ensure template name has .yaml extension for the file path
-        template_file = template_name if template_name.endswith(('.yaml', '.yml')) else f"{template_name}.yaml"
-        # Use the provided templates_dir, which is relative to Players/ directory
-        template_path = os.path.join(templates_dir, template_file)
-        generate_cmd = [
-            "python", "Generate.py",
-            "--weights_file_path", template_path,
-            "--multi", "1",
-            "--seed", seed
-        ]
+        if generation_output is not None:
+            # Already generated by a seed sweep, see run_generation_sweep
+            print(f"Using sweep generation output for {template_name}...")
+            gen_return_code, gen_stdout, gen_processing_time = generation_output
+            gen_stderr = ""
+        else:
+            print(f"Running Generate.py for {template_name}...")
+            # Ensure template name has .yaml extension for the file path
+            template_file = template_name if template_name.endswith(('.yaml', '.yml')) else f"{template_name}.yaml"
+            # Use the provided templates_dir, which is relative to Players/ directory
+            template_path = os.path.join(templates_dir, template_file)
+            generate_cmd = [
+                "python", "Generate.py",
+                "--weights_file_path", template_path,
+                "--multi", "1",
+                "--seed", seed
+            ]
 
-        # Show the command being run
-        print(f"  Command: {' '.join(generate_cmd)}")
+            # Show the command being run
+            print(f"  Command: {' '.join(generate_cmd)}")
 
-        # Time the generation process
-        gen_start_time = time.time()
-        gen_return_code, gen_stdout, gen_stderr = run_command(generate_cmd, cwd=project_root, timeout=600)
-        gen_end_time = time.time()
-        gen_processing_time = round(gen_end_time - gen_start_time, 2)
+            # Time the generation process
+            gen_start_time = time.time()
+            gen_return_code, gen_stdout, gen_stderr = run_command(generate_cmd, cwd=project_root, timeout=600)
+            gen_end_time = time.time()
+            gen_processing_time = round(gen_end_time - gen_start_time, 2)
 
         # Write generate output to file
         generate_output_file = os.path.join(project_root, "generate_output.txt")
@@ -458,8 +468,51 @@ def test_template_single_seed(template_file: str, templates_dir: str, project_ro
     return result
 
 
-def test_template_seed_range(template_file: str, templates_dir: str, project_root: str, world_mapping: Dict[str, Dict], seed_list: List[int], export_only: bool = False, test_only: bool = False, stop_on_failure: bool = False, multiplayer: bool = False, single_client: bool = False, headed: bool = False, include_error_details: bool = False, dry_run: bool = False) -> Dict:
-    """Test a template file with multiple seeds and return aggregated results."""
+def run_generation_sweep(template_name: str, templates_dir: str, project_root: str, seed_list: List[int]) -> Dict[str, Tuple[int, str, float]]:
+    """
+    Generate every seed of seed_list with one Generate.py --seeds run, which imports the worlds once and
+    forks a process per seed. Returns seed -> (return code, output, seconds), missing seeds did not finish.
+    """
+    template_file = template_name if template_name.endswith(('.yaml', '.yml')) else f"{template_name}.yaml"
+    template_path = os.path.join(templates_dir, template_file)
+    seed_output_dir = tempfile.mkdtemp(prefix="seed_sweep_")
+    generate_cmd = [
+        "python", "Generate.py",
+        "--weights_file_path", template_path,
+        "--multi", "1",
+        "--seeds", ",".join(str(seed) for seed in seed_list),
+        "--seed_output_dir", seed_output_dir
+    ]
+
+    print(f"Running Generate.py seed sweep for {template_name}...")
+    print(f"  Command: {' '.join(generate_cmd)}")
+
+    try:
+        sweep_return_code, sweep_stdout, sweep_stderr = run_command(
+            generate_cmd, cwd=project_root, timeout=600 * len(seed_list))
+        results_file = os.path.join(seed_output_dir, "sweep_results.json")
+        if not os.path.exists(results_file):
+            print(f"Seed sweep failed with return code {sweep_return_code}")
+            # Report the failure on every seed, like a failed Generate.py run
+            return {str(seed): (sweep_return_code or 1, sweep_stdout + "\n" + sweep_stderr, 0) for seed in seed_list}
+
+        with open(results_file, 'r') as f:
+            sweep_results = json.load(f)
+
+        outputs = {}
+        for seed, seed_result in sweep_results.items():
+            with open(os.path.join(seed_output_dir, f"{seed}.txt"), 'r', errors='replace') as f:
+                outputs[seed] = (seed_result['return_code'], f.read(), seed_result['processing_time_seconds'])
+        return outputs
+    finally:
+        shutil.rmtree(seed_output_dir, ignore_errors=True)
+
+
+def test_template_seed_range(template_file: str, templates_dir: str, project_root: str, world_mapping: Dict[str, Dict], seed_list: List[int], export_only: bool = False, test_only: bool = False, stop_on_failure: bool = False, multiplayer: bool = False, single_client: bool = False, headed: bool = False, include_error_details: bool = False, dry_run: bool = False, fork_seeds: bool = False) -> Dict:
+    """Test a template file with multiple seeds and return aggregated results.
+
+    With fork_seeds, all seeds are generated up front by one Generate.py seed sweep (see run_generation_sweep).
+    """
     template_name = os.path.basename(template_file)
 
     print(f"\n=== Testing {template_name} with {len(seed_list)} seeds ===")
@@ -494,6 +547,10 @@ def test_template_seed_range(template_file: str, templates_dir: str, project_roo
         seed_range_result['dry_run'] = True
         return seed_range_result
 
+    sweep_outputs = {}
+    if fork_seeds and not test_only:
+        sweep_outputs = run_generation_sweep(template_name, templates_dir, project_root, seed_list)
+
     for i, seed in enumerate(seed_list, 1):
         print(f"\n--- Seed {seed} ({i}/{len(seed_list)}) ---")
 
@@ -502,7 +559,7 @@ def test_template_seed_range(template_file: str, templates_dir: str, project_roo
             result = test_template_single_seed(
                 template_file, templates_dir, project_root, world_mapping,
                 str(seed), export_only, test_only, multiplayer, single_client, headed,
-                include_error_details, dry_run
+                include_error_details, dry_run, sweep_outputs.get(str(seed))
             )
 
             seed_range_result['individual_results'][str(seed)] = result
@@ -173,6 +173,11 @@ def main():
         action='store_true',
         help='When testing seed ranges, continue testing all seeds even after failures (default is to stop at first failure)'
     )
+    parser.add_argument(
+        '--fork-seeds',
+        action='store_true',
+        help='When testing seed ranges, generate all seeds of a template with one Generate.py --seeds sweep, which imports the worlds once and forks each seed (Unix only, falls back to one seed after another elsewhere)'
+    )
     parser.add_argument(
         '-p', '--post-process',
         action='store_true',
@@ -868,7 +873,7 @@ def main():
                             stop_on_failure=True,  # Stop on first failure in retest mode
                             multiplayer=args.multiplayer, single_client=args.single_client,
                             headed=args.headed, include_error_details=args.include_error_details,
-                            dry_run=args.dry_run
+                            dry_run=args.dry_run, fork_seeds=args.fork_seeds
                         )
                     else:
                         # Failing seed is >= retest_continue, just test the failing seed
@@ -910,7 +915,7 @@ def main():
                                 stop_on_failure=True,  # Stop on first failure in retest mode
                                 multiplayer=args.multiplayer, single_client=args.single_client,
                                 headed=args.headed, include_error_details=args.include_error_details,
-                                dry_run=args.dry_run
+                                dry_run=args.dry_run, fork_seeds=args.fork_seeds
                             )
                         else:
                             # Already tested up to or past retest_continue, nothing to do
@@ -981,7 +986,7 @@ def main():
                     stop_on_failure=not args.seed_range_continue_on_failure,
                     multiplayer=args.multiplayer, single_client=args.single_client,
                     headed=args.headed, include_error_details=args.include_error_details,
-                    dry_run=args.dry_run
+                    dry_run=args.dry_run, fork_seeds=args.fork_seeds
                 )
             else:
                 # Test with single seed (normal mode)
@@ -25,24 +25,23 @@ __all__ = [
 no_gui = False
 skip_required_files = False
 skip_autosave = False
-_world_settings_name_cache: dict[str, str] = {}  # TODO: cache on disk and update when worlds change
+_world_settings_name_cache: dict[str, str] = {}
 _world_settings_name_cache_updated = False
 _lock = Lock()
 
 
 def _update_cache() -> None:
-    """Load all worlds and update world_settings_name_cache"""
+    """Update world_settings_name_cache from the world manifest"""
     global _world_settings_name_cache_updated
     if _world_settings_name_cache_updated:
         return
 
     try:
-        from worlds.AutoWorld import AutoWorldRegister
-        for world in AutoWorldRegister.world_types.values():
-            annotation = world.__annotations__.get("settings", None)
-            if annotation is None or annotation == "ClassVar[Optional['Group']]":
-                continue
-            _world_settings_name_cache[world.settings_key] = f"{world.__module__}.{world.__name__}"
+        from worlds import game_manifests
+        for manifest in game_manifests.values():
+            if manifest.settings:
+                settings_key, world_name = manifest.settings
+                _world_settings_name_cache[settings_key] = world_name
     finally:
         _world_settings_name_cache_updated = True
 
@@ -614,6 +613,12 @@ class ServerOptions(Group):
         OFF = 0
         ON = 1
 
+    class MetricsPort(int):
+        """
+        Local port to serve Prometheus metrics on, at http://localhost:<port>/metrics, 0 to disable
+        The /metrics server command shows a summary either way
+        """
+
     host: str | None = None
     port: int = 38281
     password: str | None = None
@@ -632,6 +637,7 @@ class ServerOptions(Group):
     auto_shutdown: AutoShutdown = AutoShutdown(0)
     compatibility: Compatibility = Compatibility(2)
     log_network: LogNetwork = LogNetwork(0)
+    metrics_port: MetricsPort = MetricsPort(0)
 
 
 class GeneratorOptions(Group):
@@ -691,6 +697,14 @@ class GeneratorOptions(Group):
         start_inventory -> Move remaining items to start_inventory, generate additional filler items to fill locations.
         """
 
+    class RollProcesses(int):
+        """
+        Number of processes used to read player files and roll their options.
+        0 picks automatically based on player count and CPU cores, 1 rolls in the generator process.
+        Rolling in more than one process gives each player file its own random state, so the same seed rolls
+        different options than in a single process.
+        """
+
     enemizer_path: EnemizerPath = EnemizerPath("EnemizerCLI/EnemizerCLI.Core")  # + ".exe" is implied on Windows
     player_files_path: PlayerFilesPath = PlayerFilesPath("Players")
     players: Players = Players(0)
@@ -700,6 +714,7 @@ class GeneratorOptions(Group):
     race: Race = Race(0)
     plando_options: PlandoOptions = PlandoOptions("bosses, connections, texts")
     panic_method: PanicMethod = PanicMethod("swap")
+    roll_processes: RollProcesses = RollProcesses(0)
     loglevel: str = "info"
     logtime: bool = False
 
@@ -769,9 +784,10 @@ class Settings(Group):
                 # not a world group
                 return super().__getattribute__(key)
             # directly import world and grab settings class
+            from worlds import import_world_module
             world_mod, world_cls_name = _world_settings_name_cache[key].rsplit(".", 1)
             try:
-                world = cast(type, getattr(__import__(world_mod, fromlist=[world_cls_name]), world_cls_name))
+                world = cast(type, getattr(import_world_module(world_mod), world_cls_name))
             except AttributeError:
                 import warnings
                 warnings.warn(f"World {world_cls_name} failed to initialize properly.")
@@ -788,7 +804,7 @@ class Settings(Group):
                 cls_name = cls_or_name
                 if "[" in cls_name:  # resolve ClassVar[]
                     cls_name = cls_name.split("[", 1)[1].rsplit("]", 1)[0]
-                cls = cast(type, getattr(__import__(world_mod, fromlist=[cls_name]), cls_name))
+                cls = cast(type, getattr(import_world_module(world_mod), cls_name))
             else:
                 type_args = typing.get_args(cls_or_name)  # resolve ClassVar[]
                 cls = type_args[0] if type_args else cast(type, cls_or_name)
@@ -0,0 +1,50 @@
+def run_data_storage_benchmark(clients: int = 50, sets_per_client: int = 200, keys: int = 5):
+    """Connect synthetic clients to a local server, have all of them watch the same keys with SetNotify
+    and then Set those keys as fast as possible, like trackers and Bounce-heavy mods do."""
+    import asyncio
+    import logging
+
+    from time_it import TimeIt
+    from server_harness import SyntheticClient, create_multidata, start_local_server
+
+    from Utils import init_logging
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    async def main():
+        ctx, port = await start_local_server(create_multidata(clients, 10))
+        ctx.logger = logging.getLogger("Server")
+        ctx.logger.setLevel(logging.WARNING)
+        synthetic_clients = [SyntheticClient(port, slot) for slot in range(1, clients + 1)]
+        await asyncio.gather(*(client.connect(tags=("Tracker",)) for client in synthetic_clients))
+        key_names = [f"benchmark_{key}" for key in range(keys)]
+        for client in synthetic_clients:
+            await client.send({"cmd": "SetNotify", "keys": key_names}, {"cmd": "Get", "keys": key_names})
+        # the Get round trip guarantees every SetNotify is registered before the first Set arrives
+        await asyncio.gather(*(client.wait_for("Retrieved") for client in synthetic_clients))
+
+        async def set_keys(client: SyntheticClient):
+            for i in range(sets_per_client):
+                # bulk Set, one message with one package per key
+                await client.send(*({"cmd": "Set", "key": key, "default": 0,
+                                     "operations": [{"operation": "add", "value": 1}]} for key in key_names))
+
+        total_sets = clients * sets_per_client * keys
+        with TimeIt(f"{total_sets} Set operations by {clients} clients on {keys} keys", logger) as t:
+            await asyncio.gather(*(set_keys(client) for client in synthetic_clients))
+            await asyncio.gather(*(client.wait_for("SetReply", total_sets) for client in synthetic_clients))
+        logger.info(f"{total_sets / t.dif:.0f} Set/s, {total_sets * clients / t.dif:.0f} SetReply/s delivered.")
+        assert all(ctx.stored_data[key] == clients * sets_per_client for key in key_names)
+
+        for client in synthetic_clients:
+            await client.close()
+        ctx.exit_event.set()
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_data_storage_benchmark()
@@ -0,0 +1,231 @@
+import typing
+
+stage_messages: typing.Tuple[typing.Tuple[str, typing.Optional[str]], ...] = (
+    ("Creating MultiWorld.", "create_regions"),
+    ("Creating Items.", "create_items"),
+    ("Calculating Access Rules.", "set_rules"),
+    ("Running Item Plando.", "plando"),
+    ("Running Pre Main Fill.", "pre_fill"),
+    ("Filling the multiworld", "fill"),
+    ("Balancing multiworld progression", "balancing"),
+    ("Beginning output", "output"),
+    ("Calculating playthrough.", "spoiler"),
+    ("Exporting game rules.", "export"),
+    ("Creating final archive", "archive"),
+    ("Done.", None),
+)
+""" Main.main log messages starting a new stage, with the name of that stage """
+
+
+def generate_case(yaml_paths: typing.List[str], seed: int, spoiler: int) -> typing.Dict[str, typing.Any]:
+    """Generate a seed for yaml_paths, recording time and peak traced memory of each stage.
+    Meant to run in a fresh process, so cases don't share caches or memory."""
+    import logging
+    import os
+    import shutil
+    import sys
+    import tempfile
+    import time
+    import tracemalloc
+
+    class StageRecorder(logging.Handler):
+        def __init__(self) -> None:
+            super().__init__(logging.INFO)
+            self.stages: typing.Dict[str, typing.Dict[str, float]] = {}
+            self.stage: typing.Optional[str] = None
+            self.start = 0.0
+
+        def begin(self, stage: typing.Optional[str]) -> None:
+            if self.stage:
+                record = self.stages.setdefault(self.stage, {"time": 0.0, "peak_memory": 0})
+                record["time"] += time.perf_counter() - self.start
+                record["peak_memory"] = max(record["peak_memory"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self.stage = stage
+            self.start = time.perf_counter()
+
+        def emit(self, record: logging.LogRecord) -> None:
+            message = record.getMessage()
+            for prefix, stage in stage_messages:
+                if message.startswith(prefix):
+                    self.begin(stage)
+                    break
+
+    import Generate
+    import Main
+
+    recorder = StageRecorder()
+    error: typing.Optional[str] = None
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        player_files_path = os.path.join(temp_dir, "Players")
+        os.makedirs(player_files_path)
+        for index, path in enumerate(yaml_paths):
+            shutil.copyfile(path, os.path.join(player_files_path, f"{index:03}_{os.path.basename(path)}"))
+        sys.argv = [sys.argv[0], "--seed", str(seed), "--player_files_path", player_files_path,
+                    "--outputpath", temp_dir, "--spoiler", str(spoiler), "--log_level", "info"]
+        root_logger = logging.getLogger()
+        try:
+            recorder.begin("roll")
+            args, seed = Generate.main()
+            for handler in root_logger.handlers:
+                if type(handler) is logging.StreamHandler:
+                    handler.setLevel(logging.WARNING)  # keep the console readable, stages are found through records
+            root_logger.addHandler(recorder)
+            recorder.begin("generate_early")
+            Main.main(args, seed)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logging.exception(e)
+        finally:
+            recorder.begin(None)
+            root_logger.removeHandler(recorder)
+            tracemalloc.stop()
+
+    return {
+        "error": error,
+        "time": sum(stage["time"] for stage in recorder.stages.values()),
+        "peak_memory": max((stage["peak_memory"] for stage in recorder.stages.values()), default=0),
+        "stages": recorder.stages,
+    }
+
+
+def compare_to_baseline(run: typing.Dict[str, typing.Any], baseline: typing.Dict[str, typing.Any],
+                        threshold: float, min_time: float = 0.05, min_memory: int = 1 << 20) -> typing.List[str]:
+    """Describe every stage of run that got slower or used more memory than in baseline by more than threshold.
+    Differences below min_time seconds or min_memory bytes are treated as noise."""
+    regressions: typing.List[str] = []
+    for name, case in run["cases"].items():
+        old_case = baseline["cases"].get(name)
+        if not old_case or case["error"] or old_case["error"] or case["templates"] != old_case["templates"]:
+            continue
+        for stage, result in case["stages"].items():
+            old_result = old_case["stages"].get(stage)
+            if not old_result:
+                continue
+            new_time, old_time = result["time"], old_result["time"]
+            if new_time > old_time * (1 + threshold) and new_time - old_time > min_time:
+                regressions.append(f"{name} {stage}: {old_time:.3f}s -> {new_time:.3f}s")
+            new_memory, old_memory = result["peak_memory"], old_result["peak_memory"]
+            if new_memory > old_memory * (1 + threshold) and new_memory - old_memory > min_memory:
+                regressions.append(f"{name} {stage}: {old_memory / 1e6:.1f}MB -> {new_memory / 1e6:.1f}MB peak")
+    return regressions
+
+
+def run_generation_benchmark(games: typing.Optional[typing.Sequence[str]] = None,
+                             mix_sizes: typing.Sequence[int] = (10, 50, 200), seed: int = 0, spoiler: int = 2,
+                             history_path: typing.Optional[str] = None, baseline_path: typing.Optional[str] = None,
+                             save_baseline: bool = False, threshold: float = 0.2) -> bool:
+    """Generate a fixed matrix of seeds from the game templates: every template on its own, then mixes of
+    `mix_sizes` players drawn from the templates that generated on their own.
+    Time and peak memory per generation stage are appended to a JSON history and compared against a saved baseline.
+    Returns False if any stage regressed by more than `threshold`. Stage times include tracemalloc's overhead."""
+    import concurrent.futures
+    import datetime
+    import json
+    import logging
+    import multiprocessing
+    import os
+    import random
+    import tempfile
+
+    from Options import generate_yaml_templates
+    from scripts.lib.test_utils import load_template_exclude_list
+    from Utils import __version__, init_logging, user_path
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+    history_path = history_path or user_path("benchmarks", "generation_history.json")
+    baseline_path = baseline_path or user_path("benchmarks", "generation_baseline.json")
+
+    cases: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+
+    def run_cases(matrix: typing.Dict[str, typing.List[str]]) -> None:
+        # a fresh process per case, so imports, caches and memory of earlier cases don't leak into its numbers
+        with concurrent.futures.ProcessPoolExecutor(1, multiprocessing.get_context("spawn"),
+                                                    max_tasks_per_child=1) as pool:
+            futures = {name: pool.submit(generate_case, paths, seed, spoiler) for name, paths in matrix.items()}
+            for name, future in futures.items():
+                try:
+                    case = future.result()
+                except Exception as e:  # the worker process died
+                    case = {"error": f"{type(e).__name__}: {e}", "time": 0.0, "peak_memory": 0, "stages": {}}
+                case["templates"] = [os.path.basename(path) for path in matrix[name]]
+                cases[name] = case
+                if case["error"]:
+                    logger.warning(f"{name} failed: {case['error']}")
+                else:
+                    logger.info(f"{name}: {case['time']:.2f}s, {case['peak_memory'] / 1e6:.1f}MB peak")
+
+    with tempfile.TemporaryDirectory() as templates_dir:
+        generate_yaml_templates(templates_dir, False)
+        excluded = set(load_template_exclude_list())
+        templates = {file_name[:-5]: os.path.join(templates_dir, file_name)
+                     for file_name in sorted(os.listdir(templates_dir))
+                     if file_name.endswith(".yaml") and file_name not in excluded}
+        if games:
+            templates = {name: path for name, path in templates.items() if name in games}
+
+        run_cases({f"single {name}": [path] for name, path in templates.items()})
+        working = [path for name, path in templates.items() if not cases[f"single {name}"]["error"]]
+        if working:
+            run_cases({f"mix {size}": random.Random(f"{seed} {size}").choices(working, k=size)
+                       for size in mix_sizes})
+
+    run = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "version": __version__,
+        "seed": seed,
+        "spoiler": spoiler,
+        "cases": cases,
+    }
+    os.makedirs(os.path.dirname(history_path), exist_ok=True)
+    history: typing.Dict[str, typing.Any] = {"runs": []}
+    if os.path.exists(history_path):
+        with open(history_path) as f:
+            history = json.load(f)
+    history["runs"].append(run)
+    with open(history_path, "w") as f:
+        json.dump(history, f, indent=1)
+    logger.info(f"Results appended to {history_path}")
+
+    if save_baseline:
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, "w") as f:
+            json.dump(run, f, indent=1)
+        logger.info(f"Saved as baseline to {baseline_path}")
+        return True
+    if not os.path.exists(baseline_path):
+        logger.info("No baseline to compare against, save one with --save_baseline.")
+        return True
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(run, baseline, threshold)
+    for regression in regressions:
+        logger.warning(f"Regression: {regression}")
+    if not regressions:
+        logger.info(f"No regressions against the baseline of {baseline['timestamp']}.")
+    return not regressions
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from path_change import change_home
+    change_home()
+
+    parser = argparse.ArgumentParser(description="Benchmark generation of the game templates.")
+    parser.add_argument("--games", nargs="*", help="Only use the templates of these games, by file name.")
+    parser.add_argument("--mix_sizes", nargs="*", type=int, default=[10, 50, 200])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spoiler", type=int, default=2)
+    parser.add_argument("--history", help="JSON file the results are appended to.")
+    parser.add_argument("--baseline", help="JSON file of the run to compare against.")
+    parser.add_argument("--save_baseline", action="store_true", help="Save this run as the new baseline.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative slowdown or memory increase of a stage reported as regression.")
+    cli_args = parser.parse_args()
+    sys.exit(0 if run_generation_benchmark(cli_args.games, cli_args.mix_sizes, cli_args.seed, cli_args.spoiler,
+                                           cli_args.history, cli_args.baseline, cli_args.save_baseline,
+                                           cli_args.threshold) else 1)
@@ -0,0 +1,34 @@
+def run_restricted_pickle_benchmark(slots: int = 100, locations_per_slot: int = 2000, repetitions: int = 5):
+    """Compare restricted_dumps against pickling followed by a restricted_loads check,
+    on the multidata of a large synthetic multiworld."""
+    import logging
+    import pickle
+
+    from time_it import TimeIt
+    from server_harness import create_multidata
+
+    from Utils import init_logging, restricted_dumps, restricted_loads
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    def dumps_and_check(obj) -> bytes:
+        s = pickle.dumps(obj)
+        restricted_loads(s)
+        return s
+
+    multidata = create_multidata(slots, locations_per_slot)
+    size = len(restricted_dumps(multidata))
+    logger.info(f"Multidata of {slots} slots with {locations_per_slot} locations each, {size / 1024 / 1024:.1f} MiB")
+    for name, dumps in (("pickle.dumps", pickle.dumps),
+                        ("pickle.dumps + restricted_loads", dumps_and_check),
+                        ("restricted_dumps", restricted_dumps)):
+        with TimeIt(f"{repetitions}x {name}", logger):
+            for _ in range(repetitions):
+                dumps(multidata)
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_restricted_pickle_benchmark()
@@ -0,0 +1,192 @@
+"""Synthetic multidata and websocket clients to drive a local MultiServer without generating a seed."""
+import asyncio
+import functools
+import itertools
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from MultiServer import Context
+    from NetUtils import MultiData
+
+benchmark_game = "Benchmark Game"
+
+
+def create_multidata(slots: int, locations_per_slot: int, seed: int = 0) -> "MultiData":
+    """Create a multidata of `slots` players of a synthetic game, with items randomly distributed across them."""
+    from NetUtils import NetworkSlot, SlotType
+    from Utils import version_tuple
+    from worlds.AutoWorld import data_package_checksum
+
+    rng = random.Random(seed)
+    location_ids = range(1, locations_per_slot + 1)
+    item_ids = range(1, locations_per_slot + 1)
+    game_package = {
+        "item_name_groups": {"Everything": sorted(f"Item {item_id}" for item_id in item_ids)},
+        "item_name_to_id": {f"Item {item_id}": item_id for item_id in item_ids},
+        "location_name_groups": {},
+        "location_name_to_id": {f"Location {location_id}": location_id for location_id in location_ids},
+    }
+    game_package["checksum"] = data_package_checksum(game_package)
+    players = range(1, slots + 1)
+    locations = {
+        player: {location_id: (rng.choice(item_ids), rng.choice(players), rng.choice((0, 1, 2, 4)))
+                 for location_id in location_ids}
+        for player in players
+    }
+    # one location per sphere step keeps the spheres realistic in count without needing a fill
+    spheres = [{player: set(location_ids[sphere::10]) for player in players} for sphere in range(10)]
+    return {
+        "slot_data": {player: {} for player in players},
+        "slot_info": {player: NetworkSlot(f"Player{player}", benchmark_game, SlotType.player) for player in players},
+        "connect_names": {f"Player{player}": (0, player) for player in players},
+        "locations": locations,
+        "checks_in_area": {},
+        "server_options": {},
+        "er_hint_data": {},
+        "precollected_items": {player: [] for player in players},
+        "precollected_hints": {player: set() for player in players},
+        "version": tuple(version_tuple),
+        "tags": ["AP"],
+        "minimum_versions": {"server": (0, 0, 0), "clients": {player: (0, 0, 0) for player in players}},
+        "seed_name": str(seed),
+        "spheres": spheres,
+        "datapackage": {benchmark_game: game_package},
+        "race_mode": 0,
+    }
+
+
+def save_multidata(multidata: "MultiData", path: str) -> None:
+    """Write multidata to an .archipelago file the way Main does."""
+    import zlib
+    from Utils import restricted_dumps
+
+    with open(path, "wb") as f:
+        f.write(bytes([3]))  # version of format
+        f.write(zlib.compress(restricted_dumps(multidata), 9))
+
+
+def get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server_process(multidata_path: str, port: int, *server_args: str) -> subprocess.Popen:
+    """Run MultiServer.py for multidata_path in its own process, so its resources can be measured on their own."""
+    import Utils
+
+    env = dict(os.environ, SKIP_REQUIREMENTS_UPDATE="1")
+    return subprocess.Popen([sys.executable, Utils.local_path("MultiServer.py"), multidata_path,
+                             "--host", "localhost", "--port", str(port), "--loglevel", "warning", *server_args],
+                            cwd=Utils.local_path(), env=env, stdin=subprocess.DEVNULL)
+
+
+async def wait_for_server(port: int, timeout: float = 120) -> None:
+    """Wait until a server started by start_server_process accepts connections."""
+    give_up = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("localhost", port)
+        except OSError:
+            if time.perf_counter() > give_up:
+                raise
+            await asyncio.sleep(0.1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+async def start_local_server(multidata: "MultiData", **server_options: typing.Any) -> typing.Tuple["Context", int]:
+    """Load multidata into a new server Context and serve it on a free local port."""
+    import websockets
+    from MultiServer import Context, server
+
+    options = {"hint_cost": 0, "location_check_points": 1, "item_cheat": False, "release_mode": "enabled",
+               "collect_mode": "enabled", "remaining_mode": "enabled"}
+    options.update(server_options)
+    ctx = Context("localhost", 0, None, None, **options)
+    ctx._load(multidata, {}, False)
+    ctx.server = websockets.serve(functools.partial(server, ctx=ctx), host="localhost", port=0,
+                                  ping_timeout=None, ping_interval=None)
+    ws_server = await ctx.server
+    port = ws_server.sockets[0].getsockname()[1]
+    return ctx, port
+
+
+class SyntheticClient:
+    """Minimal protocol client, records the arrival time of every received package per command."""
+
+    def __init__(self, port: int, slot: int) -> None:
+        self.port = port
+        self.slot = slot
+        self.socket = None
+        self.received: typing.Dict[str, typing.List[float]] = {}
+        self.package_events: typing.Dict[str, asyncio.Event] = {}
+        self._reader: typing.Optional[asyncio.Task] = None
+        self._pings: typing.Dict[int, asyncio.Future] = {}
+        self._ping_counter = itertools.count()
+
+    async def connect(self, tags: typing.Sequence[str] = ("AP",), **connect_args: typing.Any) -> dict:
+        import websockets
+        from NetUtils import decode
+        from Utils import version_tuple
+
+        self.socket = await websockets.connect(f"ws://localhost:{self.port}", max_size=None,
+                                               ping_timeout=None, ping_interval=None)
+        decode(await self.socket.recv())  # RoomInfo
+        await self.send({"cmd": "Connect", "password": None, "name": f"Player{self.slot}", "version": version_tuple,
+                         "tags": list(tags), "items_handling": 0b111, "uuid": self.slot, "game": benchmark_game,
+                         "slot_data": False, **connect_args})
+        for package in decode(await self.socket.recv()):
+            if package["cmd"] == "Connected":
+                self._reader = asyncio.create_task(self._read())
+                return package
+        raise ConnectionError(f"Slot {self.slot} could not connect.")
+
+    async def send(self, *packages: dict) -> None:
+        from NetUtils import encode
+        await self.socket.send(encode(packages))
+
+    async def round_trip(self, *packages: dict, timeout: float = 30) -> float:
+        """Send packages and return the seconds until the server has processed them,
+        detected through a trailing Get, which the server answers after the packages before it."""
+        ping = next(self._ping_counter)
+        future = self._pings[ping] = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        await self.send(*packages, {"cmd": "Get", "keys": [], "benchmark_ping": ping})
+        return await asyncio.wait_for(future, timeout) - start
+
+    async def wait_for(self, cmd: str, count: int = 1, timeout: float = 30) -> None:
+        """Wait until at least `count` packages of type `cmd` were received in total."""
+        while len(self.received.get(cmd, ())) < count:
+            event = self.package_events.setdefault(cmd, asyncio.Event())
+            event.clear()
+            await asyncio.wait_for(event.wait(), timeout)
+
+    async def _read(self) -> None:
+        import websockets
+        from NetUtils import decode
+
+        try:
+            async for message in self.socket:
+                now = time.perf_counter()
+                for package in decode(message):
+                    self.received.setdefault(package["cmd"], []).append(now)
+                    if package["cmd"] == "Retrieved" and "benchmark_ping" in package:
+                        self._pings.pop(package["benchmark_ping"]).set_result(now)
+                    if package["cmd"] in self.package_events:
+                        self.package_events[package["cmd"]].set()
+        except websockets.ConnectionClosed:
+            pass
+
+    async def close(self) -> None:
+        await self.socket.close()
+        if self._reader:
+            await self._reader
@@ -0,0 +1,109 @@
+def run_server_load_benchmark(slots: int = 200, locations_per_slot: int = 100, rounds: int = 10):
+    """Start MultiServer for a synthetic multiworld of `slots` players and have one client per slot go through
+    a typical session: Connect, checking locations, hinting, data storage and finally release or collect.
+    Reports latency per operation, messages per second and the memory used by the server process."""
+    import asyncio
+    import logging
+    import os
+    import random
+    import statistics
+    import tempfile
+    import time
+
+    from time_it import TimeIt
+    from server_harness import (SyntheticClient, create_multidata, get_free_port, save_multidata,
+                                start_server_process, wait_for_server)
+
+    from NetUtils import ClientStatus
+    from Utils import format_SI_prefix, init_logging
+
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+
+    latencies: dict[str, list[float]] = {}
+
+    async def measure(name: str, client: SyntheticClient, *packages: dict) -> None:
+        latencies.setdefault(name, []).append(await client.round_trip(*packages))
+
+    async def play(client: SyntheticClient, rng: random.Random) -> None:
+        start = time.perf_counter()
+        await client.connect()
+        latencies.setdefault("Connect", []).append(time.perf_counter() - start)
+        locations = list(range(1, locations_per_slot + 1))
+        rng.shuffle(locations)
+        per_round = max(1, locations_per_slot // (rounds + 1))
+        key = f"benchmark_{client.slot}"
+        for i in range(rounds):
+            await measure("LocationChecks", client,
+                          {"cmd": "LocationChecks", "locations": locations[i * per_round:(i + 1) * per_round]})
+            await measure("LocationScouts hint", client,
+                          {"cmd": "LocationScouts", "locations": locations[-i - 1:], "create_as_hint": 2})
+            await measure("Say !hint", client,
+                          {"cmd": "Say", "text": f"!hint Item {rng.randint(1, locations_per_slot)}"})
+            await measure("Set", client, {"cmd": "Set", "key": key, "default": 0, "want_reply": True,
+                                          "operations": [{"operation": "add", "value": 1}]})
+            await measure("Get", client, {"cmd": "Get", "keys": [key, f"benchmark_{rng.randint(1, slots)}"]})
+        await measure("StatusUpdate goal", client, {"cmd": "StatusUpdate", "status": ClientStatus.CLIENT_GOAL})
+        # half of the slots release their remaining items, the other half collects theirs
+        await measure("Say !release" if client.slot % 2 else "Say !collect", client,
+                      {"cmd": "Say", "text": "!release" if client.slot % 2 else "!collect"})
+
+    async def sample_memory(process: "psutil.Process", samples: list[int]) -> None:
+        while True:
+            samples.append(process.memory_info().rss)
+            await asyncio.sleep(0.1)
+
+    async def main(port: int, server_pid: int) -> None:
+        await wait_for_server(port)
+        clients = [SyntheticClient(port, slot) for slot in range(1, slots + 1)]
+        memory_samples: list[int] = []
+        server = psutil.Process(server_pid) if psutil else None
+        sampler = asyncio.create_task(sample_memory(server, memory_samples)) if server else None
+        cpu_before = sum(server.cpu_times()[:2]) if server else 0
+        with TimeIt(f"{slots} clients playing {rounds} rounds", logger) as t:
+            await asyncio.gather(*(play(client, random.Random(client.slot)) for client in clients))
+        received = sum(len(times) for client in clients for times in client.received.values())
+        requests = sum(len(times) for times in latencies.values())  # one websocket message each
+        for client in clients:
+            await client.close()
+        if sampler:
+            sampler.cancel()
+            server_cpu = sum(server.cpu_times()[:2]) - cpu_before
+
+        logger.info(f"{'Operation':<20} {'count':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+        for name, times in latencies.items():
+            times.sort()
+            percentiles = statistics.quantiles(times, n=100, method="inclusive")
+            logger.info(f"{name:<20} {len(times):>6} {percentiles[49] * 1000:>8.2f} "
+                        f"{percentiles[98] * 1000:>8.2f} {times[-1] * 1000:>8.2f}")
+        logger.info(f"{requests / t.dif:.0f} requests/s sent, {received / t.dif:.0f} packages/s received.")
+        if memory_samples:
+            logger.info(f"Server RSS: {format_SI_prefix(memory_samples[0], 1024)}iB at start, "
+                        f"{format_SI_prefix(max(memory_samples), 1024)}iB peak, "
+                        f"{format_SI_prefix(memory_samples[-1], 1024)}iB at end.")
+            # if the server is not busy most of the time, the clients in this process are the bottleneck
+            logger.info(f"Server CPU busy {server_cpu / t.dif:.0%} of the time.")
+        else:
+            logger.info("Install psutil to measure server memory and CPU usage.")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        multidata_path = os.path.join(temp_dir, "AP_benchmark.archipelago")
+        save_multidata(create_multidata(slots, locations_per_slot), multidata_path)
+        port = get_free_port()
+        server_process = start_server_process(multidata_path, port)
+        try:
+            asyncio.run(main(port, server_process.pid))
+        finally:
+            server_process.terminate()
+            server_process.wait()
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_server_load_benchmark()
@@ -0,0 +1,87 @@
+def run_slots_benchmark(rule_iterations: int = 100):
+    """Generate every world on its own and list the Location, Region, Entrance and Item classes that still carry a
+    __dict__, with the attributes ending up in it, together with the memory used by these objects.
+    Worlds failing because they set an attribute a core class has no slot for are listed first.
+    Also times can_reach of all locations and entrances, the attribute heavy path slots speed up."""
+    import argparse
+    import collections
+    import gc
+    import logging
+    import sys
+    import typing
+
+    from time_it import TimeIt
+
+    from BaseClasses import CollectionState, Entrance, Item, Location, MultiWorld, Region
+    from Utils import format_SI_prefix, init_logging
+    from worlds import AutoWorld
+    from worlds.AutoWorld import call_all
+
+    init_logging("Benchmark Runner")
+    logger = logging.getLogger("Benchmark")
+    core_types = (Location, Region, Entrance, Item)
+    failing: typing.Dict[str, str] = {}
+    dict_attributes: typing.Dict[str, typing.Dict[str, typing.Set[str]]] = {}
+
+    gen_steps = ("generate_early", "create_regions", "create_items", "set_rules", "connect_entrances",
+                 "generate_basic", "pre_fill")
+
+    def size_of(obj: object) -> int:
+        return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+
+    for game, world_type in sorted(AutoWorld.AutoWorldRegister.world_types.items()):
+        try:
+            multiworld = MultiWorld(1)
+            multiworld.game[1] = game
+            multiworld.player_name = {1: "Tester"}
+            multiworld.set_seed(0)
+            args = argparse.Namespace()
+            for name, option in world_type.options_dataclass.type_hints.items():
+                setattr(args, name, {1: option.from_any(option.default)})
+            multiworld.set_options(args)
+            multiworld.state = CollectionState(multiworld)
+            for step in gen_steps:
+                call_all(multiworld, step)
+        except AttributeError as e:
+            if any(f"'{core_type.__name__}' object has no attribute" in str(e) for core_type in core_types):
+                failing[game] = str(e)
+            continue
+        except Exception as e:
+            logger.debug(f"{game} failed to generate: {e}")
+            continue
+
+        regions = list(multiworld.get_regions())
+        locations = list(multiworld.get_locations())
+        entrances = list(multiworld.get_entrances())
+        items = [location.item for location in locations if location.item] + multiworld.itempool
+        attributes = dict_attributes[game] = collections.defaultdict(set)
+        for obj in (*regions, *locations, *entrances, *items):
+            if hasattr(obj, "__dict__"):
+                attributes[type(obj).__name__].update(obj.__dict__)
+        total_size = sum(map(size_of, (*regions, *locations, *entrances, *items)))
+
+        state = CollectionState(multiworld)
+        all_state = multiworld.get_all_state(False)
+        gc.collect()
+        with TimeIt(f"{game} {rule_iterations} runs of can_reach") as t:
+            for _ in range(rule_iterations):
+                for spot in (*locations, *entrances):
+                    spot.can_reach(state)
+                    spot.can_reach(all_state)
+        logger.info(f"{game}: {len(regions)} regions, {len(locations)} locations, {len(entrances)} entrances and "
+                    f"{len(items)} items use {format_SI_prefix(total_size, 1024)}B, "
+                    f"{t.dif:.4f} seconds in can_reach.")
+
+    logger.info("Worlds setting attributes the core classes have no slot for:")
+    for game, error in failing.items():
+        logger.info(f"  {game}: {error}")
+    logger.info("World classes with a __dict__, which could declare __slots__ for the listed attributes:")
+    for game, classes in dict_attributes.items():
+        for class_name, names in classes.items():
+            logger.info(f"  {game} {class_name}: {', '.join(sorted(names)) or 'nothing, __slots__ = () is enough'}")
+
+
+if __name__ == "__main__":
+    from path_change import change_home
+    change_home()
+    run_slots_benchmark()
@@ -303,6 +303,20 @@ class TestRandomizeEntrances(unittest.TestCase):
         self.assertEqual(80, len(result.pairings))
         self.assertEqual(80, len(result.placements))
 
+    def test_sweeps_only_dependent_players(self):
+        """tests that only the randomizing player and the declared dependent players are swept"""
+        for dependent_players in ((), (2,)):
+            with self.subTest(dependent_players=dependent_players):
+                multiworld = generate_test_multiworld(2)
+                generate_disconnected_region_grid(multiworld, 3)
+                other_location = generate_locations(1, 2, multiworld.get_region("Menu", 2))[0]
+                other_location.place_locked_item(generate_items(1, 1, True)[0])
+
+                result = randomize_entrances(multiworld.worlds[1], False, directionally_matched_group_lookup,
+                                             dependent_players=dependent_players)
+                self.assertEqual(other_location in result.collection_state.advancements, bool(dependent_players))
+                self.assertEqual(10, len(result.placed_regions))
+
     def test_coupled(self):
         """tests that in coupled mode, all 2 way transitions have an inverse"""
         multiworld = generate_test_multiworld()
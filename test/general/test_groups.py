@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from BaseClasses import CollectionState
 from worlds.AutoWorld import AutoWorldRegister
+from . import setup_solo_multiworld
 
 
 class TestNameGroups(TestCase):
@@ -25,3 +27,27 @@ class TestNameGroups(TestCase):
             with self.subTest(game=game_name):
                 for name, group in world_type.location_name_groups.items():
                     self.assertTrue(group, f"Location name group \"{name}\" of \"{game_name}\" is empty")
+
+    def test_item_name_group_members(self) -> None:
+        """
+        Test that the group functions of state count the items of each item name group.
+        """
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            with self.subTest(game=game_name):
+                self.assertEqual(world_type.item_name_groups.keys(), world_type.item_name_group_members.keys())
+                for name, group in world_type.item_name_groups.items():
+                    self.assertEqual(group, frozenset(world_type.item_name_group_members[name]))
+
+    def test_group_counts(self) -> None:
+        """
+        Test that the group functions of state count the items of a group, with and without duplicates.
+        """
+        multiworld = setup_solo_multiworld(AutoWorldRegister.world_types["A Link to the Past"], ())
+        state = CollectionState(multiworld)
+        state.prog_items[1].update({"Bombos": 2, "Ether": 1, "Quake": 0, "Hookshot": 3})
+        self.assertEqual(state.count_group("Medallions", 1), 3)
+        self.assertEqual(state.count_group_unique("Medallions", 1), 2)
+        self.assertTrue(state.has_group("Medallions", 1, 3))
+        self.assertFalse(state.has_group("Medallions", 1, 4))
+        self.assertTrue(state.has_group_unique("Medallions", 1, 2))
+        self.assertFalse(state.has_group_unique("Medallions", 1, 3))
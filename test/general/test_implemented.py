@@ -2,9 +2,9 @@ import unittest
 
 from Fill import distribute_items_restrictive
 from NetUtils import convert_to_base_types
-from worlds.AutoWorld import AutoWorldRegister, call_all
+from worlds.AutoWorld import AutoWorldRegister, call_all, forkable_steps
 from worlds import failed_world_loads
-from . import setup_solo_multiworld
+from . import gen_steps, setup_solo_multiworld
 
 
 class TestImplemented(unittest.TestCase):
@@ -142,3 +142,22 @@ class TestImplemented(unittest.TestCase):
                 self.assertEqual(len(multiworld.itempool), 0)
                 self.assertEqual(len(multiworld.get_locations()), 0)
                 self.assertEqual(len(multiworld.get_regions()), 0)
+
+    def test_seed_independent_steps(self):
+        """Test that reseeding after the steps a world declares seed independent matches generating the new seed."""
+        for game_name, world_type in AutoWorldRegister.world_types.items():
+            steps = world_type.seed_independent_steps
+            if not steps:
+                continue
+            with self.subTest("Game", game=game_name):
+                self.assertEqual(steps, forkable_steps[:len(steps)],
+                                 "seed_independent_steps has to be a prefix of forkable_steps")
+                multiworld = setup_solo_multiworld(world_type, steps, seed=1)
+                multiworld.reseed(2)
+                for step in gen_steps[len(steps):]:
+                    call_all(multiworld, step)
+                expected = setup_solo_multiworld(world_type, seed=2)
+                self.assertEqual([item.name for item in multiworld.itempool],
+                                 [item.name for item in expected.itempool])
+                self.assertEqual(multiworld.random.getstate(), expected.random.getstate())
+                self.assertEqual(multiworld.worlds[1].random.getstate(), expected.worlds[1].random.getstate())
@@ -1,8 +1,10 @@
 import unittest
 
-from BaseClasses import MultiWorld
+from typing_extensions import override
+
+from BaseClasses import CollectionState, Entrance, Item, ItemClassification, Location, MultiWorld
 from worlds.AutoWorld import AutoWorldRegister
-from . import setup_solo_multiworld
+from . import generate_test_multiworld, setup_solo_multiworld
 
 
 class TestWorldMemory(unittest.TestCase):
@@ -19,3 +21,75 @@ class TestWorldMemory(unittest.TestCase):
         for game_name, weak in refs.items():
             with self.subTest("Game cleanup", game_name=game_name):
                 self.assertFalse(weak(), "World leaked a reference")
+
+
+class TestSlots(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.multiworld = generate_test_multiworld()
+        self.region = self.multiworld.get_region("Menu", 1)
+
+    def test_compact(self) -> None:
+        """Tests that the core classes only hold their slots."""
+        location = Location(1, "Location", None, self.region)
+        entrance = Entrance(1, "Entrance", self.region)
+        item = Item("Item", ItemClassification.progression, None, 1)
+        for obj in (self.region, location, entrance, item):
+            with self.subTest(type=type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    setattr(obj, "ad_hoc", True)
+
+    def test_defaults(self) -> None:
+        """Tests that slots get their defaults and subclasses can still override them with class attributes."""
+        location = Location(1, "Location", None, self.region)
+        self.assertIs(location.access_rule, Location.default_access_rule)
+        self.assertIs(location.item, None)
+        self.assertFalse(location.locked)
+        self.assertIs(Entrance(1).access_rule, Entrance.default_access_rule)
+
+        class OverridingLocation(Location):
+            locked = True
+
+            @override
+            def access_rule(self, state: CollectionState) -> bool:
+                return self.name == "Overridden"
+
+        location = OverridingLocation(1, "Overridden", None, self.region)
+        self.assertTrue(location.locked)
+        self.assertTrue(location.access_rule(self.multiworld.state))
+        self.assertTrue(location.can_reach(self.multiworld.state))
+        self.assertIs(location.item, None)
+        setattr(location, "ad_hoc", True)  # subclasses without __slots__ of their own get a __dict__
+
+        class CompactLocation(Location):
+            __slots__ = ("extra",)
+
+        location = CompactLocation(1, "Compact", None, self.region)
+        location.extra = 1
+        self.assertFalse(hasattr(location, "__dict__"))
+
+    def test_memory(self) -> None:
+        """Tests that subclasses declaring __slots__ for their attributes are smaller than ones using a __dict__."""
+        import gc
+        import tracemalloc
+
+        class DictLocation(Location):
+            pass
+
+        class CompactLocation(Location):
+            __slots__ = ("ad_hoc",)
+
+        names = [f"Location {i}" for i in range(1000)]
+
+        def measure(location_type: type[Location]) -> int:
+            gc.collect()
+            tracemalloc.start()
+            locations = [location_type(1, name, i, self.region) for i, name in enumerate(names)]
+            for location in locations:
+                setattr(location, "ad_hoc", True)
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size
+
+        self.assertLess(measure(CompactLocation), measure(DictLocation))
@@ -0,0 +1,69 @@
+import unittest
+
+from BaseClasses import CollectionState
+from test.general import generate_test_multiworld, generate_locations, generate_items
+from worlds.generic.Rules import And, CanReachRegion, Count, Has, HasAll, HasAny, Or, add_rule, false_rule, \
+    set_rule, true_rule
+
+
+class TestRules(unittest.TestCase):
+    def setUp(self) -> None:
+        self.multiworld = generate_test_multiworld()
+        self.state = CollectionState(self.multiworld)
+        for item in generate_items(3, 1, True):
+            self.state.collect(item, True)  # player1_progitem0 - player1_progitem2
+
+    def test_evaluation(self) -> None:
+        self.assertTrue(Has("player1_progitem0", 1)(self.state))
+        self.assertFalse(Has("player1_progitem0", 1, 2)(self.state))
+        self.assertTrue(HasAll(["player1_progitem0", "player1_progitem1"], 1)(self.state))
+        self.assertFalse(HasAll(["player1_progitem0", "missing"], 1)(self.state))
+        self.assertTrue(HasAny(["missing", "player1_progitem1"], 1)(self.state))
+        self.assertTrue(Count(["player1_progitem0", "player1_progitem1", "missing"], 1, 2)(self.state))
+        self.assertFalse(Count(["player1_progitem0", "missing"], 1, 2)(self.state))
+        self.assertTrue(CanReachRegion("Menu", 1)(self.state))
+        self.assertFalse((Has("missing", 1) & CanReachRegion("Menu", 1))(self.state))
+        self.assertTrue((Has("missing", 1) | CanReachRegion("Menu", 1))(self.state))
+
+    def test_simplification(self) -> None:
+        self.assertIs(And(), true_rule)
+        self.assertIs(Or(), false_rule)
+        self.assertIs(And(Has("a", 1), false_rule), false_rule)
+        self.assertIs(Or(Has("a", 1), true_rule), true_rule)
+        self.assertEqual(And(Has("a", 1), true_rule), Has("a", 1))
+        self.assertEqual(And(Has("a", 1), And(Has("b", 1), Has("a", 1))), HasAll(("a", "b"), 1))
+        self.assertEqual(Or(Has("a", 1), HasAny(("b", "c"), 1)), HasAny(("a", "b", "c"), 1))
+        # region checks are slower, so they're evaluated last; counts are not merged
+        rule = And(CanReachRegion("Menu", 1), Has("a", 1, 2), Has("b", 1), Has("c", 2), Has("d", 1))
+        self.assertEqual(rule.rules, (Has("a", 1, 2), HasAll(("b", "d"), 1), Has("c", 2), CanReachRegion("Menu", 1)))
+        with self.assertRaises(TypeError):
+            And(Has("a", 1), lambda state: True)
+
+    def test_dependencies(self) -> None:
+        rule = Or(Has("a", 1), And(Count(("b", "c"), 2, 3), CanReachRegion("Menu", 1)))
+        self.assertEqual(rule.item_dependencies(), {("a", 1), ("b", 2), ("c", 2)})
+        self.assertEqual(rule.region_dependencies(), {("Menu", 1)})
+
+    def test_to_dict(self) -> None:
+        rule = Or(Has("a", 1, 2), And(HasAll(("b", "c"), 1), CanReachRegion("Menu", 1)))
+        self.assertEqual(rule.to_dict(), {"type": "or", "conditions": [
+            {"type": "item_check", "item": {"type": "constant", "value": "a"}, "count": {"type": "constant", "value": 2}},
+            {"type": "and", "conditions": [
+                {"type": "and", "conditions": [
+                    {"type": "item_check", "item": {"type": "constant", "value": "b"}},
+                    {"type": "item_check", "item": {"type": "constant", "value": "c"}},
+                ]},
+                {"type": "can_reach", "region": {"type": "constant", "value": "Menu"}},
+            ]},
+        ]})
+
+    def test_add_rule(self) -> None:
+        location = generate_locations(1, 1, self.multiworld.get_region("Menu", 1))[0]
+        set_rule(location, Has("player1_progitem0", 1))
+        add_rule(location, Has("player1_progitem1", 1))
+        self.assertEqual(location.access_rule, HasAll(("player1_progitem1", "player1_progitem0"), 1))
+        add_rule(location, Has("missing", 1), "or")
+        self.assertIsInstance(location.access_rule, Or)
+        self.assertTrue(location.can_reach(self.state))
+        add_rule(location, lambda state: False)  # mixing in functions still works
+        self.assertFalse(location.can_reach(self.state))
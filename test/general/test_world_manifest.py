@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from Utils import local_path
+from worlds import game_manifests, network_data_package
+from worlds.AutoWorld import AutoWorldRegister, WorldTypes
+
+
+class TestWorldManifest(unittest.TestCase):
+    def test_manifest_matches_worlds(self) -> None:
+        """Tests that what hosting and clients get from the world manifest is what the worlds would provide."""
+        for game_name, manifest in game_manifests.items():
+            with self.subTest(game=game_name):
+                world_type = AutoWorldRegister.world_types[game_name]
+                self.assertEqual(network_data_package["games"][game_name], world_type.get_data_package_data())
+                self.assertEqual(manifest.hint_blacklist, world_type.hint_blacklist)
+
+    def test_data_package_per_process(self) -> None:
+        """Tests that the data package of every world is the same in another process, so it can be cached in the
+        world manifest. Checksums depend on dict order, so tables built from sets need to be sorted."""
+        script = ("import json, sys, worlds; json.dump({game: world.get_data_package_data()['checksum'] "
+                  "for game, world in worlds.AutoWorldRegister.world_types.items()}, sys.stdout)")
+        env = {**os.environ, "PYTHONHASHSEED": "1" if os.environ.get("PYTHONHASHSEED") == "0" else "0",
+               "SKIP_REQUIREMENTS_UPDATE": "1"}
+        output = subprocess.run([sys.executable, "-c", script], cwd=local_path(), env=env, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, check=True).stdout
+        checksums = json.loads(output)
+        for game_name in game_manifests:
+            with self.subTest(game=game_name):
+                self.assertEqual(checksums.get(game_name), network_data_package["games"][game_name]["checksum"])
+
+    def test_lazy_world_types(self) -> None:
+        world_types = WorldTypes()
+        imported = []
+
+        class World:
+            pass
+
+        def import_a() -> None:
+            imported.append("A")
+            world_types["A"] = World
+
+        world_types.add_pending("A", import_a)
+        world_types.add_pending("B", lambda: imported.append("B"))  # fails to register
+        self.assertNotIn("C", world_types)
+        self.assertEqual(imported, [])
+        self.assertIs(world_types["A"], World)
+        self.assertIn("A", world_types)
+        self.assertEqual(imported, ["A"], "Only the looked up world should be imported, and only once")
+        self.assertEqual(list(world_types), ["A"])
+        self.assertEqual(imported, ["A", "B"])
@@ -0,0 +1,36 @@
+# Tests for the DeltaSync helpers in NetUtils and MultiServer
+import unittest
+
+from MultiServer import get_resume_index
+from NetUtils import NetworkItem, decode, decode_ranges, encode, encode_ranges
+
+
+class TestRanges(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        values = [7, 1, 2, 3, 10, 11, 5]
+        ranges = encode_ranges(values)
+        self.assertEqual(ranges, [(1, 3), (5, 5), (7, 7), (10, 11)])
+        self.assertEqual(decode_ranges(decode(encode(ranges))), sorted(values))
+
+    def test_empty(self) -> None:
+        self.assertEqual(encode_ranges([]), [])
+        self.assertEqual(decode_ranges([]), [])
+
+
+class TestResumeIndex(unittest.TestCase):
+    items = [NetworkItem(1, 100, 1, 0), NetworkItem(2, 101, 2, 1), NetworkItem(3, 102, 1, 0)]
+
+    def test_resume(self) -> None:
+        self.assertEqual(get_resume_index(self.items, {"received_items_index": 2,
+                                                       "last_received_item": [2, 101, 2, 1]}), 2)
+        self.assertEqual(get_resume_index(self.items, {"received_items_index": 3,
+                                                       "last_received_item": self.items[2]}), 3)
+
+    def test_full_resend(self) -> None:
+        self.assertEqual(get_resume_index(self.items, {}), 0)
+        self.assertEqual(get_resume_index(self.items, {"received_items_index": 2,
+                                                       "last_received_item": [3, 102, 1, 0]}), 0)
+        self.assertEqual(get_resume_index(self.items, {"received_items_index": 4,
+                                                       "last_received_item": [3, 102, 1, 0]}), 0)
+        self.assertEqual(get_resume_index(self.items, {"received_items_index": "2",
+                                                       "last_received_item": [2, 101, 2, 1]}), 0)
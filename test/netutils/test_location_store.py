@@ -165,6 +165,32 @@ class Base:
             with self.assertRaises(KeyError):
                 self.store.get_remaining(bad_state, 0, 9999)
 
+        def test_get_sphere(self) -> None:
+            self.store.set_spheres([
+                {1: {11, 13}, 2: {21}},
+                {1: {12}, 3: {9}, 6: {1}},  # unknown player
+                {2: {22, 24}},  # unknown location
+            ])
+            self.assertEqual(self.store.get_sphere(1, 11), 0)
+            self.assertEqual(self.store.get_sphere(1, 13), 0)
+            self.assertEqual(self.store.get_sphere(2, 21), 0)
+            self.assertEqual(self.store.get_sphere(1, 12), 1)
+            self.assertEqual(self.store.get_sphere(3, 9), 1)
+            self.assertEqual(self.store.get_sphere(2, 22), 2)
+
+        def test_get_sphere_exception(self) -> None:
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(1, 11)  # no spheres set
+            self.store.set_spheres([{1: {11}}])
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(1, 12)  # not in a sphere
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(1, 10)  # no such location
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(0, 11)
+            with self.assertRaises(KeyError):
+                self.store.get_sphere(6, 11)
+
         def test_location_set_intersection(self) -> None:
             locations = {10, 11, 12}
             locations.intersection_update(self.store[1])
@@ -0,0 +1,57 @@
+import base64
+import json
+import unittest
+
+from worlds._bizhawk import BizHawkContext, MemoryWatcher
+
+
+class FakeBizHawkContext(BizHawkContext):
+    def __init__(self) -> None:
+        super().__init__()
+        self.memory = bytearray(0x100)
+        self.requests: list[list[dict]] = []
+
+    async def _send_message(self, message: str) -> str:
+        requests = json.loads(message)
+        self.requests.append(requests)
+        responses = []
+        for request in requests:
+            if request["type"] == "GUARD":
+                address = request["address"]
+                expected = base64.b64decode(request["expected_data"])
+                responses.append({"type": "GUARD_RESPONSE", "address": address,
+                                  "value": self.memory[address:address + len(expected)] == expected})
+            else:
+                data = bytes(self.memory[request["address"]:request["address"] + request["size"]])
+                responses.append({"type": "READ_RESPONSE", "value": base64.b64encode(data).decode("ascii")})
+        return json.dumps(responses)
+
+
+class TestMemoryWatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_update(self) -> None:
+        ctx = FakeBizHawkContext()
+        watcher = MemoryWatcher()
+        changes: list[tuple[str, bytes]] = []
+
+        async def on_flags(data: bytes) -> None:
+            changes.append(("flags", data))
+
+        watcher.watch(0x10, 2, "RAM", lambda data: changes.append(("counter", data)))
+        watcher.watch(0x80, 4, "RAM", on_flags, interval=3600)
+
+        self.assertTrue(await watcher.update(ctx))
+        self.assertEqual(changes, [("counter", b"\x00\x00"), ("flags", b"\x00\x00\x00\x00")])
+        self.assertEqual(len(ctx.requests[-1]), 2, "All due ranges should be read with one request")
+
+        changes.clear()
+        ctx.memory[0x80] = 1
+        self.assertTrue(await watcher.update(ctx))
+        self.assertEqual(changes, [], "Unchanged data should not call back, flags are not due yet")
+        self.assertEqual(len(ctx.requests[-1]), 1)
+
+        ctx.memory[0x11] = 5
+        self.assertTrue(await watcher.update(ctx))
+        self.assertEqual(changes, [("counter", b"\x00\x05")])
+
+        watcher.guard_list = [(0x00, [0xFF], "RAM")]
+        self.assertFalse(await watcher.update(ctx))
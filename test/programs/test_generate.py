@@ -1,12 +1,15 @@
 # Tests for Generate.py (ArchipelagoGenerate.exe)
 
+import argparse
 import unittest
 import os
 import os.path
 import sys
+import zipfile
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 import Generate
 import Main
@@ -118,9 +121,16 @@ class TestGenerateWeights(TestGenerateMain):
         settings._filename = None
         user_path_backup = user_path.cached_path
         user_path.cached_path = local_path()
+        results: dict[int, dict[str, list[int]]] = {}
         try:
-            sys.argv = [sys.argv[0], "--seed", "1"]
-            namespace, seed = Generate.main()
+            for processes in (1, 2, 3):
+                sys.argv = [sys.argv[0], "--seed", "1", "--roll_processes", str(processes)]
+                namespace, seed = Generate.main()
+                self.assertEqual(seed, 1)
+                results[processes] = {
+                    option_name: [getattr(namespace, option_name)[player].value for player in range(1, 6)]
+                    for option_name in ("accessibility", "progression_balancing")
+                }
         finally:
             user_path.cached_path = user_path_backup
 
@@ -130,10 +140,123 @@ class TestGenerateWeights(TestGenerateMain):
             "progression_balancing": [0, 50, 99, 0, 50],
         }
 
-        self.assertEqual(seed, 1)
-        for option_name, results in expected_results.items():
-            for player, result in enumerate(results, 1):
-                self.assertEqual(
-                    result, getattr(namespace, option_name)[player].value,
-                    "Generated results from weights file did not match expected value."
-                )
+        for option_name, expected in expected_results.items():
+            self.assertEqual(expected, results[1][option_name],
+                             "Generated results from weights file did not match expected value.")
+        self.assertEqual(results[2], results[3], "Rolling in a process pool should not depend on the process count.")
+
+
+class TestReadPlayerFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.original_cache_path = getattr(Generate.Utils.cache_path, "cached_path", None)
+        Generate.Utils.cache_path.cached_path = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self) -> None:
+        if self.original_cache_path is None:
+            del Generate.Utils.cache_path.cached_path
+        else:
+            Generate.Utils.cache_path.cached_path = self.original_cache_path
+        self.temp_dir.cleanup()
+
+    def write_player_file(self, name: str, text: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_cache(self) -> None:
+        path = self.write_player_file("player.yaml", "name: Player\ngame: Archipelago\nArchipelago:\n  1: 50\n")
+        documents = Generate.read_weights_yamls(path, cache=True)
+        self.assertEqual(documents, ({"name": "Player", "game": "Archipelago", "Archipelago": {1: 50}},))
+        cached = os.listdir(Generate.Utils.cache_path("yaml"))
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(Generate.read_weights_yamls(path, cache=True), documents)
+
+        self.write_player_file("player.yaml", "name: Player2\ngame: Archipelago\n")
+        self.assertEqual(Generate.read_weights_yamls(path, cache=True)[0]["name"], "Player2")
+        # types that can't be loaded safely from a cache are parsed every time
+        path = self.write_player_file("date.yaml", "name: Player\ndate: 2024-01-01\n")
+        self.assertEqual(len(Generate.read_weights_yamls(path, cache=True)), 1)
+        self.assertEqual(len(os.listdir(Generate.Utils.cache_path("yaml"))), 2)
+
+    def test_processes(self) -> None:
+        paths = {f"player{i}.yaml": self.write_player_file(f"player{i}.yaml", f"name: Player{i}\n---\n---\ngame: A\n")
+                 for i in range(4)}
+        serial = Generate.read_player_files(paths, 1)
+        self.assertEqual(serial["player1.yaml"], ({"name": "Player1"}, {"game": "A"}))
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(Generate.read_player_files(paths, 2), serial)
+        self.assertEqual(len(logs.records), 4, "Warnings of the processes should be logged")
+
+
+class TestSweep(unittest.TestCase):
+    seeds = [1, 2, 3]
+
+    def setUp(self) -> None:
+        self.original_argv = sys.argv.copy()
+        self.temp_dir = TemporaryDirectory(prefix="AP_sweep_")
+        self.player_files_path = os.path.join(self.temp_dir.name, "players")
+        os.makedirs(self.player_files_path)
+        with open(os.path.join(self.player_files_path, "player.yaml"), "w") as f:
+            f.write("name: Player\ngame: ChecksFinder\nChecksFinder: {}\n")
+
+    def tearDown(self) -> None:
+        sys.argv = self.original_argv
+        self.temp_dir.cleanup()
+
+    def get_args(self, output_dir: str, *args: str) -> argparse.Namespace:
+        sys.argv = [sys.argv[0], "--player_files_path", self.player_files_path, "--outputpath", output_dir,
+                    "--multi", "1", "--roll_processes", "1", "--spoiler", "2", *args]
+        return Generate.mystery_argparse()
+
+    @staticmethod
+    def read_output(path: Path) -> dict[str, bytes]:
+        with zipfile.ZipFile(path) as output:
+            return {name: output.read(name) for name in output.namelist()}
+
+    def assertSweepMatchesMain(self, name: str, forked: bool) -> None:
+        """Sweeps the seeds and compares each seed with generating it on its own."""
+        sweep_dir = os.path.join(self.temp_dir.name, name)
+        seed_output_dir = os.path.join(sweep_dir, "seeds")
+        # the console output of forked seeds is redirected by file descriptor, which a captured sys.stdout bypasses
+        with mock.patch.object(sys, "stdout", sys.__stdout__), mock.patch.object(sys, "stderr", sys.__stderr__):
+            results = Generate.sweep(self.get_args(sweep_dir, "--seed_output_dir", seed_output_dir), self.seeds)
+        self.assertEqual(sorted(results), self.seeds)
+        for seed in self.seeds:
+            with self.subTest(seed=seed):
+                main_dir = os.path.join(self.temp_dir.name, f"{name}_{seed}")
+                try:
+                    Main.main(*Generate.main(self.get_args(main_dir, "--seed", str(seed))))
+                except Exception:
+                    code = 1
+                else:
+                    code = 0
+                self.assertEqual(results[seed][0], code)
+                (output,) = Path(main_dir).glob("*.zip")
+                self.assertEqual(self.read_output(Path(sweep_dir, output.name)), self.read_output(output))
+                with open(os.path.join(seed_output_dir, f"{seed}.txt")) as f:
+                    self.assertEqual(f"forked after set_rules of seed {self.seeds[0]}" in f.read(), forked)
+
+    def test_parse_seeds(self) -> None:
+        self.assertEqual(Generate.parse_seeds("1-3, 7,10-11"), [1, 2, 3, 7, 10, 11])
+        self.assertEqual(Generate.parse_seeds("5"), [5])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "sweeps without os.fork don't fork or share skeletons")
+    def test_sweep_matches_main(self) -> None:
+        """Tests that every seed of a sweep is generated as it would be on its own, with and without a skeleton."""
+        from worlds.checksfinder import ChecksFinderWorld
+
+        self.assertSweepMatchesMain("skeleton", forked=True)
+        with mock.patch.object(ChecksFinderWorld, "seed_independent_steps", ()):
+            self.assertSweepMatchesMain("no_skeleton", forked=False)
+
+        create_regions = ChecksFinderWorld.create_regions
+
+        def create_regions_with_random(world: ChecksFinderWorld) -> None:
+            world.random.random()
+            create_regions(world)
+
+        # a world that uses its random in a step it declared seed independent can't share a skeleton
+        with mock.patch.object(ChecksFinderWorld, "create_regions", create_regions_with_random):
+            self.assertSweepMatchesMain("random_skeleton", forked=False)
@@ -1,5 +1,11 @@
+import asyncio
+import typing
 import unittest
-from MultiServer import Context, ServerCommandProcessor
+from unittest import mock
+from typing_extensions import override
+
+from MultiServer import Client, Context, ServerCommandProcessor, render_metrics, server
+from NetUtils import Endpoint
 
 
 class TestResolvePlayerName(unittest.TestCase):
@@ -38,3 +44,109 @@ class TestResolvePlayerName(unittest.TestCase):
         assert p.resolve_player("ABC") == (1, 2, "abc"), "case insensitive resolves when 1 match"
         assert p.resolve_player("abcd") == (1, 3, "abCD"), "case insensitive resolves when 1 match"
         assert not p.resolve_player("aB"), "partial name shouldn't resolve to player"
+
+
+class RecordingSocket:
+    """Stands in for the websocket of a Client, recording what is sent to it directly."""
+    open = True
+
+    def __init__(self, sent: typing.List[typing.Tuple[typing.List[Endpoint], str]]) -> None:
+        self.sent = sent
+        self.client: typing.Optional[Client] = None
+
+    async def send(self, msg: str) -> None:
+        assert self.client
+        self.sent.append(([self.client], msg))
+
+
+class TestSetReplyQueue(unittest.IsolatedAsyncioTestCase):
+    @override
+    def setUp(self) -> None:
+        self.ctx = Context("", 0, "", "", 0, 0, False)
+        self.sent: typing.List[typing.Tuple[typing.List[Endpoint], str]] = []
+
+        def record(endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
+            self.sent.append((list(endpoints), msg))
+            return True
+
+        self.enterContext(mock.patch.object(self.ctx, "send_encoded_broadcast", side_effect=record))
+
+    def client(self) -> Client:
+        socket = RecordingSocket(self.sent)
+        socket.client = Client(typing.cast(typing.Any, socket), self.ctx)
+        return socket.client
+
+    async def test_batched_per_tick(self) -> None:
+        a, b = self.client(), self.client()
+        self.ctx.queue_set_reply([a, b], {"cmd": "SetReply", "key": "x", "value": 1})
+        self.ctx.queue_set_reply([a, b], {"cmd": "SetReply", "key": "x", "value": 2})
+        self.ctx.queue_set_reply([b], {"cmd": "SetReply", "key": "y", "value": 3})
+        await asyncio.sleep(0)  # flush
+        self.assertEqual(len(self.sent), 2, "each distinct set of packages should be sent once")
+        by_client = {endpoint: self.ctx.loader(msg) for endpoints, msg in self.sent for endpoint in endpoints}
+        self.assertEqual([package["value"] for package in by_client[a]], [1, 2])
+        self.assertEqual([package["value"] for package in by_client[b]], [1, 2, 3])
+
+    async def test_coalesce(self) -> None:
+        a = self.client()
+        value = [1]
+        self.ctx.queue_set_reply([a], {"cmd": "SetReply", "key": "_read_x", "value": value}, coalesce=True)
+        value.append(2)  # already encoded, so in place modification must not leak into the queued package
+        self.ctx.queue_set_reply([a], {"cmd": "SetReply", "key": "other", "value": value})
+        self.ctx.queue_set_reply([a], {"cmd": "SetReply", "key": "_read_x", "value": 3}, coalesce=True)
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.sent), 1)
+        packages = self.ctx.loader(self.sent[0][1])
+        self.assertEqual([(package["key"], package["value"]) for package in packages],
+                         [("other", [1, 2]), ("_read_x", 3)],
+                         "a coalesced package should be at the position of its latest update")
+
+    async def test_order_with_direct_replies(self) -> None:
+        a, b = self.client(), self.client()
+        self.ctx.queue_set_reply([a, b], {"cmd": "SetReply", "key": "x", "value": 1})
+        await self.ctx.send_encoded_msgs(a, self.ctx.dumper([{"cmd": "Retrieved", "keys": {"x": 1}}]))
+        self.assertEqual([(endpoints, [package["cmd"] for package in self.ctx.loader(msg)])
+                          for endpoints, msg in self.sent],
+                         [([a, b], ["SetReply"]), ([a], ["Retrieved"])],
+                         "queued SetReplies should be sent before a later reply to the same client")
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.sent), 2, "flushed SetReplies should not be sent again")
+
+
+class MessageSocket(RecordingSocket):
+    """Stands in for the websocket of a connection, receiving the given messages."""
+
+    def __init__(self, sent: typing.List[typing.Tuple[typing.List[Endpoint], str]], received: typing.List[str]) -> None:
+        super().__init__(sent)
+        self.received = received
+
+    async def __aiter__(self) -> typing.AsyncIterator[str]:
+        for data in self.received:
+            yield data
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_command_labels(self) -> None:
+        ctx = Context("", 0, "", "", 0, 0, False)
+        sent: typing.List[typing.Tuple[typing.List[Endpoint], str]] = []
+        socket = MessageSocket(sent, [ctx.dumper([{"cmd": "Set", "key": "x", "want_reply": True,
+                                                   "operations": [{"operation": "replace", "value": 1}]},
+                                                  {"cmd": "Get", "keys": ["x"]}])])
+
+        async def connect(_ctx: Context, client: Client) -> None:
+            socket.client = client
+            connected: typing.Any = client  # authenticate as slot 1, skipping Connect
+            connected.auth, connected.team, connected.slot = True, 0, 1
+
+        def record(endpoints: typing.Iterable[Endpoint], msg: str) -> bool:
+            sent.append((list(endpoints), msg))
+            return True
+
+        with mock.patch("MultiServer.on_client_connected", connect), mock.patch.object(ctx, "disconnect"), \
+                mock.patch.object(ctx, "send_encoded_broadcast", side_effect=record):
+            await server(typing.cast(typing.Any, socket), ctx=ctx)
+        self.assertEqual([package["cmd"] for _, msg in sent for package in ctx.loader(msg)],
+                         ["SetReply", "Retrieved"])
+        self.assertEqual(set(ctx.metrics.commands), {"Set", "Get"},
+                         "commands should be recorded under the command that was received, not the reply")
+        self.assertIn('archipelago_command_seconds_count{command="Set"} 1', render_metrics({None: ctx}))
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+
+from SNIClient import SNESReadPlan, SNESState
+
+
+class FakeSNISocket:
+    open = True
+    closed = False
+
+    def __init__(self, ctx: SimpleNamespace, memory: bytes) -> None:
+        self.ctx = ctx
+        self.memory = memory
+        self.requests = []
+
+    async def send(self, message: str) -> None:
+        request = json.loads(message)
+        self.requests.append(request)
+        operands = request["Operands"]
+        data = b"".join(self.memory[int(address, 16):int(address, 16) + int(size, 16)]
+                        for address, size in zip(operands[::2], operands[1::2]))
+        # answer in chunks, like SNI does for bigger reads
+        for position in range(0, len(data), 16):
+            self.ctx.snes_recv_queue.put_nowait(data[position:position + 16])
+
+
+class TestSNESReadPlan(unittest.IsolatedAsyncioTestCase):
+    def test_merged_ranges(self) -> None:
+        plan = SNESReadPlan()
+        for address, size in ((0x20, 4), (0x10, 2), (0x12, 2), (0x11, 1), (0x23, 8), (0x40, 1)):
+            plan.add(address, size)
+        self.assertEqual(plan.merged_ranges(), [(0x10, 4), (0x20, 11), (0x40, 1)])
+
+    async def test_read(self) -> None:
+        memory = bytes(range(256))
+        ctx = SimpleNamespace(snes_state=SNESState.SNES_ATTACHED, snes_request_lock=asyncio.Lock(),
+                              snes_recv_queue=asyncio.Queue())
+        ctx.snes_socket = FakeSNISocket(ctx, memory)
+        plan = SNESReadPlan()
+        plan.add(0x10, 0x20)
+        plan.add(0x18, 4)
+        plan.add(0x80, 0x30)
+        self.assertTrue(await plan.read(ctx))
+        self.assertEqual(len(ctx.snes_socket.requests), 1)
+        self.assertEqual(ctx.snes_socket.requests[0]["Operands"], ["10", "20", "80", "30"])
+        self.assertEqual(plan.get(0x18, 4), memory[0x18:0x1C])
+        self.assertEqual(plan.get(0x80, 0x30), memory[0x80:0xB0])
+        with self.assertRaises(KeyError):
+            plan.get(0x2F, 2)
@@ -0,0 +1,54 @@
+# Tests for the binary data package names cache in Utils.py
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+import Utils
+
+
+class TestDataPackageNames(unittest.TestCase):
+    data = {
+        "checksum": "0123456789abcdef",
+        "item_name_to_id": {"Item": 1, "Ïtem with ünicode": 2**53, "Nothing": -1},
+        "location_name_to_id": {"Location": 3, "Cheat Console": -1},
+    }
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.old_cache_path = getattr(Utils.cache_path, "cached_path", None)
+        Utils.cache_path.cached_path = self.temp_dir.name
+
+    def tearDown(self) -> None:
+        if self.old_cache_path is None:
+            del Utils.cache_path.cached_path
+        else:
+            Utils.cache_path.cached_path = self.old_cache_path
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self) -> None:
+        self.assertIsNone(Utils.load_data_package_names("Test Game", self.data["checksum"]))
+        Utils.store_data_package_names("Test Game", self.data)
+        tables = Utils.load_data_package_names("Test Game", self.data["checksum"])
+        self.assertIsNotNone(tables)
+        for names, name_to_id in ((tables.item_names, self.data["item_name_to_id"]),
+                                  (tables.location_names, self.data["location_name_to_id"])):
+            self.assertEqual(dict(names), {code: name for name, code in name_to_id.items()})
+            self.assertNotIn(2, names)
+            self.assertNotIn("Item", names)
+        self.assertEqual(tables.item_names[2**53], "Ïtem with ünicode")
+
+    def test_invalid_file(self) -> None:
+        path = Utils.cache_path("datapackage", "Test Game", f"{self.data['checksum']}.names")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(b"APDN")
+        self.assertIsNone(Utils.load_data_package_names("Test Game", self.data["checksum"]))
+
+    def test_failed_replace(self) -> None:
+        """Tests that a failed store doesn't leave its temporary file behind."""
+        with mock.patch("os.replace", side_effect=PermissionError):
+            Utils.store_data_package_names("Test Game", self.data)
+        directory = os.path.dirname(Utils.cache_path("datapackage", "Test Game", "names"))
+        self.assertEqual(os.listdir(directory), [])
@@ -0,0 +1,48 @@
+# Tests for PersistentStorage in Utils.py
+
+import os
+import unittest
+from argparse import Namespace
+from tempfile import TemporaryDirectory
+
+from Utils import PersistentStorage
+
+
+class TestPersistentStorage(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory(ignore_cleanup_errors=True)  # database stays open on Windows
+        self.path = os.path.join(self.temp_dir.name, "storage.sqlite3")
+        self.legacy_path = os.path.join(self.temp_dir.name, "storage.yaml")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_store_and_load(self) -> None:
+        storage = PersistentStorage(self.path)
+        self.assertNotIn("client", storage)
+        storage.store("client", "last_server_address", "localhost:38281")
+        storage.store("adjuster", "game", Namespace(sprite="link"))
+        self.assertEqual(storage["client"], {"last_server_address": "localhost:38281"})
+
+        reloaded = PersistentStorage(self.path)
+        self.assertEqual(set(reloaded), {"client", "adjuster"})
+        self.assertEqual(reloaded.get("client", {}).get("last_server_address"), "localhost:38281")
+        self.assertEqual(reloaded["adjuster"]["game"].sprite, "link")
+
+    def test_store_updates_loaded_category(self) -> None:
+        storage = PersistentStorage(self.path)
+        storage.store("launcher", "filter", "clients")
+        category = storage["launcher"]
+        storage.store("launcher", "favorites", ["Text Client"])
+        self.assertEqual(category, {"filter": "clients", "favorites": ["Text Client"]})
+
+    def test_migration(self) -> None:
+        with open(self.legacy_path, "w") as f:
+            f.write("client:\n  last_server_address: archipelago.gg:38281\n")
+        storage = PersistentStorage(self.path, self.legacy_path)
+        self.assertEqual(storage["client"]["last_server_address"], "archipelago.gg:38281")
+        # only migrated once, when the database is created
+        with open(self.legacy_path, "w") as f:
+            f.write("client:\n  last_server_address: localhost\n")
+        self.assertEqual(PersistentStorage(self.path, self.legacy_path)["client"]["last_server_address"],
+                         "archipelago.gg:38281")
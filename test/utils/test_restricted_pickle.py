@@ -0,0 +1,45 @@
+# Tests for restricted_dumps and restricted_loads in Utils.py
+
+import collections
+import os
+import pickle
+import unittest
+
+from NetUtils import Hint, HintStatus, NetworkItem, NetworkSlot, SlotType
+from Options import Toggle
+from Utils import Version, restricted_dumps, restricted_loads
+
+
+class Singleton:
+    def __reduce__(self) -> str:
+        return "SINGLETON"
+
+
+SINGLETON = Singleton()
+
+
+class TestRestrictedPickle(unittest.TestCase):
+    def test_allowed_round_trip(self) -> None:
+        """Test that everything restricted_loads allows can be dumped, in the same format as pickle.dumps."""
+        data = {
+            "sets": [{1, 2}, frozenset({"a"})],
+            "counter": collections.Counter("aab"),
+            "item": NetworkItem(1, 2, 3, 0),
+            "slot": NetworkSlot("Player", "Game", SlotType.player),
+            "hint": Hint(1, 2, 3, 4, False, status=HintStatus.HINT_PRIORITY),
+            "option": Toggle(1),
+            "none": None,
+        }
+        dumped = restricted_dumps(data)
+        self.assertEqual(dumped, pickle.dumps(data))
+        self.assertEqual(restricted_loads(dumped), data)
+
+    def test_forbidden_globals(self) -> None:
+        """Test that restricted_dumps refuses anything restricted_loads would refuse."""
+        for obj in (os.system, Version(0, 1, 2), collections.OrderedDict(), type(None), [{"nested": unittest.TestCase}],
+                    SINGLETON, ...):
+            with self.subTest(obj=obj):
+                with self.assertRaises(pickle.PicklingError):
+                    restricted_dumps(obj)
+                with self.assertRaises(pickle.UnpicklingError):
+                    restricted_loads(pickle.dumps(obj))
@@ -0,0 +1,69 @@
+import os
+import queue
+import threading
+import time
+import unittest
+from unittest import mock
+from uuid import uuid4
+
+from WebHostLib import app, autolauncher
+from WebHostLib.autolauncher import GeneratorPool, RoomCommandWakeup, Wakeup
+
+
+def _init() -> None:
+    pass
+
+
+def _timed_out_job() -> str:
+    """Behaves like _mp_gen_game after gen_game timed out: the generation keeps running in a non-daemon thread."""
+    threading.Thread(target=time.sleep, args=(600,)).start()
+    autolauncher._recycle_generator = True
+    return "timed out"
+
+
+def _job(value: int) -> int:
+    return value
+
+
+class TestGeneratorPool(unittest.TestCase):
+    def test_replace_timed_out(self) -> None:
+        """Tests that a worker whose job timed out is replaced, so the pool keeps its capacity."""
+        results: list[object] = []
+        done = threading.Event()
+
+        def callback(result: object) -> None:
+            results.append(result)
+            if len(results) == 3:
+                done.set()
+
+        # the forkserver isn't a child process to ModuleUpdate, and requirements were already handled here
+        with mock.patch.dict(os.environ, {"SKIP_REQUIREMENTS_UPDATE": "1"}), GeneratorPool(1, _init, ()) as pool:
+            pool.apply_async(_timed_out_job, callback=callback, error_callback=callback)
+            pool.apply_async(_job, (1,), callback=callback, error_callback=callback)
+            pool.apply_async(_job, (2,), callback=callback, error_callback=callback)
+            self.assertTrue(done.wait(60), f"pool stopped serving jobs after a timeout, results: {results}")
+        self.assertEqual(results, ["timed out", 1, 2])
+
+
+class TestWakeup(unittest.TestCase):
+    def test_poll_interval(self) -> None:
+        """Tests that polling only slows down by default when notifications from other processes can arrive."""
+        wakeup = Wakeup(0)
+        self.assertEqual(wakeup.poll_interval({"AUTOLAUNCHER_POLL_INTERVAL": None}), 0.1)
+        self.assertEqual(wakeup.poll_interval({"AUTOLAUNCHER_POLL_INTERVAL": 5}), 5)
+        wakeup.listen({"AUTOLAUNCHER_NOTIFY_PORT": 0})  # any free port
+        self.assertEqual(wakeup.poll_interval({"AUTOLAUNCHER_POLL_INTERVAL": None}), 1)
+
+    def test_room_command(self) -> None:
+        """Tests that a room command notification from another process reaches the hoster of the room."""
+        room_id = uuid4()
+        hoster = mock.Mock(room_ids={room_id}, room_commands=queue.Queue())
+        wakeup = RoomCommandWakeup(0)
+        wakeup.listen({"AUTOLAUNCHER_NOTIFY_PORT": 0})  # any free port
+        assert wakeup._socket
+        port = wakeup._socket.getsockname()[1]
+        with mock.patch.dict(app.config, {"AUTOLAUNCHER_NOTIFY_PORT": port}), \
+                mock.patch.object(autolauncher, "_hosters", [hoster]):
+            wakeup.notify(b"not a room")
+            wakeup.notify(room_id.bytes)
+            self.assertEqual(hoster.room_commands.get(timeout=10), room_id)
@@ -93,3 +93,32 @@ class TestTracker(TestBase):
                 headers={"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00"},  # missing timezone
             )
             self.assertEqual(response.status_code, 400)
+
+    def test_tracker_data_cache(self) -> None:
+        """
+        Verify that decoded data is shared between TrackerData of a room until the room saves again
+        """
+        import datetime
+        from pony.orm import db_session
+        from WebHostLib.models import Room
+        from WebHostLib.tracker import TrackerData
+
+        with self.app.app_context(), db_session:
+            room: Room = Room.get(id=self.room_id)
+            first = TrackerData(room)
+            second = TrackerData(room)
+            self.assertIs(first._multidata, second._multidata)
+            self.assertIs(first._multisave, second._multisave)
+            self.assertIs(first.item_id_to_name["Archipelago"], second.item_id_to_name["Archipelago"])
+            self.assertEqual(first.get_player_checked_locations(0, 1), set())
+
+            room.multisave = pickle.dumps({"location_checks": {(0, 1): {-1}}})
+            room.last_activity = datetime.datetime.utcnow() + datetime.timedelta(seconds=1)
+            third = TrackerData(room)
+            self.assertIs(first._multidata, third._multidata)
+            self.assertEqual(third.get_player_checked_locations(0, 1), {-1})
+
+            # saves on shutdown don't update last_activity
+            room.multisave = pickle.dumps({"location_checks": {(0, 1): {-1, -2}}})
+            fourth = TrackerData(room)
+            self.assertEqual(fourth.get_player_checked_locations(0, 1), {-1, -2})
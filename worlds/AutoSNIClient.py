@@ -59,6 +59,8 @@ class AutoSNIClientRegister(abc.ABCMeta):
 
     @staticmethod
     async def get_handler(ctx: SNIContext) -> Optional[SNIClient]:
+        from worlds import load_all_worlds
+        load_all_worlds()  # handlers register when their world is imported
         for _game, handler in AutoSNIClientRegister.game_handlers.items():
             try:
                 if await handler.validate_rom(ctx):
@@ -7,8 +7,8 @@ import sys
 import time
 from random import Random
 from dataclasses import make_dataclass
-from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, TextIO, Tuple,
-                    TYPE_CHECKING, Type, Union)
+from typing import (Any, Callable, ClassVar, Dict, FrozenSet, Iterable, Iterator, List, Mapping, MutableMapping,
+                    Optional, Set, TextIO, Tuple, TYPE_CHECKING, Type, Union)
 
 from Options import item_and_loc_options, ItemsAccessibility, OptionGroup, PerGameCommonOptions
 from BaseClasses import CollectionState
@@ -21,9 +21,73 @@ if TYPE_CHECKING:
 
 perf_logger = logging.getLogger("performance")
 
+forkable_steps: Tuple[str, ...] = ("generate_early", "create_regions", "create_items", "set_rules")
+""" the steps of Main, in order, that a world can declare in World.seed_independent_steps """
+
+
+class WorldTypes(MutableMapping[str, "Type[World]"]):
+    """game -> World class. Games only known from the world manifest get their world imported on first lookup,
+    iterating imports all of them."""
+    _worlds: Dict[str, Type[World]]
+    _pending: Dict[str, Callable[[], Any]]
+    """ game -> function that imports the world of the game """
+
+    def __init__(self) -> None:
+        self._worlds = {}
+        self._pending = {}
+
+    def add_pending(self, game: str, load: Callable[[], Any]) -> None:
+        if game not in self._worlds:
+            self._pending[game] = load
+
+    def discard_pending(self, game: str) -> None:
+        self._pending.pop(game, None)
+
+    @property
+    def loaded(self) -> Mapping[str, Type[World]]:
+        """The worlds that have been imported, without importing any more."""
+        return self._worlds
+
+    def _load(self, game: str) -> None:
+        load = self._pending.pop(game, None)
+        if load:
+            load()
+
+    def load_all(self) -> None:
+        while self._pending:
+            self._load(next(iter(self._pending)))
+
+    def __getitem__(self, game: str) -> Type[World]:
+        self._load(game)
+        return self._worlds[game]
+
+    def __contains__(self, game: object) -> bool:
+        if isinstance(game, str):
+            self._load(game)
+        return game in self._worlds
+
+    def __setitem__(self, game: str, world: Type[World]) -> None:
+        self._pending.pop(game, None)
+        self._worlds[game] = world
+
+    def __delitem__(self, game: str) -> None:
+        self._pending.pop(game, None)
+        del self._worlds[game]
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_all()
+        return iter(self._worlds)
+
+    def __len__(self) -> int:
+        self.load_all()
+        return len(self._worlds)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._worlds!r}, pending={list(self._pending)!r})"
+
 
 class AutoWorldRegister(type):
-    world_types: Dict[str, Type[World]] = {}
+    world_types: MutableMapping[str, Type[World]] = WorldTypes()
     __file__: str
     zip_path: Optional[str]
     settings_key: str
@@ -55,6 +119,8 @@ class AutoWorldRegister(type):
         dct["item_name_groups"] = {group_name: frozenset(group_set) for group_name, group_set
                                    in dct.get("item_name_groups", {}).items()}
         dct["item_name_groups"]["Everything"] = dct["item_names"]
+        dct["item_name_group_members"] = {group_name: tuple(sorted(group_set)) for group_name, group_set
+                                          in dct["item_name_groups"].items()}
 
         dct["location_names"] = frozenset(dct["location_name_to_id"])
         dct["location_name_groups"] = {group_name: frozenset(group_set) for group_name, group_set
@@ -275,6 +341,8 @@ class World(metaclass=AutoWorldRegister):
 
     item_name_groups: ClassVar[Dict[str, Set[str]]] = {}
     """maps item group names to sets of items. Example: {"Weapons": {"Sword", "Bow"}}"""
+    item_name_group_members: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+    """gets automatically populated with the item names of each item group, used by the group functions of state"""
 
     location_name_groups: ClassVar[Dict[str, Set[str]]] = {}
     """maps location group names to sets of locations. Example: {"Sewer": {"Sewer Key Drop 1", "Sewer Key Drop 2"}}"""
@@ -301,6 +369,11 @@ class World(metaclass=AutoWorldRegister):
     origin_region_name: str = "Menu"
     """Name of the Region from which accessibility is tested."""
 
+    seed_independent_steps: ClassVar[Tuple[str, ...]] = ()
+    """The leading steps of forkable_steps that don't depend on the seed: they don't use any random source or the seed
+    name. Generate.sweep builds a multiworld of only such worlds up to these steps once, and forks the generation of
+    every seed from there."""
+
     explicit_indirect_conditions: bool = True
     """If True, the world implementation is supposed to use MultiWorld.register_indirect_condition() correctly.
     If False, everything is rechecked at every step, which is slower computationally, 
@@ -33,6 +33,8 @@ class AutoPatchRegister(abc.ABCMeta):
 
     @staticmethod
     def get_handler(file: str) -> Optional[AutoPatchRegister]:
+        from worlds import load_all_worlds
+        load_all_worlds()  # patch types register when their world is imported
         _, suffix = os.path.splitext(file)
         return AutoPatchRegister.file_endings.get(suffix, None)
 
@@ -52,6 +54,8 @@ class AutoPatchExtensionRegister(abc.ABCMeta):
     def get_handler(game: Optional[str]) -> Union[AutoPatchExtensionRegister, List[AutoPatchExtensionRegister]]:
         if not game:
             return APPatchExtension
+        from worlds import load_all_worlds
+        load_all_worlds()  # extensions register when their world is imported
         handler = AutoPatchExtensionRegister.extension_types.get(game, APPatchExtension)
         if handler.required_extensions:
             handlers = [handler]
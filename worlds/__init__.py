@@ -1,5 +1,8 @@
+import functools
+import hashlib
 import importlib
 import importlib.util
+import json
 import logging
 import os
 import sys
@@ -7,10 +10,10 @@ import warnings
 import zipimport
 import time
 import dataclasses
-from typing import List
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
-from NetUtils import DataPackage
-from Utils import local_path, user_path
+from NetUtils import DataPackage, GamesPackage
+from Utils import cache_path, local_path, user_path, __version__
 
 local_folder = os.path.dirname(__file__)
 user_folder = user_path("worlds") if user_path() != local_path() else user_path("custom_worlds")
@@ -26,12 +29,25 @@ __all__ = {
     "local_folder",
     "user_folder",
     "failed_world_loads",
+    "game_manifests",
+    "load_all_worlds",
+    "import_world_module",
 }
 
 
 failed_world_loads: List[str] = []
 
 
+def _hash_files(digest: "hashlib._Hash", path: str, recursive: bool = True, suffix: str = "") -> None:
+    """Adds the relative path, size and modification time of every file in path ending in suffix to digest."""
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(directory for directory in dirs if directory != "__pycache__") if recursive else []
+        for file in sorted(file for file in files if file.endswith(suffix)):
+            file_path = os.path.join(root, file)
+            stat = os.stat(file_path)
+            digest.update(f"{os.path.relpath(file_path, path)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+
+
 @dataclasses.dataclass(order=True)
 class WorldSource:
     path: str  # typically relative path from this module
@@ -48,6 +64,20 @@ class WorldSource:
             return os.path.join(local_folder, self.path)
         return self.path
 
+    @property
+    def module_name(self) -> str:
+        return os.path.basename(self.path).rsplit(".", 1)[0] if self.is_zip else os.path.basename(self.path)
+
+    def get_fingerprint(self) -> str:
+        """Changes whenever a file of the source changes, which invalidates its entry in the world manifest."""
+        path = self.resolved_path
+        if self.is_zip:
+            stat = os.stat(path)
+            return f"{stat.st_size}-{stat.st_mtime_ns}"
+        digest = hashlib.sha1()
+        _hash_files(digest, path)
+        return digest.hexdigest()
+
     def load(self) -> bool:
         try:
             start = time.perf_counter()
@@ -100,15 +130,165 @@ for folder in (folder for folder in (user_folder, local_folder) if folder):
             elif entry.is_file() and entry.name.endswith(".apworld"):
                 world_sources.append(WorldSource(file_name, is_zip=True, relative=relative))
 
-# import all submodules to trigger AutoWorldRegister
 world_sources.sort()
-for world_source in world_sources:
-    world_source.load()
 
-# Build the data package for each game.
+
+class GameManifest(NamedTuple):
+    """What is known about a game without importing its world, cached in the world manifest."""
+    source: WorldSource
+    data: GamesPackage
+    """ data package of the game """
+    hint_blacklist: FrozenSet[str]
+    settings: Optional[Tuple[str, str]]
+    """ settings_key and "module.WorldClass" if the world has settings """
+
+
+game_manifests: Dict[str, GameManifest] = {}
+""" game -> manifest of every world that loaded, whether imported yet or not """
+_manifest_format = 1
+_source_results: Dict[str, bool] = {}
+""" resolved path -> whether the source loaded, for sources that were attempted """
+
+
+def _get_manifest_path() -> str:
+    # separate installs have separate core worlds
+    return cache_path("worlds", f"manifest_{hashlib.sha1(local_folder.encode()).hexdigest()[:16]}.json")
+
+
+def _get_core_fingerprint() -> str:
+    """Changes with the Archipelago version and any file that worlds share, like BaseClasses, Options, AutoWorld,
+    worlds/generic, the _ folders of worlds and the data folder, which invalidates the whole world manifest."""
+    digest = hashlib.sha1(__version__.encode())
+    try:
+        _hash_files(digest, local_path(), recursive=False, suffix=".py")  # frozen builds have them in library.zip
+        _hash_files(digest, local_path("data"))
+        _hash_files(digest, local_folder, recursive=False, suffix=".py")
+        for entry in sorted(os.scandir(local_folder), key=lambda entry: entry.name):
+            if entry.is_dir() and (entry.name.startswith("_") or entry.name == "generic"):
+                _hash_files(digest, entry.path)
+    except OSError as e:
+        logging.debug(f"Could not fingerprint shared world files: {e}")
+    return digest.hexdigest()
+
+
+def _load_source(source: WorldSource) -> bool:
+    if source.resolved_path in _source_results:
+        return _source_results[source.resolved_path]
+    _source_results[source.resolved_path] = False
+    for game, manifest in game_manifests.items():
+        if manifest.source is source:
+            AutoWorldRegister.world_types.discard_pending(game)
+    _source_results[source.resolved_path] = result = source.load()
+    return result
+
+
+def load_all_worlds() -> None:
+    """Imports all worlds that have not been imported yet. Needed before looking through anything worlds register
+    on import other than world types, like Launcher components or client and patch handlers."""
+    AutoWorldRegister.world_types.load_all()
+
+
+def import_world_module(name: str):
+    """Imports a module of a world by name, like "worlds.alttp", including from .apworld files that were not loaded
+    yet, which the regular import system can't find."""
+    module_name = name.split(".")[1] if name.startswith("worlds.") else None
+    for source in world_sources:
+        if source.module_name == module_name:
+            _load_source(source)
+            break
+    return importlib.import_module(name)
+
+
+def _get_game_manifests(source: WorldSource, games: Set[str]) -> Dict[str, GameManifest]:
+    """Builds manifests from the imported worlds of games that registered while importing source. Worlds of other
+    sources that source imported are attributed to their own source."""
+    sources_by_module = {world_source.module_name: world_source for world_source in world_sources}
+    manifests = {}
+    for game in games:
+        world = AutoWorldRegister.world_types.loaded[game]
+        module_path = world.__module__.split(".")
+        owner = sources_by_module.get(module_path[1], source) if module_path[0] == "worlds" else source
+        annotation = world.__annotations__.get("settings", None)
+        if annotation is None or annotation == "ClassVar[Optional['Group']]":
+            settings = None
+        else:
+            settings = world.settings_key, f"{world.__module__}.{world.__name__}"
+        manifests[game] = GameManifest(owner, world.get_data_package_data(), world.hint_blacklist, settings)
+    return manifests
+
+
+def _read_manifest() -> Dict[str, dict]:
+    try:
+        with open(_get_manifest_path(), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("format") != _manifest_format or manifest.get("core") != _get_core_fingerprint():
+        return {}
+    return manifest["sources"]
+
+
+def _write_manifest(fingerprints: Dict[str, str]) -> None:
+    sources: Dict[str, dict] = {path: {"fingerprint": fingerprint, "games": {}}
+                                for path, fingerprint in fingerprints.items()}
+    for game, manifest in game_manifests.items():
+        path = manifest.source.resolved_path
+        if path in sources:
+            sources[path]["games"][game] = {"data": manifest.data, "hint_blacklist": sorted(manifest.hint_blacklist),
+                                            "settings": manifest.settings}
+    path = _get_manifest_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": _manifest_format, "core": _get_core_fingerprint(), "sources": sources}, f,
+                      separators=(",", ":"))
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not write world manifest {path}: {e}")
+
+
+def _init_worlds() -> None:
+    """Import worlds that changed since the manifest was written, or are not in it, and register the others to be
+    imported when they are first looked up. Sources that failed to load are not in the manifest, so they are
+    attempted on every start."""
+    cached_sources = _read_manifest()
+    fingerprints: Dict[str, str] = {}
+    changed = False
+    for source in world_sources:
+        path = source.resolved_path
+        try:
+            fingerprint = fingerprints[path] = source.get_fingerprint()
+        except OSError:
+            fingerprint = None
+        cached = cached_sources.get(path)
+        if fingerprint and cached and cached["fingerprint"] == fingerprint:
+            load = functools.partial(_load_source, source)
+            for game, entry in cached["games"].items():
+                if game in game_manifests:
+                    continue  # registered by a world imported with another source, which is more recent
+                settings = tuple(entry["settings"]) if entry["settings"] else None
+                game_manifests[game] = GameManifest(source, entry["data"], frozenset(entry["hint_blacklist"]),
+                                                    settings)
+                AutoWorldRegister.world_types.add_pending(game, load)
+        else:
+            changed = True
+            known_games = set(AutoWorldRegister.world_types.loaded)
+            if _load_source(source):
+                game_manifests.update(_get_game_manifests(source, set(AutoWorldRegister.world_types.loaded)
+                                                          - known_games))
+            else:
+                fingerprints.pop(path, None)
+    if changed or len(cached_sources) != len(fingerprints):
+        _write_manifest(fingerprints)
+
+
 from .AutoWorld import AutoWorldRegister
 
+_init_worlds()
+
+# The data package of each game, from the manifest.
 network_data_package: DataPackage = {
-    "games": {world_name: world.get_data_package_data() for world_name, world in AutoWorldRegister.world_types.items()},
+    "games": {game: manifest.data for game, manifest in game_manifests.items()},
 }
 
@@ -8,9 +8,11 @@ naively passed to BizHawk without validation or modification.
 import asyncio
 import base64
 import enum
+import inspect
 import json
 import sys
-from typing import Any, Sequence
+import time
+from typing import Any, Awaitable, Callable, Sequence
 
 
 BIZHAWK_SOCKET_PORT_RANGE_START = 43055
@@ -334,3 +336,84 @@ async def write(ctx: BizHawkContext, write_list: Sequence[tuple[int, Sequence[in
     - `value` is a list of bytes to write, in order, starting at `address`
     - `domain` is the name of the region of memory the address corresponds to"""
     await guarded_write(ctx, write_list, [])
+
+
+class MemoryWatch:
+    """A memory range registered with a `MemoryWatcher`. `data` holds the bytes from the last read, if any."""
+    address: int
+    size: int
+    domain: str
+    interval: float
+    callback: Callable[[bytes], Awaitable[None] | None]
+    data: bytes | None
+    next_read: float
+
+    def __init__(self, address: int, size: int, domain: str, interval: float,
+                 callback: Callable[[bytes], Awaitable[None] | None]) -> None:
+        self.address = address
+        self.size = size
+        self.domain = domain
+        self.interval = interval
+        self.callback = callback
+        self.data = None
+        self.next_read = 0
+
+
+class MemoryWatcher:
+    """Polls registered memory ranges, so clients do not have to re-read unchanged memory themselves.
+
+    Clients register ranges with `watch`, each with how often it should be read and a callback. Once per iteration of
+    the game watcher loop, `update` reads every range that is due in a single `send_requests` call and calls the
+    callbacks of ranges whose data changed since their last read."""
+    watches: list[MemoryWatch]
+    guard_list: Sequence[tuple[int, Sequence[int], str]]
+    """Only read anything if these guards validate, see `guarded_read`"""
+
+    def __init__(self) -> None:
+        self.watches = []
+        self.guard_list = []
+
+    def watch(self, address: int, size: int, domain: str, callback: Callable[[bytes], Awaitable[None] | None],
+              interval: float = 0) -> MemoryWatch:
+        """Reads `size` bytes at `address` at most every `interval` seconds, or every update if 0, and calls
+        `callback` with the data, which may be a coroutine function, whenever it changed. The first read always counts
+        as a change."""
+        watch = MemoryWatch(address, size, domain, interval, callback)
+        self.watches.append(watch)
+        return watch
+
+    def unwatch(self, watch: MemoryWatch) -> None:
+        self.watches.remove(watch)
+
+    def clear(self) -> None:
+        self.watches.clear()
+        self.guard_list = []
+
+    def reset(self) -> None:
+        """Forgets all previously read data, so every callback is called again on its next read."""
+        for watch in self.watches:
+            watch.data = None
+            watch.next_read = 0
+
+    async def update(self, ctx: BizHawkContext) -> bool:
+        """Reads all due ranges and calls the callbacks of the changed ones.
+
+        Returns False if `guard_list` failed to validate, in which case nothing was read."""
+        now = time.monotonic()
+        due = [watch for watch in self.watches if watch.next_read <= now]
+        if not due:
+            return True
+
+        data = await guarded_read(ctx, [(watch.address, watch.size, watch.domain) for watch in due], self.guard_list)
+        if data is None:
+            return False
+
+        for watch, value in zip(due, data):
+            watch.next_read = now + watch.interval
+            if value != watch.data:
+                watch.data = value
+                result = watch.callback(value)
+                if inspect.isawaitable(result):
+                    await result
+
+        return True
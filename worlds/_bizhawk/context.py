@@ -14,8 +14,8 @@ from CommonClient import CommonContext, ClientCommandProcessor, get_base_parser,
 import Patch
 import Utils
 
-from . import BizHawkContext, ConnectionStatus, NotConnectedError, RequestFailedError, connect, disconnect, get_hash, \
-    get_script_version, get_system, ping, display_message
+from . import BizHawkContext, ConnectionStatus, MemoryWatcher, NotConnectedError, RequestFailedError, connect, \
+    disconnect, get_hash, get_script_version, get_system, ping, display_message
 from .client import BizHawkClient, AutoBizHawkClientRegister
 
 
@@ -127,6 +127,8 @@ class BizHawkClientContext(CommonContext):
     slot_data: dict[str, Any] | None = None
     rom_hash: str | None = None
     bizhawk_ctx: BizHawkContext
+    memory_watcher: MemoryWatcher
+    """Memory ranges the client handler wants read each iteration, before its `game_watcher` is called"""
 
     watcher_timeout: float
     """The maximum amount of time the game watcher loop will wait for an update from the server before executing"""
@@ -138,6 +140,7 @@ class BizHawkClientContext(CommonContext):
         self.password_requested = False
         self.client_handler = None
         self.bizhawk_ctx = BizHawkContext()
+        self.memory_watcher = MemoryWatcher()
         self.watcher_timeout = 0.5
 
     def _categorize_text(self, args: dict) -> TextCategory:
@@ -268,6 +271,7 @@ async def _game_watcher(ctx: BizHawkClientContext):
                 ctx.auth = None
                 ctx.username = None
                 ctx.client_handler = None
+                ctx.memory_watcher.clear()
                 ctx.finished_game = False
                 await ctx.disconnect(False)
             ctx.rom_hash = rom_hash
@@ -299,6 +303,15 @@ async def _game_watcher(ctx: BizHawkClientContext):
         else:
             ctx.auth_status = AuthStatus.NOT_AUTHENTICATED
 
+        # Read watched memory, calling the handler's callbacks for anything that changed
+        try:
+            await ctx.memory_watcher.update(ctx.bizhawk_ctx)
+        except RequestFailedError as exc:
+            logger.info(f"Lost connection to BizHawk: {exc.args[0]}")
+            continue
+        except NotConnectedError:
+            continue
+
         # Call the handler's game watcher
         await ctx.client_handler.game_watcher(ctx)
 
@@ -30,6 +30,7 @@ class ChecksFinderWorld(World):
 
     item_name_to_id = {name: data.code for name, data in item_table.items()}
     location_name_to_id = {name: data.id for name, data in advancement_table.items()}
+    seed_independent_steps = ("generate_early", "create_regions", "create_items", "set_rules")
 
     def create_regions(self):
         menu = Region("Menu", self.player, self.multiworld)
@@ -51,16 +51,26 @@ class DKC3SNIClient(SNIClient):
 
 
     async def game_watcher(self, ctx):
-        from SNIClient import snes_buffered_write, snes_flush_writes, snes_read
+        from SNIClient import SNESReadPlan, snes_buffered_write, snes_flush_writes, snes_read
         # DKC3_TODO: Handle Deathlink
         save_file_name = await snes_read(ctx, DKC3_FILE_NAME_ADDR, 0x5)
         if save_file_name is None or save_file_name[0] == 0x00 or save_file_name == bytes([0x55] * 0x05):
             # We haven't loaded a save file
             return
 
+        # everything this tick needs before sending checks, in a single request
+        reads = SNESReadPlan()
+        reads.add(WRAM_START + 0x5FE, 0x81)
+        reads.add(DKC3_FILE_NAME_ADDR, 0x5)
+        reads.add(DKC3_ROMHASH_START, ROMHASH_SIZE)
+        reads.add(ROM_START + 0x3FF800, 0x60)
+        reads.add(ROM_START + 0x3FF860, 0x60)
+        if not await reads.read(ctx):
+            return
+
         new_checks = []
         from .Rom import location_rom_data, item_rom_data, boss_location_ids, level_unlock_map
-        location_ram_data = await snes_read(ctx, WRAM_START + 0x5FE, 0x81)
+        location_ram_data = reads.get(WRAM_START + 0x5FE, 0x81)
         for loc_id, loc_data in location_rom_data.items():
             if loc_id not in ctx.locations_checked:
                 data = location_ram_data[loc_data[0] - 0x5FE]
@@ -71,13 +81,13 @@ class DKC3SNIClient(SNIClient):
                     # DKC3_TODO: Handle non-included checks
                     new_checks.append(loc_id)
 
-        verify_save_file_name = await snes_read(ctx, DKC3_FILE_NAME_ADDR, 0x5)
+        verify_save_file_name = reads.get(DKC3_FILE_NAME_ADDR, 0x5)
         if verify_save_file_name is None or verify_save_file_name[0] == 0x00 or verify_save_file_name == bytes([0x55] * 0x05) or verify_save_file_name != save_file_name:
             # We have somehow exited the save file (or worse)
             ctx.rom = None
             return
 
-        rom = await snes_read(ctx, DKC3_ROMHASH_START, ROMHASH_SIZE)
+        rom = reads.get(DKC3_ROMHASH_START, ROMHASH_SIZE)
         if rom != ctx.rom:
             ctx.rom = None
             # We have somehow loaded a different ROM
@@ -90,8 +100,20 @@ class DKC3SNIClient(SNIClient):
                 f'New Check: {location} ({len(ctx.locations_checked)}/{len(ctx.missing_locations) + len(ctx.checked_locations)})')
             await ctx.send_msgs([{"cmd": 'LocationChecks', "locations": [new_check_id]}])
 
+        # the game kept running while the checks were sent, so verify the save file again right before writing to it
+        item_reads = SNESReadPlan()
+        item_reads.add(DKC3_FILE_NAME_ADDR, 0x5)
+        item_reads.add(DKC3_RECV_PROGRESS_ADDR, 1)
+        if not await item_reads.read(ctx):
+            return
+
+        if item_reads.get(DKC3_FILE_NAME_ADDR, 0x5) != save_file_name:
+            # We have somehow exited the save file (or worse)
+            ctx.rom = None
+            return
+
         # DKC3_TODO: Make this actually visually display new things received (ASM Hook required)
-        recv_count = await snes_read(ctx, DKC3_RECV_PROGRESS_ADDR, 1)
+        recv_count = item_reads.get(DKC3_RECV_PROGRESS_ADDR, 1)
         recv_index = recv_count[0]
 
         if recv_index < len(ctx.items_received):
@@ -180,8 +202,8 @@ class DKC3SNIClient(SNIClient):
             await snes_flush_writes(ctx)
 
         # Handle Collected Locations
-        levels_to_tiles = await snes_read(ctx, ROM_START + 0x3FF800, 0x60)
-        tiles_to_levels = await snes_read(ctx, ROM_START + 0x3FF860, 0x60)
+        levels_to_tiles = reads.get(ROM_START + 0x3FF800, 0x60)
+        tiles_to_levels = reads.get(ROM_START + 0x3FF860, 0x60)
         for loc_id in ctx.checked_locations:
             if loc_id not in ctx.locations_checked and loc_id not in boss_location_ids:
                 loc_data = location_rom_data[loc_id]
@@ -1,4 +1,5 @@
 import collections
+import dataclasses
 import logging
 import typing
 
@@ -69,7 +70,7 @@ def locality_rules(multiworld: MultiWorld):
             if (location.player, location.item_rule) in func_cache:
                 location.item_rule = func_cache[location.player, location.item_rule]
             # empty rule that just returns True, overwrite
-            elif location.item_rule is Location.item_rule:
+            elif location.item_rule is Location.default_item_rule:
                 func_cache[location.player, location.item_rule] = location.item_rule = \
                     lambda i, sending_blockers = forbid_data[location.player], \
                                             old_rule = location.item_rule: \
@@ -96,6 +97,259 @@ def exclusion_rules(multiworld: MultiWorld, player: int, exclude_locations: typi
                 logging.warning(f"Unable to exclude location {loc_name} in player {player}'s world.")
 
 
+class Rule:
+    """
+    Base of declarative access rules. Rules are callable with a CollectionState, so they can be used as access_rule,
+    and combining them with `&`, `|`, And, Or or add_rule flattens and folds them instead of nesting functions.
+    They can report what they depend on and be exported to the rules.json format without analyzing their source.
+    """
+    __slots__ = ()
+    cost: typing.ClassVar[int] = 0
+    """ relative cost of evaluating the rule, cheaper rules are checked first in And and Or """
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        raise NotImplementedError
+
+    def __and__(self, other: "Rule") -> "Rule":
+        return And(self, other)
+
+    def __or__(self, other: "Rule") -> "Rule":
+        return Or(self, other)
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        """The (item name, player) pairs the rule reads."""
+        return set()
+
+    def region_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        """The (region name, player) pairs whose reachability the rule reads."""
+        return set()
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """The rule as a rules.json rule node."""
+        raise NotImplementedError
+
+
+def _constant_node(value: typing.Any) -> typing.Dict[str, typing.Any]:
+    return {"type": "constant", "value": value}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Constant(Rule):
+    value: bool
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        return self.value
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return _constant_node(self.value)
+
+
+true_rule = Constant(True)
+false_rule = Constant(False)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Has(Rule):
+    """state.has(item, player, count)"""
+    item: str
+    player: int
+    count: int = 1
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        return state.prog_items[self.player][self.item] >= self.count
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return {(self.item, self.player)}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        if self.count == 1:
+            return {"type": "item_check", "item": _constant_node(self.item)}
+        return {"type": "item_check", "item": _constant_node(self.item), "count": _constant_node(self.count)}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HasAll(Rule):
+    """state.has_all(items, player)"""
+    items: typing.Tuple[str, ...]
+    player: int
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "items", tuple(self.items))
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        player_prog_items = state.prog_items[self.player]
+        for item in self.items:
+            if not player_prog_items[item]:
+                return False
+        return True
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return {(item, self.player) for item in self.items}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {"type": "and", "conditions": [Has(item, self.player).to_dict() for item in self.items]}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class HasAny(Rule):
+    """state.has_any(items, player)"""
+    items: typing.Tuple[str, ...]
+    player: int
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "items", tuple(self.items))
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        player_prog_items = state.prog_items[self.player]
+        for item in self.items:
+            if player_prog_items[item]:
+                return True
+        return False
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return {(item, self.player) for item in self.items}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {"type": "or", "conditions": [Has(item, self.player).to_dict() for item in self.items]}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Count(Rule):
+    """state.has_from_list(items, player, count), at least count of the items in total"""
+    items: typing.Tuple[str, ...]
+    player: int
+    count: int
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "items", tuple(self.items))
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        player_prog_items = state.prog_items[self.player]
+        found = 0
+        for item in self.items:
+            found += player_prog_items[item]
+            if found >= self.count:
+                return True
+        return False
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return {(item, self.player) for item in self.items}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {"type": "state_method", "method": "has_from_list",
+                "args": [_constant_node(list(self.items)), _constant_node(self.count)]}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CanReachRegion(Rule):
+    """state.can_reach_region(region, player). Remember to register indirect conditions for entrances using it."""
+    region: str
+    player: int
+    cost = 10
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        return state.multiworld.get_region(self.region, self.player).can_reach(state)
+
+    def region_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return {(self.region, self.player)}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {"type": "can_reach", "region": _constant_node(self.region)}
+
+
+class _Combined(Rule):
+    __slots__ = ("rules",)
+    rules: typing.Tuple[Rule, ...]
+    _node_type: typing.ClassVar[str]
+    _absorbing: typing.ClassVar[bool]
+    """ the constant that decides the result on its own """
+    _merged_type: typing.ClassVar[typing.Type[typing.Union["HasAll", "HasAny"]]]
+    """ the item rule single item Has rules of the same player are merged into """
+
+    def __new__(cls, *rules: Rule) -> Rule:  # type: ignore[misc]
+        combined: typing.List[Rule] = []
+        merged_items: typing.Dict[int, typing.List[str]] = {}
+        merged_positions: typing.Dict[int, int] = {}
+        for argument in rules:
+            if not isinstance(argument, Rule):
+                raise TypeError(f"{cls.__name__} can only combine Rule objects, got {argument!r}")
+            for rule in argument.rules if type(argument) is cls else (argument,):  # flatten nested rules of cls
+                if isinstance(rule, Constant):
+                    if bool(rule.value) is cls._absorbing:
+                        return true_rule if rule.value else false_rule
+                elif isinstance(rule, cls._merged_type) or (isinstance(rule, Has) and rule.count == 1):
+                    if rule.player not in merged_positions:
+                        merged_positions[rule.player] = len(combined)
+                        merged_items[rule.player] = []
+                        combined.append(rule)
+                    merged_items[rule.player].extend(rule.items if isinstance(rule, cls._merged_type) else (rule.item,))
+                else:
+                    combined.append(rule)
+        for player, position in merged_positions.items():
+            names = tuple(dict.fromkeys(merged_items[player]))
+            combined[position] = Has(names[0], player) if len(names) == 1 else cls._merged_type(names, player)
+
+        combined = list(dict.fromkeys(combined))  # remove duplicates, keeping order
+        if not combined:
+            return false_rule if cls._absorbing else true_rule
+        if len(combined) == 1:
+            return combined[0]
+        combined.sort(key=lambda rule: rule.cost)  # stable, so rules of the same cost keep their order
+        self = object.__new__(cls)
+        self.rules = tuple(combined)
+        return self
+
+    @property
+    def cost(self) -> int:  # type: ignore[override]
+        return max(rule.cost for rule in self.rules) + 1
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and self.rules == typing.cast(_Combined, other).rules
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.rules))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(map(repr, self.rules))})"
+
+    def item_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return set().union(*(rule.item_dependencies() for rule in self.rules))
+
+    def region_dependencies(self) -> typing.Set[typing.Tuple[str, int]]:
+        return set().union(*(rule.region_dependencies() for rule in self.rules))
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        return {"type": self._node_type, "conditions": [rule.to_dict() for rule in self.rules]}
+
+
+class And(_Combined):
+    """All rules have to be fulfilled. Nested Ands are flattened, constants folded and Has merged into HasAll."""
+    __slots__ = ()
+    _node_type = "and"
+    _absorbing = False
+    _merged_type = HasAll
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        for rule in self.rules:
+            if not rule(state):
+                return False
+        return True
+
+
+class Or(_Combined):
+    """Any rule has to be fulfilled. Nested Ors are flattened, constants folded and Has merged into HasAny."""
+    __slots__ = ()
+    _node_type = "or"
+    _absorbing = True
+    _merged_type = HasAny
+
+    def __call__(self, state: "BaseClasses.CollectionState") -> bool:
+        for rule in self.rules:
+            if rule(state):
+                return True
+        return False
+
+
 def set_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"], rule: CollectionRule):
     spot.access_rule = rule
 
@@ -103,8 +357,10 @@ def set_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"],
 def add_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"], rule: CollectionRule, combine="and"):
     old_rule = spot.access_rule
     # empty rule, replace instead of add
-    if old_rule is Location.access_rule or old_rule is Entrance.access_rule:
+    if old_rule is Location.default_access_rule or old_rule is Entrance.default_access_rule:
         spot.access_rule = rule if combine == "and" else old_rule
+    elif isinstance(rule, Rule) and isinstance(old_rule, Rule):
+        spot.access_rule = And(rule, old_rule) if combine == "and" else Or(rule, old_rule)
     else:
         if combine == "and":
             spot.access_rule = lambda state: rule(state) and old_rule(state)
@@ -115,7 +371,7 @@ def add_rule(spot: typing.Union["BaseClasses.Location", "BaseClasses.Entrance"],
 def forbid_item(location: "BaseClasses.Location", item: str, player: int):
     old_rule = location.item_rule
     # empty rule
-    if old_rule is Location.item_rule:
+    if old_rule is Location.default_item_rule:
         location.item_rule = lambda i: i.name != item or i.player != player
     else:
         location.item_rule = lambda i: (i.name != item or i.player != player) and old_rule(i)
@@ -135,7 +391,7 @@ def forbid_items(location: "BaseClasses.Location", items: typing.Set[str]):
 def add_item_rule(location: "BaseClasses.Location", rule: ItemRule, combine: str = "and"):
     old_rule = location.item_rule
     # empty rule, replace instead of add
-    if old_rule is Location.item_rule:
+    if old_rule is Location.default_item_rule:
         location.item_rule = rule if combine == "and" else old_rule
     else:
         if combine == "and":
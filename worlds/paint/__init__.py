@@ -35,6 +35,7 @@ class PaintWorld(World):
     location_name_to_id = location_table
     item_name_to_id = item_table
     origin_region_name = "Canvas"
+    seed_independent_steps = ("generate_early", "create_regions")
 
     def generate_early(self) -> None:
         if self.options.canvas_size_increment < 50 and self.options.logic_percent <= 55:
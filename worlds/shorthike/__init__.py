@@ -39,6 +39,7 @@ class ShortHikeWorld(World):
     options: ShortHikeOptions
 
     required_client_version = (0, 4, 4)
+    seed_independent_steps = ("generate_early", "create_regions", "create_items", "set_rules")
 
     def get_filler_item_name(self) -> str:
         return self.options.filler_coin_amount.current_option_name